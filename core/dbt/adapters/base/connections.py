@@ -1,10 +1,12 @@
 import abc
 import os
+import time
+from dataclasses import dataclass
 # multiprocessing.RLock is a function returning this type
 from multiprocessing.synchronize import RLock
 from threading import get_ident
 from typing import (
-    Dict, Tuple, Hashable, Optional, ContextManager, List
+    Callable, Dict, Tuple, Hashable, Optional, ContextManager, List
 )
 
 import agate
@@ -21,6 +23,133 @@ from dbt.adapters.base.query_headers import (
 from dbt.logger import GLOBAL_LOGGER as logger
 
 
+@dataclass
+class ConnectionPoolStats:
+    # checkouts that got an open connection from the pool
+    hits: int = 0
+    # checkouts that found nothing usable, so a new connection gets opened
+    misses: int = 0
+    # connections closed because they sat in the pool for too long
+    expired: int = 0
+    # connections closed because they failed their health check
+    unhealthy: int = 0
+    # connections closed because the pool was full
+    overflowed: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f'{self.hits} hits, {self.misses} misses, {self.expired} '
+            f'expired, {self.unhealthy} unhealthy, {self.overflowed} '
+            f'overflowed'
+        )
+
+
+class ConnectionPool:
+    """Open connections that no thread is using right now.
+
+    Opening a connection can take seconds on some warehouses, so instead of
+    closing a thread's connection once a task is done, the connection manager
+    returns it here, and the next thread that needs a connection takes it
+    back out. The pool keeps at most `max_size` connections, and closes the
+    ones that were not used for `idle_timeout` seconds (if it is set).
+
+    The pool does no locking of its own: the connection manager holds its
+    lock around every call.
+    """
+    def __init__(
+        self,
+        max_size: int,
+        idle_timeout: Optional[float],
+        is_healthy: Callable[[Connection], bool],
+        close: Callable[[Connection], Connection],
+    ) -> None:
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.is_healthy = is_healthy
+        self.close = close
+        self.stats = ConnectionPoolStats()
+        # (connection, the time it was returned), the most recent one last
+        self._idle: List[Tuple[Connection, float]] = []
+        self._pid = os.getpid()
+        # connections a forked process inherited from its parent. Closing
+        # them, or even letting them be garbage collected, would close the
+        # parent's connection too, so they are kept around unused.
+        self._inherited: List[Connection] = []
+
+    def __len__(self) -> int:
+        self._check_pid()
+        return len(self._idle)
+
+    def _check_pid(self) -> None:
+        pid = os.getpid()
+        if pid != self._pid:
+            self._inherited.extend(conn for conn, _ in self._idle)
+            self._idle.clear()
+            self._pid = pid
+
+    def _discard(self, connection: Connection) -> None:
+        try:
+            self.close(connection)
+        except Exception:
+            logger.debug(
+                'Failed to close pooled connection {}'.format(connection.name),
+                exc_info=True
+            )
+
+    def _expire(self) -> None:
+        if self.idle_timeout is None:
+            return
+        cutoff = time.monotonic() - self.idle_timeout
+        keep = []
+        for conn, returned_at in self._idle:
+            if returned_at < cutoff:
+                self.stats.expired += 1
+                self._discard(conn)
+            else:
+                keep.append((conn, returned_at))
+        self._idle = keep
+
+    def checkout(self) -> Optional[Connection]:
+        """Return an open connection, or None if there is no usable one."""
+        self._check_pid()
+        self._expire()
+        while self._idle:
+            conn, _ = self._idle.pop()
+            try:
+                healthy = self.is_healthy(conn)
+            except Exception:
+                healthy = False
+            if healthy:
+                self.stats.hits += 1
+                return conn
+            self.stats.unhealthy += 1
+            self._discard(conn)
+        self.stats.misses += 1
+        return None
+
+    def checkin(self, connection: Connection) -> bool:
+        """Keep an open connection for later. Returns False if the pool did
+        not take it, and the caller should close it.
+        """
+        if connection.state != ConnectionState.OPEN:
+            return False
+        if connection.transaction_open:
+            return False
+        self._check_pid()
+        self._expire()
+        if len(self._idle) >= self.max_size:
+            self.stats.overflowed += 1
+            return False
+        self._idle.append((connection, time.monotonic()))
+        return True
+
+    def close_all(self) -> None:
+        self._check_pid()
+        for conn, _ in self._idle:
+            self._discard(conn)
+        self._idle.clear()
+
+
 class BaseConnectionManager(metaclass=abc.ABCMeta):
     """Methods to implement:
         - exception_handler
@@ -41,6 +170,14 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
         self.thread_connections: Dict[Hashable, Connection] = {}
         self.lock: RLock = dbt.flags.MP_CONTEXT.RLock()
         self.query_header: Optional[MacroQueryStringSetter] = None
+        self.pool: Optional[ConnectionPool] = None
+        if dbt.flags.CONNECTION_POOL_SIZE:
+            self.pool = ConnectionPool(
+                max_size=dbt.flags.CONNECTION_POOL_SIZE,
+                idle_timeout=dbt.flags.CONNECTION_IDLE_TIMEOUT,
+                is_healthy=self.is_healthy,
+                close=self.close,
+            )
 
     def set_query_header(self, manifest: Manifest) -> None:
         self.query_header = MacroQueryStringSetter(self.profile, manifest)
@@ -116,6 +253,12 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
             conn_name = name
 
         conn = self.get_if_exists()
+        if conn is None and self.pool is not None:
+            with self.lock:
+                conn = self.pool.checkout()
+            if conn is not None:
+                self.set_thread_connection(conn)
+
         if conn is None:
             conn = Connection(
                 type=Identifier(self.TYPE),
@@ -169,6 +312,13 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
             '`open` is not implemented for this adapter!'
         )
 
+    @classmethod
+    def is_healthy(cls, connection: Connection) -> bool:
+        """Return whether an open connection that sat in the pool can still be
+        used. (passable)
+        """
+        return connection.state == ConnectionState.OPEN
+
     def release(self) -> None:
         with self.lock:
             conn = self.get_if_exists()
@@ -186,9 +336,26 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
             self.clear_thread_connection()
             raise
 
+    def _return_to_pool(self, connection: Connection) -> bool:
+        if self.pool is None or connection.state != ConnectionState.OPEN:
+            return False
+        try:
+            if connection.transaction_open:
+                self._rollback(connection)
+        except Exception:
+            return False
+        return self.pool.checkin(connection)
+
     def cleanup_all(self) -> None:
+        """Give up the connections of all threads. Open connections go back
+        to the pool if there is one, the others are closed.
+        """
         with self.lock:
             for connection in self.thread_connections.values():
+                if self._return_to_pool(connection):
+                    logger.debug("Connection '{}' was returned to the pool."
+                                 .format(connection.name))
+                    continue
                 if connection.state not in {'closed', 'init'}:
                     logger.debug("Connection '{}' was left open."
                                  .format(connection.name))
@@ -199,6 +366,15 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
 
             # garbage collect these connections
             self.thread_connections.clear()
+            if self.pool is not None:
+                logger.debug('Connection pool: {} idle, {}'
+                             .format(len(self.pool), self.pool.stats))
+
+    def close_pool(self) -> None:
+        """Close the connections in the pool."""
+        if self.pool is not None:
+            with self.lock:
+                self.pool.close_all()
 
     @abc.abstractmethod
     def begin(self) -> None:
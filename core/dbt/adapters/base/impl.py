@@ -1,4 +1,7 @@
 import abc
+import hashlib
+import os
+import time
 from concurrent.futures import as_completed, Future
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -22,6 +25,7 @@ import dbt.flags
 from dbt import deprecations
 from dbt.clients.agate_helper import empty_table, merge_tables, table_from_rows
 from dbt.clients.jinja import MacroGenerator
+from dbt.clients.system import make_directory
 from dbt.contracts.graph.compiled import CompileResultNode, CompiledSeedNode
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.parsed import ParsedSeedNode
@@ -30,6 +34,7 @@ from dbt.exceptions import warn_or_error
 from dbt.node_types import NodeType
 from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.utils import filter_null_values, executor
+from dbt.version import __version__ as dbt_version
 
 from dbt.adapters.base.connections import BaseConnectionManager, Connection
 from dbt.adapters.base.meta import AdapterMeta, available
@@ -37,7 +42,9 @@ from dbt.adapters.base.relation import (
     ComponentName, BaseRelation, InformationSchema, SchemaSearchMap
 )
 from dbt.adapters.base import Column as BaseColumn
-from dbt.adapters.cache import RelationsCache
+from dbt.adapters.cache import (
+    RelationsCache, RelationsCacheSnapshot, SchemaKey
+)
 
 
 SeedModel = Union[ParsedSeedNode, CompiledSeedNode]
@@ -45,6 +52,7 @@ SeedModel = Union[ParsedSeedNode, CompiledSeedNode]
 
 GET_CATALOG_MACRO_NAME = 'get_catalog'
 FRESHNESS_MACRO_NAME = 'collect_freshness'
+RELATIONS_CACHE_SNAPSHOT_FILE_NAME = 'relations_cache.pickle'
 
 
 def _expect_row_value(key: str, row: agate.Row):
@@ -311,14 +319,16 @@ class BaseAdapter(metaclass=AdapterMeta):
         with self.connection_named(f'list_{db.database}_{schema}'):
             return self.list_relations_without_caching(db, schema)
 
-    def _relations_cache_for_schemas(self, manifest: Manifest) -> None:
-        """Populate the relations cache for the given schemas. Returns an
-        iterable of the schemas populated, as strings.
-        """
-        if not dbt.flags.USE_CACHE:
-            return
+    def _list_relations_for_cache(
+        self, schema_map: SchemaSearchMap
+    ) -> Iterator[BaseRelation]:
+        """List the relations in all the schemas of the schema map, so they
+        can be added to the relations cache.
 
-        schema_map = self._get_cache_schemas(manifest, exec_only=True)
+        By default, each schema is listed with its own call to
+        `list_relations_without_caching`, on its own connection. Adapters
+        that can list many schemas at once should override this.
+        """
         with executor(self.config) as tpe:
             futures: List[Future[List[BaseRelation]]] = [
                 tpe.submit(self._list_relations_get_connection, db, schema)
@@ -327,8 +337,18 @@ class BaseAdapter(metaclass=AdapterMeta):
             for future in as_completed(futures):
                 # if we can't read the relations we need to just raise anyway,
                 # so just call future.result() and let that raise on failure
-                for relation in future.result():
-                    self.cache.add(relation)
+                yield from future.result()
+
+    def _relations_cache_for_schemas(self, manifest: Manifest) -> None:
+        """Populate the relations cache for the given schemas. Returns an
+        iterable of the schemas populated, as strings.
+        """
+        if not dbt.flags.USE_CACHE:
+            return
+
+        schema_map = self._get_cache_schemas(manifest, exec_only=True)
+        for relation in self._list_relations_for_cache(schema_map):
+            self.cache.add(relation)
 
         # it's possible that there were no relations in some schemas. We want
         # to insert the schemas we query into the cache's `.schemas` attribute
@@ -347,7 +367,118 @@ class BaseAdapter(metaclass=AdapterMeta):
         with self.cache.lock:
             if clear:
                 self.cache.clear()
-            self._relations_cache_for_schemas(manifest)
+            if not self._load_relations_cache_snapshot(manifest):
+                self._relations_cache_for_schemas(manifest)
+
+    def _relations_cache_fingerprint(
+        self, schema_map: SchemaSearchMap
+    ) -> Optional[Dict[SchemaKey, Any]]:
+        """Return a cheap summary of the state of each schema in the schema
+        map, keyed by (lowercased database, lowercased schema). Schemas that
+        don't exist may be left out. A summary must change
+        whenever a relation in the schema is created, dropped, or renamed.
+
+        A relations cache snapshot is only used while the summaries of the
+        schemas it stores are unchanged. Adapters that can't summarize their
+        schemas return None, and snapshots are used until they expire.
+        """
+        return None
+
+    def _relations_cache_snapshot_path(self) -> str:
+        return os.path.join(
+            self.config.target_path, RELATIONS_CACHE_SNAPSHOT_FILE_NAME
+        )
+
+    def _relations_cache_target_key(self) -> str:
+        target = repr((
+            self.type(), list(self.config.credentials.connection_info())
+        ))
+        return hashlib.md5(target.encode('utf-8')).hexdigest()
+
+    def _load_relations_cache_snapshot(self, manifest: Manifest) -> bool:
+        """If --relation-cache-ttl is set, fill the relations cache from the
+        snapshot in the target directory, if there is a current one. Return
+        whether the cache was filled.
+
+        The snapshot is removed either way: this invocation might change the
+        relations, so only its own snapshot is good for the next one.
+        """
+        ttl = dbt.flags.RELATION_CACHE_TTL
+        if not ttl:
+            return False
+        path = self._relations_cache_snapshot_path()
+        snapshot = RelationsCacheSnapshot.read(path)
+        if snapshot is None:
+            return False
+        os.remove(path)
+
+        schema_map = self._get_cache_schemas(manifest, exec_only=True)
+        needed: Set[SchemaKey] = {
+            (database.lower(), schema)
+            for database, schema in schema_map.schemas_searched()
+        }
+        age = time.time() - snapshot.created_at
+        if snapshot.dbt_version != dbt_version:
+            reason = 'it was written by dbt {}'.format(snapshot.dbt_version)
+        elif snapshot.target_key != self._relations_cache_target_key():
+            reason = 'it is for a different target'
+        elif age > ttl:
+            reason = 'it is {:.0f} seconds old'.format(age)
+        elif not needed.issubset(snapshot.schemas):
+            reason = 'it does not have all the schemas this run needs'
+        elif not self._snapshot_fingerprint_matches(
+            snapshot, schema_map, needed
+        ):
+            reason = 'the schemas changed since it was written'
+        else:
+            logger.debug(
+                'Using the relations cache snapshot from {:.0f} seconds ago'
+                .format(age)
+            )
+            self.cache.restore(snapshot.schemas, snapshot.relations)
+            return True
+
+        logger.debug(
+            'Not using the relations cache snapshot, because {}'
+            .format(reason)
+        )
+        return False
+
+    def _snapshot_fingerprint_matches(
+        self,
+        snapshot: RelationsCacheSnapshot,
+        schema_map: SchemaSearchMap,
+        schemas: Set[SchemaKey],
+    ) -> bool:
+        fingerprint = self._relations_cache_fingerprint(schema_map)
+        if fingerprint is None or snapshot.fingerprint is None:
+            return fingerprint is None and snapshot.fingerprint is None
+        return all(
+            fingerprint.get(key) == snapshot.fingerprint.get(key)
+            for key in schemas
+        )
+
+    def write_relations_cache_snapshot(self, manifest: Manifest) -> None:
+        """If --relation-cache-ttl is set, write the relations cache to the
+        target directory, so later invocations can reuse it.
+        """
+        if not dbt.flags.USE_CACHE or not dbt.flags.RELATION_CACHE_TTL:
+            return
+        schema_map = self._get_cache_schemas(manifest, exec_only=True)
+        schemas: Set[SchemaKey] = {
+            (database.lower(), schema)
+            for database, schema in schema_map.schemas_searched()
+        }
+        snapshot = RelationsCacheSnapshot(
+            dbt_version=dbt_version,
+            target_key=self._relations_cache_target_key(),
+            created_at=time.time(),
+            fingerprint=self._relations_cache_fingerprint(schema_map),
+            schemas=schemas,
+            relations=self.cache.snapshot(schemas),
+        )
+        make_directory(self.config.target_path)
+        snapshot.write(self._relations_cache_snapshot_path())
 
     @available
     def cache_added(self, relation: Optional[BaseRelation]) -> str:
@@ -1,12 +1,18 @@
 from collections import namedtuple
 from copy import deepcopy
+from dataclasses import dataclass
 from typing import List, Iterable, Optional, Dict, Set, Tuple, Any
+import os
+import pickle
+import tempfile
 import threading
 
 from dbt.logger import CACHE_LOGGER as logger
 import dbt.exceptions
 
 _ReferenceKey = namedtuple('_ReferenceKey', 'database schema identifier')
+# a (database, schema) pair, lowercased
+SchemaKey = Tuple[Optional[str], Optional[str]]
 
 
 def _lower(value: Optional[str]) -> Optional[str]:
@@ -499,6 +505,30 @@ class RelationsCache:
             )
         return results
 
+    def snapshot(self, schemas: Set[SchemaKey]) -> List[Any]:
+        """Return the relations in the given (lowercased) schemas.
+
+        The links between relations are left out: the adapter's fingerprint
+        only covers the relations themselves, so adapters that link relations
+        have to do it again after a restore.
+        """
+        with self.lock:
+            return [
+                relation.inner
+                for key, relation in self.relations.items()
+                if (key.database, key.schema) in schemas
+            ]
+
+    def restore(
+        self, schemas: Iterable[SchemaKey], relations: List[Any]
+    ) -> None:
+        """Add the schemas and relations from a snapshot to the cache."""
+        with self.lock:
+            for database, schema in schemas:
+                self.add_schema(database, schema)
+            for inner in relations:
+                self._setdefault(_CachedRelation(inner))
+
     def clear(self):
         """Clear the cache"""
         with self.lock:
@@ -526,3 +556,58 @@ class RelationsCache:
             drop_key = _make_key(relation)
             if drop_key in self.relations:
                 self.drop(drop_key)
+
+
+@dataclass
+class RelationsCacheSnapshot:
+    """The relations cache of an earlier invocation, stored in the target
+    directory so a later invocation can use it instead of listing every
+    schema again.
+
+    :attr str dbt_version: The version of dbt that wrote the snapshot.
+    :attr str target_key: Identifies the adapter type and connection the
+        relations were listed from.
+    :attr float created_at: When the relations were listed, in seconds since
+        the epoch.
+    :attr fingerprint: The adapter's summary of each schema's state when the
+        snapshot was written, or None if the adapter can't summarize them.
+    :attr schemas: The (lowercased) schemas whose relations are all stored.
+    :attr relations: The stored relations, without the links between them.
+    """
+    dbt_version: str
+    target_key: str
+    created_at: float
+    fingerprint: Optional[Dict[SchemaKey, Any]]
+    schemas: Set[SchemaKey]
+    relations: List[Any]
+
+    @classmethod
+    def read(cls, path: str) -> Optional['RelationsCacheSnapshot']:
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as fp:
+                snapshot = pickle.load(fp)
+        except Exception as exc:
+            # the file might be from a different version of dbt, or corrupt
+            logger.debug(
+                'Failed to load relations cache snapshot from {}: {}'
+                .format(path, exc)
+            )
+            return None
+        if not isinstance(snapshot, cls):
+            return None
+        return snapshot
+
+    def write(self, path: str) -> None:
+        # write to a temporary file and move it into place, so an interrupted
+        # write never leaves a truncated snapshot behind
+        directory = os.path.dirname(path)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                pickle.dump(self, fp, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
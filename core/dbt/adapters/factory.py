@@ -104,6 +104,7 @@ class AdpaterContainer:
         with self.lock:
             for adapter in self.adapters.values():
                 adapter.cleanup_connections()
+                adapter.connections.close_pool()
             self.adapters.clear()
 
     def cleanup_connections(self):
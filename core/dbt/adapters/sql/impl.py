@@ -1,17 +1,27 @@
 import agate
-from typing import Any, Optional, Tuple, Type, List
+from concurrent.futures import as_completed, Future
+from typing import (
+    Any, Dict, Iterable, Iterator, Optional, Tuple, Type, List
+)
 
 import dbt.clients.agate_helper
 from dbt.contracts.connection import Connection
 import dbt.exceptions
 import dbt.flags
 from dbt.adapters.base import BaseAdapter, available
+from dbt.adapters.base.relation import InformationSchema, SchemaSearchMap
+from dbt.adapters.cache import SchemaKey
 from dbt.adapters.sql import SQLConnectionManager
 from dbt.logger import GLOBAL_LOGGER as logger
+from dbt.utils import executor
 
 from dbt.adapters.factory import BaseRelation
 
 LIST_RELATIONS_MACRO_NAME = 'list_relations_without_caching'
+LIST_RELATIONS_IN_SCHEMAS_MACRO_NAME = (
+    'list_relations_in_schemas_without_caching'
+)
+RELATIONS_CACHE_FINGERPRINT_MACRO_NAME = 'relations_cache_fingerprint'
 GET_COLUMNS_IN_RELATION_MACRO_NAME = 'get_columns_in_relation'
 LIST_SCHEMAS_MACRO_NAME = 'list_schemas'
 CHECK_SCHEMA_EXISTS_MACRO_NAME = 'check_schema_exists'
@@ -38,6 +48,13 @@ class SQLAdapter(BaseAdapter):
         - get_catalog
         - list_relations_without_caching
         - get_columns_in_relation
+
+    Adapters that implement the "list_relations_in_schemas_without_caching"
+    macro can populate the relations cache with one query per database by
+    overriding `_list_relations_for_cache` to call
+    `_list_relations_by_database`. Adapters that implement the
+    "relations_cache_fingerprint" macro can check that a relations cache
+    snapshot is still current.
     """
 
     ConnectionManager: Type[SQLConnectionManager]
@@ -203,7 +220,85 @@ class SQLAdapter(BaseAdapter):
             LIST_RELATIONS_MACRO_NAME,
             kwargs=kwargs
         )
+        return self._relations_from_results(results)
 
+    def list_relations_in_schemas_without_caching(
+        self, information_schema, schemas: Iterable[str]
+    ) -> List[BaseRelation]:
+        """List the relations in all the given schemas of the information
+        schema's database with a single query.
+        """
+        kwargs = {
+            'information_schema': information_schema,
+            'schemas': sorted(schemas),
+        }
+        results = self.execute_macro(
+            LIST_RELATIONS_IN_SCHEMAS_MACRO_NAME,
+            kwargs=kwargs
+        )
+        return self._relations_from_results(results)
+
+    def _list_relations_in_database_get_connection(
+        self, information_schema: InformationSchema, schemas: Iterable[str]
+    ) -> List[BaseRelation]:
+        name = f'list_{information_schema.database}'
+        with self.connection_named(name):
+            return self.list_relations_in_schemas_without_caching(
+                information_schema, schemas
+            )
+
+    def _list_relations_by_database(
+        self, schema_map: SchemaSearchMap
+    ) -> Iterator[BaseRelation]:
+        """List the relations in all the schemas of the schema map with one
+        query per database instead of one per schema.
+        """
+        schemas_by_database = {
+            information_schema: [s for s in schemas if s is not None]
+            for information_schema, schemas in schema_map.items()
+        }
+        with executor(self.config) as tpe:
+            futures: List[Future[List[BaseRelation]]] = [
+                tpe.submit(
+                    self._list_relations_in_database_get_connection,
+                    information_schema,
+                    schemas,
+                )
+                for information_schema, schemas in schemas_by_database.items()
+                if schemas
+            ]
+            for future in as_completed(futures):
+                yield from future.result()
+
+    def _relations_cache_fingerprint(
+        self, schema_map: SchemaSearchMap
+    ) -> Optional[Dict[SchemaKey, Any]]:
+        fingerprint: Dict[SchemaKey, Any] = {}
+        for information_schema, schemas in schema_map.items():
+            schema_names = sorted(s for s in schemas if s is not None)
+            if not schema_names:
+                continue
+            results = self.execute_macro(
+                RELATIONS_CACHE_FINGERPRINT_MACRO_NAME,
+                kwargs={
+                    'information_schema': information_schema,
+                    'schemas': schema_names,
+                }
+            )
+            if results is None:
+                # the adapter does not implement the macro
+                return None
+            database = information_schema.database
+            if database is not None:
+                database = database.lower()
+            for schema, *summary in results:
+                key = (database, schema.lower())
+                fingerprint[key] = tuple(str(value) for value in summary)
+        return fingerprint
+
+    def _relations_from_results(
+        self, results: agate.Table
+    ) -> List[BaseRelation]:
         relations = []
         quote_policy = {
             'database': True,
@@ -8,15 +8,17 @@ from ast import literal_eval
 from contextlib import contextmanager
 from itertools import chain, islice
 from typing import (
-    List, Union, Set, Optional, Dict, Any, Iterator, Type, NoReturn
+    List, Union, Set, Optional, Dict, Any, Iterator, Type, NoReturn, Tuple
 )
 
 import jinja2
+import jinja2.bccache
 import jinja2.ext
 import jinja2.nativetypes  # type: ignore
 import jinja2.nodes
 import jinja2.parser
 import jinja2.sandbox
+import jinja2.utils
 
 from dbt.utils import (
     get_dbt_macro_name, get_docs_macro_name, get_materialization_macro_name,
@@ -167,6 +169,7 @@ class TemplateCache:
             string=node.macro_sql,
             ctx={},
             node=node,
+            cache_bytecode=True,
         )
 
         self.file_cache[key] = template
@@ -407,7 +410,7 @@ def create_undefined(node=None):
     return Undefined
 
 
-def get_environment(
+def _create_environment(
     node=None,
     capture_macros: bool = False,
     native: bool = False,
@@ -431,6 +434,149 @@ def get_environment(
     return env_cls(**args)
 
 
+class EnvironmentPool:
+    """A pool of shared jinja environments, one per (capture_macros, native)
+    pair. Environments are never modified after creation, so they are safe
+    to share between threads.
+
+    The undefined type of macro-capturing environments refers to the node
+    being rendered, so for those a cheap overlay of the shared environment
+    is returned with a node-specific undefined type.
+    """
+    def __init__(self) -> None:
+        self.environments: Dict[Tuple[bool, bool], jinja2.Environment] = {}
+        self.lock = threading.Lock()
+
+    def get(
+        self, node=None, capture_macros: bool = False, native: bool = False
+    ) -> jinja2.Environment:
+        key = (capture_macros, native)
+        if key not in self.environments:
+            with self.lock:
+                if key not in self.environments:
+                    self.environments[key] = _create_environment(
+                        capture_macros=capture_macros, native=native
+                    )
+        env = self.environments[key]
+        if capture_macros and node is not None:
+            env = env.overlay(undefined=create_undefined(node))
+        return env
+
+    def clear(self):
+        with self.lock:
+            self.environments.clear()
+
+
+environment_pool = EnvironmentPool()
+
+
+def get_environment(
+    node=None,
+    capture_macros: bool = False,
+    native: bool = False,
+) -> jinja2.Environment:
+    return environment_pool.get(node, capture_macros, native)
+
+
+# The maximum number of compiled templates to keep in the code cache
+TEMPLATE_CODE_CACHE_SIZE = 2000
+
+
+class MacroBytecodeCache(jinja2.FileSystemBytecodeCache):
+    """A persistent, on-disk cache of compiled template code. Entries are
+    keyed by the template source along with the dbt and jinja versions, so
+    a change to any of them never loads stale code.
+    """
+    def __init__(self, directory: str, dbt_version: str) -> None:
+        super().__init__(directory, pattern='%s.cache')
+        self.dbt_version = dbt_version
+
+    def get_bucket(self, environment, name, filename, source):
+        # many templates share a name, so the source goes into the key too
+        checksum = self.get_source_checksum(source)
+        key = self.get_cache_key(
+            '\x00'.join([
+                name, checksum, self.dbt_version, jinja2.__version__
+            ]),
+            filename,
+        )
+        bucket = jinja2.bccache.Bucket(environment, key, checksum)
+        self.load_bytecode(bucket)
+        return bucket
+
+    def dump_bytecode(self, bucket):
+        # write to a temporary file and move it into place, so concurrent dbt
+        # invocations never read a partially written file.
+        path = self._get_cache_filename(bucket)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(fd, 'wb') as fp:
+                bucket.write_bytecode(fp)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.debug(
+                'Failed to write template bytecode to {}: {}'
+                .format(path, exc)
+            )
+
+
+class TemplateCodeCache:
+    """A bounded LRU cache of compiled template code, keyed by the template
+    source. The same strings are rendered over and over (descriptions, yaml
+    values, hooks), and compiling them (lexing, parsing, code generation and
+    python compilation) dominates the cost of rendering.
+
+    Compiled code does not depend on the undefined type or globals of the
+    environment that compiled it, only on its code generator, so entries are
+    also keyed on whether the environment is native.
+    """
+    def __init__(self, capacity: int = TEMPLATE_CODE_CACHE_SIZE) -> None:
+        self.cache = jinja2.utils.LRUCache(capacity)
+        # if set, templates compiled with cache_bytecode are also persisted
+        # here, for use by later dbt invocations.
+        self.bytecode_cache: Optional[jinja2.BytecodeCache] = None
+
+    def _compile(
+        self,
+        env: jinja2.Environment,
+        source: str,
+        native: bool,
+        cache_bytecode: bool,
+    ):
+        if not cache_bytecode or self.bytecode_cache is None:
+            return env.compile(source)
+
+        name = 'native' if native else 'default'
+        bucket = self.bytecode_cache.get_bucket(env, name, None, source)
+        if bucket.code is None:
+            bucket.code = env.compile(source)
+            self.bytecode_cache.set_bucket(bucket)
+        return bucket.code
+
+    def get_template(
+        self,
+        env: jinja2.Environment,
+        source: str,
+        native: bool,
+        ctx: Dict[str, Any],
+        cache_bytecode: bool = False,
+    ) -> jinja2.Template:
+        key = (native, source)
+        code = self.cache.get(key)
+        if code is None:
+            code = self._compile(env, source, native, cache_bytecode)
+            self.cache[key] = code
+        # the jinja2 stubs don't know about template_class
+        template_class = env.template_class  # type: ignore
+        return template_class.from_code(env, code, env.make_globals(ctx))
+
+    def clear(self):
+        self.cache.clear()
+
+
+template_code_cache = TemplateCodeCache()
+
+
 @contextmanager
 def catch_jinja(node=None) -> Iterator[None]:
     try:
@@ -456,12 +602,15 @@ def get_template(
     node=None,
     capture_macros: bool = False,
     native: bool = False,
+    cache_bytecode: bool = False,
 ):
     with catch_jinja(node):
         env = get_environment(node, capture_macros, native=native)
 
         template_source = str(string)
-        return env.from_string(template_source, globals=ctx)
+        return template_code_cache.get_template(
+            env, template_source, native, ctx, cache_bytecode=cache_bytecode
+        )
 
 
 def render_template(template, ctx: Dict[str, Any], node=None) -> str:
@@ -481,6 +630,49 @@ def _requote_result(raw_value: str, rendered: str) -> str:
     return f'{quote_char}{rendered}{quote_char}'
 
 
+class RenderCounter:
+    """Count how many strings get_rendered handled with and without jinja.
+    """
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.static = 0
+        self.templated = 0
+
+    def add(self, static: bool) -> None:
+        with self.lock:
+            if static:
+                self.static += 1
+            else:
+                self.templated += 1
+
+    @property
+    def total(self) -> int:
+        return self.static + self.templated
+
+    def reset(self) -> None:
+        with self.lock:
+            self.static = 0
+            self.templated = 0
+
+
+render_counter = RenderCounter()
+
+
+def _has_jinja(value: str) -> bool:
+    return '{{' in value or '{%' in value or '{#' in value
+
+
+def _render_static(value: str, native: bool) -> Any:
+    """Return what rendering the given jinja-free string would. Jinja
+    normalizes newlines and drops a single trailing newline when lexing.
+    """
+    value = '\n'.join(value.splitlines())
+    if native:
+        # this is how a native template treats its single data node
+        return quoted_native_concat(iter([value] if value else []))
+    return value
+
+
 def get_rendered(
     string: str,
     ctx: Dict[str, Any],
@@ -488,6 +680,14 @@ def get_rendered(
     capture_macros: bool = False,
     native: bool = False,
 ) -> str:
+    # many strings (descriptions, yaml values) have no jinja in them, so
+    # skip making and rendering a template for those.
+    template_source = str(string)
+    if not _has_jinja(template_source):
+        render_counter.add(static=True)
+        return _render_static(template_source, native)
+
+    render_counter.add(static=False)
     template = get_template(
         string,
         ctx,
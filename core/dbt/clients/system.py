@@ -11,7 +11,8 @@ import tarfile
 import requests
 import stat
 from typing import (
-    Type, NoReturn, List, Optional, Dict, Any, Tuple, Callable, Union
+    Type, NoReturn, List, Optional, Dict, Any, Tuple, Callable, Union,
+    Iterable,
 )
 
 import dbt.exceptions
@@ -128,6 +129,18 @@ def write_file(path: str, contents: str = '') -> bool:
     return True
 
 
+def write_chunks(path: str, chunks: Iterable[str]) -> bool:
+    """Write the given strings to the file in order, without joining them
+    in memory first.
+    """
+    make_directory(os.path.dirname(path))
+    with open(path, 'w', encoding='utf-8') as f:
+        for chunk in chunks:
+            f.write(chunk)
+
+    return True
+
+
 def write_json(path: str, data: Dict[str, Any]) -> bool:
     return write_file(path, json.dumps(data, cls=dbt.utils.JSONEncoder))
 
@@ -1,6 +1,6 @@
 import os
 from collections import defaultdict
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable
 
 import dbt.utils
 import dbt.include
@@ -22,6 +22,7 @@ from dbt.contracts.graph.compiled import (
     CompiledSchemaTestNode,
 )
 from dbt.contracts.graph.parsed import ParsedNode
+from dbt.contracts.util import should_validate
 
 from dbt.logger import GLOBAL_LOGGER as logger
 
@@ -167,7 +168,9 @@ class Compiler:
             'extra_ctes': [],
             'injected_sql': None,
         })
-        compiled_node = _compiled_type_for(node).from_dict(data)
+        compiled_node = _compiled_type_for(node).from_dict(
+            data, validate=should_validate(revalidating=True)
+        )
 
         context = self._create_node_context(
             compiled_node, manifest, extra_context
@@ -240,6 +243,36 @@ def compile_manifest(config, manifest, write=True) -> Linker:
     return compiler.compile(manifest, write=write)
 
 
+def link_manifest(config, manifest) -> Linker:
+    """Link the manifest's nodes into a graph, without writing the graph or
+    printing stats.
+    """
+    linker = Linker()
+    Compiler(config).link_graph(linker, manifest)
+    return linker
+
+
+def relink_nodes(
+    config, linker: Linker, manifest: Manifest, unique_ids: Iterable[str]
+) -> Linker:
+    """Return a copy of the linker with the dependencies of the given nodes
+    linked again from the manifest.
+    """
+    linker = linker.copy()
+    compiler = Compiler(config)
+    for unique_id in unique_ids:
+        linker.remove_dependencies(unique_id)
+        compiler.link_node(linker, manifest.nodes[unique_id], manifest)
+
+    # the graph had no cycles before, so any new cycle goes through one of
+    # the new dependencies
+    for unique_id in unique_ids:
+        cycle = linker.find_cycle_through(unique_id)
+        if cycle:
+            raise RuntimeError("Found a cycle: {}".format(cycle))
+    return linker
+
+
 def _is_writable(node):
     if not node.injected_sql:
         return False
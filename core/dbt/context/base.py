@@ -1,13 +1,17 @@
+import collections.abc
 import json
 import os
+import threading
+from contextlib import contextmanager
 from typing import (
-    Any, Dict, NoReturn, Optional, Mapping
+    Any, Dict, NoReturn, Optional, Mapping, Iterator
 )
 
 from dbt import flags
 from dbt import tracking
 from dbt.clients.jinja import undefined_error, get_rendered
 from dbt.contracts.graph.compiled import CompiledResource
+from dbt.contracts.graph.manifest import SourceFile
 from dbt.exceptions import raise_compiler_error, MacroReturn
 from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.version import __version__ as dbt_version
@@ -41,6 +45,24 @@ def get_datetime_module_context() -> Dict[str, Any]:
     }
 
 
+def _mapping_to_dict(value: Any) -> Dict[Any, Any]:
+    # some context members, like `graph`, hold mappings that aren't dicts
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(
+        f'Object of type {type(value).__name__} is not JSON serializable'
+    )
+
+
+class _MappingSafeDumper(yaml.SafeDumper):
+    pass
+
+
+_MappingSafeDumper.add_multi_representer(
+    collections.abc.Mapping, yaml.SafeDumper.represent_dict
+)
+
+
 def get_context_modules() -> Dict[str, Dict[str, Any]]:
     return {
         'pytz': get_pytz_module_context(),
@@ -48,6 +70,39 @@ def get_context_modules() -> Dict[str, Dict[str, Any]]:
     }
 
 
+class ParseDependencies(threading.local):
+    """Record the vars and environment variables that are read while a file
+    is parsed onto that file, so partial parsing can tell which files to parse
+    again when they change.
+    """
+    def __init__(self) -> None:
+        self.source_file: Optional[SourceFile] = None
+
+    @contextmanager
+    def recording(self, source_file: SourceFile) -> Iterator[None]:
+        previous = self.source_file
+        self.source_file = source_file
+        try:
+            yield
+        finally:
+            self.source_file = previous
+
+    def add_var(self, name: str) -> None:
+        if self.source_file is None:
+            return
+        if name not in self.source_file.vars:
+            self.source_file.vars.append(name)
+
+    def add_env_var(self, name: str) -> None:
+        if self.source_file is None:
+            return
+        if name not in self.source_file.env_vars:
+            self.source_file.env_vars.append(name)
+
+
+parse_dependencies = ParseDependencies()
+
+
 class ContextMember:
     def __init__(self, value, name=None):
         self.name = name
@@ -139,6 +194,7 @@ class Var:
         return get_rendered(raw, self.context)
 
     def __call__(self, var_name, default=_VAR_NOTSET):
+        parse_dependencies.add_var(var_name)
         if self.has_var(var_name):
             return self.get_rendered_var(var_name)
         elif default is not self._VAR_NOTSET:
@@ -265,6 +321,7 @@ class BaseContext(metaclass=ContextMeta):
 
         If the default is None, raise an exception for an undefined variable.
         """
+        parse_dependencies.add_env_var(var)
         if var in os.environ:
             return os.environ[var]
         elif default is not None:
@@ -354,7 +411,9 @@ class BaseContext(metaclass=ContextMeta):
             {% do log(my_json_string) %}
         """
         try:
-            return json.dumps(value, sort_keys=sort_keys)
+            return json.dumps(
+                value, sort_keys=sort_keys, default=_mapping_to_dict
+            )
         except ValueError:
             return default
 
@@ -410,7 +469,9 @@ class BaseContext(metaclass=ContextMeta):
             {% do log(my_yaml_string) %}
         """
         try:
-            return yaml.safe_dump(data=value, sort_keys=sort_keys)
+            return yaml.dump(
+                data=value, Dumper=_MappingSafeDumper, sort_keys=sort_keys
+            )
         except (ValueError, yaml.YAMLError):
             return default
 
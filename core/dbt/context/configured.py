@@ -1,13 +1,21 @@
-from typing import Any, Dict, Iterable, Union, Optional
+from collections import ChainMap
+from itertools import chain
+from typing import (
+    Any, Dict, Iterable, Iterator, Mapping, MutableMapping, Union, Optional,
+    Tuple
+)
+from weakref import WeakKeyDictionary
 
 from dbt.clients.jinja import MacroGenerator, MacroStack
 from dbt.contracts.connection import AdapterRequiredConfig
-from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.manifest import (
+    Manifest, MacroIndex, MacroIndexOverlay
+)
 from dbt.contracts.graph.parsed import ParsedMacro
 from dbt.include.global_project import PACKAGES
 from dbt.include.global_project import PROJECT_NAME as GLOBAL_PROJECT_NAME
 
-from dbt.context.base import contextproperty, Var
+from dbt.context.base import contextproperty, Var, parse_dependencies
 from dbt.context.target import TargetContext
 from dbt.exceptions import raise_duplicate_macro_name
 
@@ -37,6 +45,7 @@ class ConfiguredVar(Var):
         self.project_name = project_name
 
     def __call__(self, var_name, default=Var._VAR_NOTSET):
+        parse_dependencies.add_var(var_name)
         my_config = self.config.load_dependencies()[self.project_name]
 
         # cli vars > active project > local project
@@ -74,32 +83,60 @@ class SchemaYamlContext(ConfiguredContext):
         )
 
 
-FlatNamespace = Dict[str, MacroGenerator]
+FlatNamespace = Mapping[str, MacroGenerator]
 NamespaceMember = Union[FlatNamespace, MacroGenerator]
 FullNamespace = Dict[str, NamespaceMember]
 
 
-class MacroNamespace:
+class MacroNamespaceLayout:
+    """The macros visible from a search package, grouped into the namespaces
+    they are exposed in. Building this requires a pass over every macro in
+    the manifest, so it is built once per (root package, search package) and
+    shared by every context with that search package. A layout for a
+    manifest overlay is layered on the base manifest's layout instead, so
+    only the overlay's own macros are visited.
+    """
     def __init__(
         self,
         root_package: str,
         search_package: str,
-        thread_ctx: MacroStack,
-        node: Optional[Any] = None,
     ) -> None:
         self.root_package = root_package
         self.search_package = search_package
-        self.globals: FlatNamespace = {}
-        self.locals: FlatNamespace = {}
-        self.packages: Dict[str, FlatNamespace] = {}
-        self.thread_ctx = thread_ctx
-        self.node = node
-
-    def add_macro(self, macro: ParsedMacro, ctx: Dict[str, Any]):
+        self.globals: MutableMapping[str, ParsedMacro] = {}
+        self.locals: MutableMapping[str, ParsedMacro] = {}
+        self.packages: MutableMapping[
+            str, MutableMapping[str, ParsedMacro]
+        ] = {}
+
+    @classmethod
+    def layered(
+        cls, base: 'MacroNamespaceLayout', macros: Iterable[ParsedMacro]
+    ) -> 'MacroNamespaceLayout':
+        """Return the base layout's macros along with the given ones, which
+        replace the base's macros with the same unique ID. The base layout is
+        not modified.
+        """
+        layout = cls(base.root_package, base.search_package)
+        layout.globals = ChainMap({}, base.globals)
+        layout.locals = ChainMap({}, base.locals)
+        layout.packages = ChainMap({}, base.packages)
+        layout.add_macros(macros)
+        return layout
+
+    def _package(self, namespace: str) -> MutableMapping[str, ParsedMacro]:
+        if namespace not in self.packages:
+            self.packages[namespace] = {}
+        elif (
+            isinstance(self.packages, ChainMap) and
+            namespace not in self.packages.maps[0]
+        ):
+            # never add to the base layout's package
+            self.packages[namespace] = ChainMap({}, self.packages[namespace])
+        return self.packages[namespace]
+
+    def add_macro(self, macro: ParsedMacro):
         macro_name: str = macro.name
-        macro_func: MacroGenerator = MacroGenerator(
-            macro, ctx, self.node, self.thread_ctx
-        )
 
         # put plugin macros into the root namespace
         if macro.package_name in PACKAGES:
@@ -107,29 +144,126 @@ class MacroNamespace:
         else:
             namespace = macro.package_name
 
-        if namespace not in self.packages:
-            value: Dict[str, MacroGenerator] = {}
-            self.packages[namespace] = value
-
-        if macro_name in self.packages[namespace]:
-            raise_duplicate_macro_name(macro_func.macro, macro, namespace)
-        self.packages[namespace][macro_name] = macro_func
+        package = self._package(namespace)
+        if macro_name in package:
+            existing = package[macro_name]
+            # a layered layout may replace a base macro with the same unique ID
+            replaces_base = (
+                isinstance(package, ChainMap) and
+                macro_name not in package.maps[0] and
+                existing.unique_id == macro.unique_id
+            )
+            if not replaces_base:
+                raise_duplicate_macro_name(existing, macro, namespace)
+        package[macro_name] = macro
 
         if namespace == self.search_package:
-            self.locals[macro_name] = macro_func
+            self.locals[macro_name] = macro
         elif namespace in {self.root_package, GLOBAL_PROJECT_NAME}:
-            self.globals[macro_name] = macro_func
+            self.globals[macro_name] = macro
 
-    def add_macros(self, macros: Iterable[ParsedMacro], ctx: Dict[str, Any]):
+    def add_macros(self, macros: Iterable[ParsedMacro]):
         for macro in macros:
-            self.add_macro(macro, ctx)
+            self.add_macro(macro)
+
+    @classmethod
+    def from_manifest(
+        cls, manifest: Manifest, root_package: str, search_package: str
+    ) -> 'MacroNamespaceLayout':
+        return cls._for_index(
+            manifest.macro_index, root_package, search_package
+        )
 
-    def get_macro_dict(self) -> FullNamespace:
-        root_namespace: FullNamespace = {}
+    @classmethod
+    def _for_index(
+        cls, index: MacroIndex, root_package: str, search_package: str
+    ) -> 'MacroNamespaceLayout':
+        # the cache is kept per macro index, so it is discarded whenever the
+        # manifest's macros change
+        cache = _NAMESPACE_LAYOUTS.setdefault(index, {})
+        key = (root_package, search_package)
+        if key not in cache:
+            if isinstance(index, MacroIndexOverlay):
+                base = cls._for_index(index.base, root_package, search_package)
+                if index.changed:
+                    cache[key] = cls.layered(base, index.changed.values())
+                else:
+                    cache[key] = base
+            else:
+                layout = cls(root_package, search_package)
+                layout.add_macros(index.macros())
+                cache[key] = layout
+        return cache[key]
+
+
+# macro namespace layouts by (root package, search package)
+LayoutCache = Dict[Tuple[str, str], MacroNamespaceLayout]
+
+# the layout caches by macro index. They go away along with their index.
+_NAMESPACE_LAYOUTS: 'WeakKeyDictionary[MacroIndex, LayoutCache]' = (
+    WeakKeyDictionary()
+)
+
+
+class PackageNamespace(Mapping[str, MacroGenerator]):
+    """The macros of a single package, as bound to one context. Generators
+    are only created when a macro is looked up.
+    """
+    def __init__(
+        self,
+        namespace: 'MacroNamespace',
+        macros: Mapping[str, ParsedMacro],
+    ) -> None:
+        self._namespace = namespace
+        self._macros = macros
+
+    def __getitem__(self, key: str) -> MacroGenerator:
+        return self._namespace.get_generator(self._macros[key])
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._macros
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._macros)
 
-        root_namespace.update(self.packages)
-        root_namespace.update(self.globals)
-        root_namespace.update(self.locals)
+    def __len__(self) -> int:
+        return len(self._macros)
+
+
+class MacroNamespace:
+    """A MacroNamespaceLayout bound to a single context. The global and
+    search package macros are placed directly into the context, so they are
+    bound up front; all other package macros are bound on first access.
+    """
+    def __init__(
+        self,
+        layout: MacroNamespaceLayout,
+        ctx: Dict[str, Any],
+        thread_ctx: MacroStack,
+        node: Optional[Any] = None,
+    ) -> None:
+        self.layout = layout
+        self.ctx = ctx
+        self.thread_ctx = thread_ctx
+        self.node = node
+        self._generators: Dict[str, MacroGenerator] = {}
+
+    def get_generator(self, macro: ParsedMacro) -> MacroGenerator:
+        unique_id = macro.unique_id
+        if unique_id not in self._generators:
+            self._generators[unique_id] = MacroGenerator(
+                macro, self.ctx, self.node, self.thread_ctx
+            )
+        return self._generators[unique_id]
+
+    def get_macro_dict(self) -> FullNamespace:
+        root_namespace: FullNamespace = {
+            name: PackageNamespace(self, macros)
+            for name, macros in self.layout.packages.items()
+        }
+        for name, macro in chain(self.layout.globals.items(),
+                                 self.layout.locals.items()):
+            root_namespace[name] = self.get_generator(macro)
 
         return root_namespace
 
@@ -152,17 +286,23 @@ class ManifestContext(ConfiguredContext):
         self.search_package = search_package
         self.macro_stack = MacroStack()
 
-    def _get_namespace(self):
-        return MacroNamespace(
+    def _get_layout(self) -> MacroNamespaceLayout:
+        return MacroNamespaceLayout.from_manifest(
+            self.manifest,
             self.config.project_name,
             self.search_package,
+        )
+
+    def _get_namespace(self):
+        return MacroNamespace(
+            self._get_layout(),
+            self._ctx,
             self.macro_stack,
             None,
         )
 
     def get_macros(self) -> Dict[str, Any]:
         nsp = self._get_namespace()
-        nsp.add_macros(self.manifest.macros.values(), self._ctx)
         return nsp.get_macro_dict()
 
     def to_dict(self) -> Dict[str, Any]:
@@ -1,13 +1,14 @@
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import List, Iterator, Dict, Any, TypeVar, Union
+from typing import (
+    List, Iterator, Dict, Any, TypeVar, Union, Optional, Tuple, Type
+)
 
 from dbt.config import RuntimeConfig, Project
 from dbt.contracts.graph.model_config import BaseConfig, get_config_for
 from dbt.exceptions import InternalException
 from dbt.legacy_config_updater import ConfigUpdater, IsFQNResource
 from dbt.node_types import NodeType
-from dbt.utils import fqn_search
 
 
 @dataclass
@@ -87,9 +88,48 @@ class LegacyContextConfig:
 T = TypeVar('T', bound=BaseConfig)
 
 
+class ConfigTrie:
+    """The configs a project sets for one resource type, as a tree with a
+    level for each part of a node's fqn.
+
+    Each level also remembers the config that results from merging every
+    level from the top down to it, so all the nodes that share an fqn prefix
+    share the work of merging the configs above them.
+    """
+    def __init__(self, level_config: Dict[str, Any]) -> None:
+        self.config: Dict[str, Any] = {}
+        self.children: Dict[str, ConfigTrie] = {}
+        for key, value in level_config.items():
+            if key.startswith('+'):
+                self.config[key[1:]] = value
+            elif isinstance(value, dict):
+                self.children[key] = ConfigTrie(value)
+            else:
+                self.config[key] = value
+        self.merged: Dict[Type[BaseConfig], BaseConfig] = {}
+
+    def search(self, fqn: List[str]) -> Iterator['ConfigTrie']:
+        """Yield this level, then each level below it that matches the fqn."""
+        trie = self
+        yield trie
+        for level in fqn:
+            if level not in trie.children:
+                break
+            trie = trie.children[level]
+            yield trie
+
+    def level_configs(self, fqn: List[str]) -> Iterator[Dict[str, Any]]:
+        """Yield a copy of the config at each level that matches the fqn.
+        Merging a config into another consumes it, so these can't be shared.
+        """
+        for trie in self.search(fqn):
+            yield deepcopy(trie.config)
+
+
 class ContextConfigGenerator:
     def __init__(self, active_project: RuntimeConfig):
         self.active_project = active_project
+        self._tries: Dict[Tuple[str, NodeType], ConfigTrie] = {}
 
     def get_node_project(self, project_name: str):
         if project_name == self.active_project.project_name:
@@ -102,26 +142,27 @@ class ContextConfigGenerator:
             )
         return dependencies[project_name]
 
+    def config_trie(
+        self, project: Project, resource_type: NodeType
+    ) -> ConfigTrie:
+        key = (project.project_name, resource_type)
+        if key not in self._tries:
+            if resource_type == NodeType.Seed:
+                model_configs = project.seeds
+            elif resource_type == NodeType.Snapshot:
+                model_configs = project.snapshots
+            elif resource_type == NodeType.Source:
+                model_configs = project.sources
+            else:
+                model_configs = project.models
+            self._tries[key] = ConfigTrie(model_configs)
+        return self._tries[key]
+
     def project_configs(
         self, project: Project, fqn: List[str], resource_type: NodeType
     ) -> Iterator[Dict[str, Any]]:
-        if resource_type == NodeType.Seed:
-            model_configs = project.seeds
-        elif resource_type == NodeType.Snapshot:
-            model_configs = project.snapshots
-        elif resource_type == NodeType.Source:
-            model_configs = project.sources
-        else:
-            model_configs = project.models
-        for level_config in fqn_search(model_configs, fqn):
-            result = {}
-            for key, value in level_config.items():
-                if key.startswith('+'):
-                    result[key[1:]] = deepcopy(value)
-                elif not isinstance(value, dict):
-                    result[key] = deepcopy(value)
-
-            yield result
+        trie = self.config_trie(project, resource_type)
+        return trie.level_configs(fqn)
 
     def active_project_configs(
         self, fqn: List[str], resource_type: NodeType
@@ -137,6 +178,33 @@ class ContextConfigGenerator:
             validate=validate
         )
 
+    def merged_project_config(
+        self,
+        project: Project,
+        fqn: List[str],
+        resource_type: NodeType,
+        config_cls: Type[T],
+    ) -> T:
+        """Return the config that results from merging the project's configs
+        for the fqn into the defaults. This is cached for every fqn prefix,
+        so the result must not be changed in place.
+        """
+        trie = self.config_trie(project, resource_type)
+        result: Optional[T] = None
+        for level in trie.search(fqn):
+            if config_cls not in level.merged:
+                if result is None:
+                    # Calculate the defaults. We don't want to validate the
+                    # defaults, because it might be invalid in the case of
+                    # required config members (such as on snapshots!)
+                    result = config_cls.from_dict({}, validate=False)
+                level.merged[config_cls] = self._update_from_config(
+                    result, deepcopy(level.config)
+                )
+            result = level.merged[config_cls]  # type: ignore
+        assert result is not None
+        return result
+
     def calculate_node_config(
         self,
         config_calls: List[Dict[str, Any]],
@@ -144,16 +212,14 @@ class ContextConfigGenerator:
         resource_type: NodeType,
         project_name: str,
         base: bool,
+        validate: bool = True,
     ) -> BaseConfig:
         own_config = self.get_node_project(project_name)
         # defaults, own_config, config calls, active_config (if != own_config)
         config_cls = get_config_for(resource_type, base=base)
-        # Calculate the defaults. We don't want to validate the defaults,
-        # because it might be invalid in the case of required config members
-        # (such as on snapshots!)
-        result = config_cls.from_dict({}, validate=False)
-        for fqn_config in self.project_configs(own_config, fqn, resource_type):
-            result = self._update_from_config(result, fqn_config)
+        result = self.merged_project_config(
+            own_config, fqn, resource_type, config_cls
+        )
         for config_call in config_calls:
             result = self._update_from_config(result, config_call)
 
@@ -162,7 +228,9 @@ class ContextConfigGenerator:
                 result = self._update_from_config(result, fqn_config)
 
         # this is mostly impactful in the snapshot config case
-        return result.finalize_and_validate()
+        if validate:
+            return result.finalize_and_validate()
+        return result.finalize()
 
 
 class ContextConfig:
@@ -172,9 +240,12 @@ class ContextConfig:
         fqn: List[str],
         resource_type: NodeType,
         project_name: str,
+        cfg_source: Optional[ContextConfigGenerator] = None,
     ) -> None:
         self.config_calls: List[Dict[str, Any]] = []
-        self.cfg_source = ContextConfigGenerator(active_project)
+        if cfg_source is None:
+            cfg_source = ContextConfigGenerator(active_project)
+        self.cfg_source = cfg_source
         self.fqn = fqn
         self.resource_type = resource_type
         self.project_name = project_name
@@ -183,12 +254,14 @@ class ContextConfig:
         self.config_calls.append(opts)
 
     def build_config_dict(self, base: bool = False) -> Dict[str, Any]:
+        # parsers validate the config along with the node they build from it
         return self.cfg_source.calculate_node_config(
             config_calls=self.config_calls,
             fqn=self.fqn,
             resource_type=self.resource_type,
             project_name=self.project_name,
             base=base,
+            validate=False,
         ).to_dict()
 
 
@@ -1,5 +1,5 @@
 from typing import (
-    Any, Dict, Union
+    Any, Dict, Tuple, Union
 )
 
 from dbt.exceptions import (
@@ -78,3 +78,33 @@ def generate_runtime_docs(
 ) -> Dict[str, Any]:
     ctx = DocsRuntimeContext(config, target, manifest, current_project)
     return ctx.to_dict()
+
+
+class DocsContexts:
+    """Docs contexts for rendering descriptions, built once per package. Only
+    doc() depends on the target, so a package's context is pointed at each
+    target as it's handed out.
+    """
+    def __init__(
+        self,
+        config: RuntimeConfig,
+        manifest: Manifest,
+        current_project: str,
+    ) -> None:
+        self.config = config
+        self.manifest = manifest
+        self.current_project = current_project
+        self._contexts: Dict[
+            str, Tuple[DocsRuntimeContext, Dict[str, Any]]
+        ] = {}
+
+    def get(self, target: Any) -> Dict[str, Any]:
+        package_name = target.package_name
+        if package_name not in self._contexts:
+            ctx = DocsRuntimeContext(
+                self.config, target, self.manifest, self.current_project
+            )
+            self._contexts[package_name] = (ctx, ctx.to_dict())
+        ctx, context = self._contexts[package_name]
+        ctx.node = target
+        return context
@@ -508,8 +508,8 @@ class ProviderContext(ManifestContext):
 
     def _get_namespace(self):
         return MacroNamespace(
-            self.config.project_name,
-            self.search_package,
+            self._get_layout(),
+            self._ctx,
             self.macro_stack,
             self.model,
         )
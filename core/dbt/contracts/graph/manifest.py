@@ -1,12 +1,13 @@
 import enum
 import hashlib
 import os
+from collections import ChainMap
 from dataclasses import dataclass, field
 from datetime import datetime
 from itertools import chain
 from typing import (
     Dict, List, Optional, Union, Mapping, MutableMapping, Any, Set, Tuple,
-    TypeVar, Callable, Iterable, Generic
+    TypeVar, Callable, Iterable, Iterator, Generic
 )
 from typing_extensions import Protocol
 from uuid import UUID
@@ -18,7 +19,9 @@ from dbt.contracts.graph.parsed import (
     ParsedMacro, ParsedDocumentation, ParsedNodePatch, ParsedMacroPatch,
     ParsedSourceDefinition
 )
-from dbt.contracts.util import Writable, Replaceable
+from dbt.contracts.util import (
+    CachedValidator, Writable, Replaceable, should_validate
+)
 from dbt.exceptions import (
     raise_duplicate_resource_name, InternalException, raise_compiler_error,
     warn_or_error, raise_invalid_patch
@@ -127,7 +130,7 @@ class RemoteFile(JsonSchemaMixin):
 
 
 @dataclass
-class SourceFile(JsonSchemaMixin):
+class SourceFile(CachedValidator, JsonSchemaMixin):
     """Define a source file in dbt"""
     path: Union[FilePath, RemoteFile]  # the path information
     checksum: FileHash
@@ -144,6 +147,9 @@ class SourceFile(JsonSchemaMixin):
     macro_patches: List[MacroKey] = field(default_factory=list)
     # any source patches in this file. The entries are package, name pairs
     source_patches: List[SourceKey] = field(default_factory=list)
+    # the names of the vars and environment variables read while parsing
+    vars: List[str] = field(default_factory=list)
+    env_vars: List[str] = field(default_factory=list)
 
     @property
     def search_key(self) -> Optional[str]:
@@ -245,7 +251,9 @@ def build_edges(nodes: List[NonSourceNode]):
 
 
 def _deepcopy(value):
-    return value.from_dict(value.to_dict())
+    return value.from_dict(
+        value.to_dict(), validate=should_validate(revalidating=True)
+    )
 
 
 class Locality(enum.IntEnum):
@@ -344,10 +352,117 @@ def _get_locality(macro: ParsedMacro, root_project_name: str) -> Locality:
         return Locality.Imported
 
 
+# indexes compare by identity, so others can cache things per index
+@dataclass(eq=False)
+class MacroIndex:
+    """An index of macros by name. The candidates for each (name, root
+    project) pair are built and sorted by locality once, on first lookup.
+    """
+    storage: Dict[str, List[ParsedMacro]] = field(default_factory=dict)
+    _candidates: Dict[Tuple[str, str], List[MacroCandidate]] = field(
+        default_factory=dict, repr=False
+    )
+
+    @classmethod
+    def from_macros(cls, macros: Iterable[ParsedMacro]) -> 'MacroIndex':
+        index = cls()
+        for macro in macros:
+            index.storage.setdefault(macro.name, []).append(macro)
+        return index
+
+    def _bucket(self, name: str) -> List[ParsedMacro]:
+        return self.storage.get(name, [])
+
+    def macros(self) -> Iterator[ParsedMacro]:
+        """Iterate over the indexed macros. Macros that share a name come in
+        the order they were added.
+        """
+        return chain.from_iterable(self.storage.values())
+
+    def overlay(
+        self, macros: Mapping[str, ParsedMacro]
+    ) -> 'MacroIndexOverlay':
+        """Return an index of this index's macros with the given ones added,
+        replacing any macros that have the same unique ID.
+        """
+        return MacroIndexOverlay(self, macros)
+
+    def candidates_for(
+        self, name: str, root_project_name: str
+    ) -> List[MacroCandidate]:
+        key = (name, root_project_name)
+        if key not in self._candidates:
+            candidates = [
+                MacroCandidate(
+                    locality=_get_locality(macro, root_project_name),
+                    macro=macro,
+                )
+                for macro in self._bucket(name)
+            ]
+            # sorting is stable, so this preserves the order of macros with
+            # the same locality
+            candidates.sort()
+            self._candidates[key] = candidates
+        return self._candidates[key]
+
+
+class MacroIndexOverlay(MacroIndex):
+    """A MacroIndex layered on top of another one. Only the names of the
+    changed macros are indexed again, and lookups of every other name go to
+    the base index, which is never modified.
+    """
+    def __init__(
+        self, base: MacroIndex, changed: Mapping[str, ParsedMacro]
+    ) -> None:
+        super().__init__()
+        self.base = base
+        self.changed: Dict[str, ParsedMacro] = dict(changed)
+        for macro in self.changed.values():
+            if macro.name not in self.storage:
+                self.storage[macro.name] = list(base._bucket(macro.name))
+            bucket = self.storage[macro.name]
+            for idx, existing in enumerate(bucket):
+                if existing.unique_id == macro.unique_id:
+                    bucket[idx] = macro
+                    break
+            else:
+                bucket.append(macro)
+
+    def _bucket(self, name: str) -> List[ParsedMacro]:
+        if name in self.storage:
+            return self.storage[name]
+        return self.base._bucket(name)
+
+    def macros(self) -> Iterator[ParsedMacro]:
+        for name in self.base.storage:
+            yield from self._bucket(name)
+        for name, bucket in self.storage.items():
+            if name not in self.base.storage:
+                yield from bucket
+
+    def overlay(
+        self, macros: Mapping[str, ParsedMacro]
+    ) -> 'MacroIndexOverlay':
+        # layer all the changes on the same base, rather than on this index
+        changed = dict(self.changed)
+        changed.update(macros)
+        return MacroIndexOverlay(self.base, changed)
+
+    def candidates_for(
+        self, name: str, root_project_name: str
+    ) -> List[MacroCandidate]:
+        if name not in self.storage:
+            return self.base.candidates_for(name, root_project_name)
+        return super().candidates_for(name, root_project_name)
+
+
 class Searchable(Protocol):
-    resource_type: NodeType
     package_name: str
 
+    @property
+    def resource_type(self) -> NodeType:
+        raise NotImplementedError('resource_type not implemented')
+
     @property
     def search_name(self) -> str:
         raise NotImplementedError('search_name not implemented')
@@ -385,6 +500,69 @@ class NameSearcher(Generic[N]):
         return None
 
 
+@dataclass
+class NameIndex(Generic[N]):
+    """An index of searchable values by their search name. Values that share
+    a search name are kept in the order they were added, so searching the
+    index finds the same value a linear NameSearcher scan would.
+    """
+    storage: Dict[str, List[N]] = field(default_factory=dict)
+
+    @classmethod
+    def from_values(cls, values: Iterable[N]) -> 'NameIndex[N]':
+        index: NameIndex[N] = cls()
+        for value in values:
+            index.add(value)
+        return index
+
+    def _bucket(self, name: str) -> List[N]:
+        return self.storage.get(name, [])
+
+    def _writable_bucket(self, name: str) -> List[N]:
+        return self.storage.setdefault(name, [])
+
+    def add(self, value: N) -> None:
+        self._writable_bucket(value.search_name).append(value)
+
+    def replace(self, old: N, new: N) -> None:
+        """Replace old with new, keeping its position among its namesakes."""
+        bucket = self._writable_bucket(old.search_name)
+        for idx, value in enumerate(bucket):
+            if value is old:
+                if old.search_name == new.search_name:
+                    bucket[idx] = new
+                    return
+                del bucket[idx]
+                break
+        self.add(new)
+
+    def search(
+        self, name: str, package: Optional[str], nodetypes: List[NodeType]
+    ) -> Optional[N]:
+        searcher: NameSearcher = NameSearcher(name, package, nodetypes)
+        return searcher.search(self._bucket(name))
+
+
+class NameIndexOverlay(NameIndex[N]):
+    """A NameIndex layered on top of another one. A search name's values are
+    copied out of the base index the first time they change, so the base
+    index is never modified.
+    """
+    def __init__(self, base: NameIndex[N]) -> None:
+        super().__init__()
+        self.base = base
+
+    def _bucket(self, name: str) -> List[N]:
+        if name in self.storage:
+            return self.storage[name]
+        return self.base._bucket(name)
+
+    def _writable_bucket(self, name: str) -> List[N]:
+        if name not in self.storage:
+            self.storage[name] = list(self.base._bucket(name))
+        return self.storage[name]
+
+
 D = TypeVar('D')
 
 
@@ -424,6 +602,32 @@ def _update_into(dest: MutableMapping[str, T], new_item: T):
     dest[unique_id] = new_item
 
 
+class FlatGraphValues(Mapping[str, Dict[str, Any]]):
+    """The dictionary forms of a set of nodes, as the `graph` context member
+    exposes them. Each node is converted on first access and then cached, so
+    only the nodes a template actually reads are converted. The mapping holds
+    the nodes as they were when it was created.
+    """
+    def __init__(self, values: Mapping[str, JsonSchemaMixin]) -> None:
+        self._values = dict(values)
+        self._dicts: Dict[str, Dict[str, Any]] = {}
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        if key not in self._dicts:
+            self._dicts[key] = self._values[key].to_dict(omit_none=False)
+        return self._dicts[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        # render like the dict this used to be
+        return repr(dict(self))
+
+
 @dataclass
 class Manifest:
     """The manifest for the full graph, after parsing and during compilation.
@@ -437,6 +641,27 @@ class Manifest:
     files: MutableMapping[str, SourceFile]
     metadata: ManifestMetadata = field(default_factory=ManifestMetadata)
     flat_graph: Dict[str, Any] = field(default_factory=dict)
+    # name indexes for the find_* methods. These are built on first use (or
+    # by build_name_indexes) and kept in sync by add_nodes/update_node, so
+    # anything that mutates the underlying collections directly must call
+    # build_name_indexes again.
+    _node_index: Optional[NameIndex] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _source_index: Optional[NameIndex] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _doc_index: Optional[NameIndex] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _disabled_index: Optional[NameIndex] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # the macro index is rebuilt on first use after update_macros, except in
+    # an overlay, where changes are layered on the base manifest's index
+    _macro_index: Optional[MacroIndex] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_macros(
@@ -459,10 +684,67 @@ class Manifest:
         )
 
     def update_node(self, new_node: NonSourceNode):
+        existing = self.nodes.get(new_node.unique_id)
         _update_into(self.nodes, new_node)
+        if self._node_index is not None and existing is not new_node:
+            self._node_index.replace(existing, new_node)
 
     def update_source(self, new_source: ParsedSourceDefinition):
+        existing = self.sources.get(new_source.unique_id)
         _update_into(self.sources, new_source)
+        if self._source_index is not None and existing is not new_source:
+            self._source_index.replace(existing, new_source)
+
+    def update_macros(self, new_macros: Mapping[str, ParsedMacro]) -> None:
+        """Add or replace the given macros. In an overlay, only the changed
+        macros are indexed again; otherwise the macro index is invalidated.
+        """
+        if not new_macros:
+            return
+        self.macros.update(new_macros)
+        if isinstance(self._macro_index, MacroIndexOverlay):
+            self._macro_index = self._macro_index.overlay(new_macros)
+        else:
+            self._macro_index = None
+
+    @property
+    def macro_index(self) -> MacroIndex:
+        if self._macro_index is None:
+            self._macro_index = MacroIndex.from_macros(self.macros.values())
+        return self._macro_index
+
+    def build_name_indexes(self):
+        """(Re)build the name indexes used by the find_* and resolve_*
+        methods. They are otherwise built lazily, on the first search.
+        """
+        self._node_index = NameIndex.from_values(self.nodes.values())
+        self._source_index = NameIndex.from_values(self.sources.values())
+        self._doc_index = NameIndex.from_values(self.docs.values())
+        self._disabled_index = NameIndex.from_values(self.disabled)
+
+    @property
+    def node_index(self) -> NameIndex[NonSourceNode]:
+        if self._node_index is None:
+            self._node_index = NameIndex.from_values(self.nodes.values())
+        return self._node_index
+
+    @property
+    def source_index(self) -> NameIndex[ParsedSourceDefinition]:
+        if self._source_index is None:
+            self._source_index = NameIndex.from_values(self.sources.values())
+        return self._source_index
+
+    @property
+    def doc_index(self) -> NameIndex[ParsedDocumentation]:
+        if self._doc_index is None:
+            self._doc_index = NameIndex.from_values(self.docs.values())
+        return self._doc_index
+
+    @property
+    def disabled_index(self) -> NameIndex[CompileResultNode]:
+        if self._disabled_index is None:
+            self._disabled_index = NameIndex.from_values(self.disabled)
+        return self._disabled_index
 
     def build_flat_graph(self):
         """This attribute is used in context.common by each node, so we want to
@@ -471,31 +753,27 @@ class Manifest:
         manifest!
         """
         self.flat_graph = {
-            'nodes': {
-                k: v.to_dict(omit_none=False) for k, v in self.nodes.items()
-            },
-            'sources': {
-                k: v.to_dict(omit_none=False) for k, v in self.sources.items()
-            }
+            'nodes': FlatGraphValues(self.nodes),
+            'sources': FlatGraphValues(self.sources),
         }
 
     def find_disabled_by_name(
         self, name: str, package: Optional[str] = None
     ) -> Optional[NonSourceNode]:
-        searcher: NameSearcher = NameSearcher(
+        result = self.disabled_index.search(
             name, package, NodeType.refable()
         )
-        result = searcher.search(self.disabled)
+        if result is not None:
+            assert not isinstance(result, ParsedSourceDefinition)
         return result
 
     def find_disabled_source_by_name(
         self, source_name: str, table_name: str, package: Optional[str] = None
     ) -> Optional[ParsedSourceDefinition]:
         search_name = f'{source_name}.{table_name}'
-        searcher: NameSearcher = NameSearcher(
+        result = self.disabled_index.search(
             search_name, package, [NodeType.Source]
         )
-        result = searcher.search(self.disabled)
         if result is not None:
             assert isinstance(result, ParsedSourceDefinition)
         return result
@@ -503,11 +781,7 @@ class Manifest:
     def find_docs_by_name(
         self, name: str, package: Optional[str] = None
     ) -> Optional[ParsedDocumentation]:
-        searcher: NameSearcher = NameSearcher(
-            name, package, [NodeType.Documentation]
-        )
-        result = searcher.search(self.docs.values())
-        return result
+        return self.doc_index.search(name, package, [NodeType.Documentation])
 
     def find_refable_by_name(
         self, name: str, package: Optional[str]
@@ -515,11 +789,7 @@ class Manifest:
         """Find any valid target for "ref()" in the graph by its name and
         package name, or None for any package.
         """
-        searcher: NameSearcher = NameSearcher(
-            name, package, NodeType.refable()
-        )
-        result = searcher.search(self.nodes.values())
-        return result
+        return self.node_index.search(name, package, NodeType.refable())
 
     def find_source_by_name(
         self, source_name: str, table_name: str, package: Optional[str]
@@ -529,9 +799,7 @@ class Manifest:
         """
 
         name = f'{source_name}.{table_name}'
-        searcher: NameSearcher = NameSearcher(name, package, [NodeType.Source])
-        result = searcher.search(self.sources.values())
-        return result
+        return self.source_index.search(name, package, [NodeType.Source])
 
     def _find_macros_by_name(
         self,
@@ -541,17 +809,11 @@ class Manifest:
     ) -> CandidateList:
         """Find macros by their name.
         """
-        candidates: CandidateList = CandidateList()
-        for unique_id, macro in self.macros.items():
-            if macro.name != name:
-                continue
-            candidate = MacroCandidate(
-                locality=_get_locality(macro, root_project_name),
-                macro=macro,
-            )
-            if filter is None or filter(candidate):
-                candidates.append(candidate)
-
+        candidates: CandidateList = CandidateList(
+            candidate for candidate
+            in self.macro_index.candidates_for(name, root_project_name)
+            if filter is None or filter(candidate)
+        )
         return candidates
 
     def _materialization_candidates_for(
@@ -647,6 +909,8 @@ class Manifest:
             if unique_id in self.nodes:
                 raise_duplicate_resource_name(node, self.nodes[unique_id])
             self.nodes[unique_id] = node
+            if self._node_index is not None:
+                self._node_index.add(node)
 
     def patch_macros(
         self, patches: MutableMapping[MacroKey, ParsedMacroPatch]
@@ -731,6 +995,39 @@ class Manifest:
             files={k: _deepcopy(v) for k, v in self.files.items()},
         )
 
+    def overlay(self) -> 'Manifest':
+        """Return a manifest layered on top of this one, for changes that
+        must not show up in this one, like an rpc request's node and macros.
+
+        Nodes, sources and macros that are added to or replaced in the overlay
+        are stored there, and everything else is read from this manifest, so
+        making an overlay costs the same no matter how big this manifest is.
+        The values themselves are shared: replace them instead of modifying
+        them.
+
+        The overlay shares this manifest's flat graph as well, so the `graph`
+        context member in the overlay does not include anything added to or
+        replaced in it, like an rpc request's own node or its compiled
+        ancestors.
+        """
+        overlay = Manifest(
+            nodes=ChainMap({}, self.nodes),
+            sources=ChainMap({}, self.sources),
+            macros=ChainMap({}, self.macros),
+            docs=self.docs,
+            generated_at=self.generated_at,
+            disabled=self.disabled,
+            files=self.files,
+            metadata=self.metadata,
+            flat_graph=self.flat_graph,
+        )
+        overlay._node_index = NameIndexOverlay(self.node_index)
+        overlay._source_index = NameIndexOverlay(self.source_index)
+        overlay._doc_index = self.doc_index
+        overlay._disabled_index = self.disabled_index
+        overlay._macro_index = self.macro_index.overlay({})
+        return overlay
+
     def writable_manifest(self):
         edge_members = list(chain(self.nodes.values(), self.sources.values()))
         forward_edges, backward_edges = build_edges(edge_members)
@@ -1,23 +1,23 @@
+import copy
 from dataclasses import field, Field, dataclass
 from enum import Enum
 from typing import (
     Any, List, Optional, Dict, MutableMapping, Union, Type, NewType, Tuple,
-    TypeVar
+    TypeVar, cast
 )
 
 # TODO: patch+upgrade hologram to avoid this jsonschema import
 import jsonschema  # type: ignore
 
-# This is protected, but we really do want to reuse this logic, and the cache!
-# It would be nice to move the custom error picking stuff into hologram!
-from hologram import _validate_schema
-from hologram import JsonSchemaMixin, ValidationError
+from hologram import JsonSchemaMixin
 from hologram.helpers import StrEnum, register_pattern
 
 from dbt import hooks
 from dbt.contracts.graph.unparsed import AdditionalPropertiesAllowed
 from dbt.exceptions import CompilationException, InternalException
-from dbt.contracts.util import Replaceable, list_str
+from dbt.contracts.util import (
+    CachedValidator, Replaceable, list_str, validate_with_cached_validator
+)
 from dbt.node_types import NodeType
 
 
@@ -141,10 +141,16 @@ class Hook(JsonSchemaMixin, Replaceable):
 
 T = TypeVar('T', bound='BaseConfig')
 
+# hologram resolves the type hints of every field whenever it needs the list
+# of fields, which is a lot of work to do for every config that is merged.
+_FIELDS_CACHE: Dict[type, List[Tuple[Field, str]]] = {}
+_MERGE_FIELDS_CACHE: Dict[type, Dict[str, Tuple[Field, MergeBehavior]]] = {}
+
 
 @dataclass
 class BaseConfig(
-    AdditionalPropertiesAllowed, Replaceable, MutableMapping[str, Any]
+    CachedValidator, AdditionalPropertiesAllowed, Replaceable,
+    MutableMapping[str, Any]
 ):
     # Implement MutableMapping so this config will behave as some macros expect
     # during parsing (notably, syntax like `{{ node.config['schema'] }}`)
@@ -183,6 +189,29 @@ class BaseConfig(
     def __len__(self):
         return len(self._get_fields()) + len(self._extra)
 
+    @classmethod
+    def _get_fields(cls) -> List[Tuple[Field, str]]:
+        if cls not in _FIELDS_CACHE:
+            _FIELDS_CACHE[cls] = super()._get_fields()
+        return _FIELDS_CACHE[cls]
+
+    @classmethod
+    def _merge_fields(cls) -> Dict[str, Tuple[Field, MergeBehavior]]:
+        """Map the name of each field in a config dict to the field and its
+        merge behavior.
+        """
+        if cls not in _MERGE_FIELDS_CACHE:
+            _MERGE_FIELDS_CACHE[cls] = {
+                target_field: (fld, MergeBehavior.from_field(fld))
+                for fld, target_field in cls._get_fields()
+            }
+        return _MERGE_FIELDS_CACHE[cls]
+
+    @classmethod
+    def _decode_merge_value(cls, fld: Field, target_field: str, value: Any):
+        """Convert a value from a config dict to the field's type."""
+        return cls._decode_field(fld.name, fld.type, value, False)
+
     @classmethod
     def _extract_dict(
         cls, src: Dict[str, Any], data: Dict[str, Any]
@@ -247,28 +276,67 @@ class BaseConfig(
     ) -> T:
         """Given a dict of keys, update the current config from them, validate
         it, and return a new config with the updated values
+
+        This merges straight into a copy of the config's fields, instead of
+        turning the whole config into a dict and back.
         """
         # sadly, this is a circular import
         from dbt.adapters.factory import get_config_class_by_name
-        dct = self.to_dict(omit_none=False, validate=False, omit_hidden=False)
-
-        adapter_config_cls = get_config_class_by_name(adapter_type)
-
-        self_merged = self._extract_dict(dct, data)
-        dct.update(self_merged)
-
-        adapter_merged = adapter_config_cls._extract_dict(dct, data)
-        dct.update(adapter_merged)
-
-        # any remaining fields must be "clobber"
-        dct.update(data)
+        # mypy can see this module under two names, so tell it the adapter
+        # config is one of ours
+        adapter_config_cls = cast(
+            Type[BaseConfig], get_config_class_by_name(adapter_type)
+        )
+        own_fields = self._merge_fields()
+        adapter_fields = adapter_config_cls._merge_fields()
+
+        result = copy.copy(self)
+        result._extra = self._extra.copy()
+        for target_field, value in data.items():
+            if target_field in own_fields:
+                fld, merge_behavior = own_fields[target_field]
+                if (
+                    merge_behavior == MergeBehavior.Update and
+                    not isinstance(value, dict)
+                ):
+                    raise InternalException(f'expected dict, got {value}')
+                value = self._decode_merge_value(fld, target_field, value)
+                setattr(result, fld.name, _merge_field_value(
+                    merge_behavior=merge_behavior,
+                    self_value=getattr(self, fld.name),
+                    other_value=value,
+                ))
+            elif (
+                target_field in adapter_fields and
+                target_field in result._extra
+            ):
+                # adapter-specific configs are kept as they were given
+                _, merge_behavior = adapter_fields[target_field]
+                result._extra[target_field] = _merge_field_value(
+                    merge_behavior=merge_behavior,
+                    self_value=result._extra[target_field],
+                    other_value=value,
+                )
+            else:
+                # any remaining fields must be "clobber"
+                result._extra[target_field] = value
+
+        if validate:
+            # any validation failures must have come from the update
+            result.validate(result.to_dict(omit_none=False))
+        return result
 
-        # any validation failures must have come from the update
-        return self.from_dict(dct, validate=validate)
+    def finalize(self: T) -> T:
+        """Return the config a node gets, without validating it. Use this
+        when the config gets validated anyway as part of the node.
+        """
+        result = copy.copy(self)
+        result._extra = self._extra.copy()
+        return result
 
     def finalize_and_validate(self: T) -> T:
         self.to_dict(validate=True)
-        return self.replace()
+        return self.finalize()
 
 
 @dataclass
@@ -329,6 +397,12 @@ class NodeConfig(BaseConfig):
                 data[key] = [hooks.get_hook_dict(h) for h in data[key]]
         return super().from_dict(data, validate=validate)
 
+    @classmethod
+    def _decode_merge_value(cls, fld: Field, target_field: str, value: Any):
+        if target_field in list(hooks.ModelHookType):
+            value = [hooks.get_hook_dict(h) for h in _listify(value)]
+        return super()._decode_merge_value(fld, target_field, value)
+
     @classmethod
     def field_mapping(cls):
         return {'post_hook': 'post-hook', 'pre_hook': 'pre-hook'}
@@ -373,14 +447,9 @@ class SnapshotWrapper(JsonSchemaMixin):
 
     @classmethod
     def validate(cls, data: Any):
-        schema = _validate_schema(cls)
-        validator = jsonschema.Draft7Validator(schema)
-        error = jsonschema.exceptions.best_match(
-            validator.iter_errors(data),
-            key=_relevance_without_strategy,
+        validate_with_cached_validator(
+            cls, data, key=_relevance_without_strategy
         )
-        if error is not None:
-            raise ValidationError.create_from(error) from error
 
 
 @dataclass
@@ -426,6 +495,10 @@ class SnapshotConfig(EmptySnapshotConfig):
         data = self.to_dict()
         return SnapshotWrapper.from_dict({'config': data}).config
 
+    def finalize(self: 'SnapshotConfig') -> SnapshotVariants:
+        # picking the kind of snapshot config takes validating it
+        return self.finalize_and_validate()
+
 
 @dataclass(init=False)
 class GenericSnapshotConfig(SnapshotConfig):
@@ -22,7 +22,7 @@ from dbt.contracts.graph.unparsed import (
     HasYamlMetadata, MacroArgument, UnparsedSourceDefinition,
     UnparsedSourceTableDefinition, UnparsedColumn, TestDef
 )
-from dbt.contracts.util import Replaceable
+from dbt.contracts.util import CachedValidator, Replaceable
 from dbt.logger import GLOBAL_LOGGER as logger  # noqa
 from dbt.node_types import NodeType
 
@@ -58,7 +58,7 @@ class HasFqn(JsonSchemaMixin, Replaceable):
 
 
 @dataclass
-class HasUniqueID(JsonSchemaMixin, Replaceable):
+class HasUniqueID(CachedValidator, JsonSchemaMixin, Replaceable):
     unique_id: str
 
 
@@ -87,7 +87,7 @@ class HasRelationMetadata(JsonSchemaMixin, Replaceable):
     schema: str
 
 
-class ParsedNodeMixins(JsonSchemaMixin):
+class ParsedNodeMixins(CachedValidator, JsonSchemaMixin):
     resource_type: NodeType
     depends_on: DependsOn
     config: NodeConfig
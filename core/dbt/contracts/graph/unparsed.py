@@ -1,5 +1,5 @@
 from dbt.node_types import NodeType
-from dbt.contracts.util import Replaceable, Mergeable
+from dbt.contracts.util import CachedValidator, Replaceable, Mergeable
 # trigger the PathEncoder
 import dbt.helper_types  # noqa:F401
 from dbt.exceptions import CompilationException
@@ -14,7 +14,7 @@ from typing import Optional, List, Union, Dict, Any, Sequence
 
 
 @dataclass
-class UnparsedBaseNode(JsonSchemaMixin, Replaceable):
+class UnparsedBaseNode(CachedValidator, JsonSchemaMixin, Replaceable):
     package_name: str
     root_path: str
     path: str
@@ -104,7 +104,7 @@ class HasColumnTests(HasColumnDocs):
 
 
 @dataclass
-class HasYamlMetadata(JsonSchemaMixin):
+class HasYamlMetadata(CachedValidator, JsonSchemaMixin):
     original_file_path: str
     yaml_key: str
     package_name: str
@@ -15,6 +15,7 @@ from dbt.contracts.results import (
     CatalogResults,
     ExecutionResult,
 )
+from dbt.contracts.util import CachedValidator
 from dbt.exceptions import InternalException
 from dbt.logger import LogMessage
 from dbt.utils import restrict_to
@@ -27,7 +28,7 @@ TaskID = uuid.UUID
 
 
 @dataclass
-class RPCParameters(JsonSchemaMixin):
+class RPCParameters(CachedValidator, JsonSchemaMixin):
     timeout: Optional[float]
     task_tags: TaskTags
 
@@ -1,7 +1,17 @@
 import dataclasses
-from typing import List
+import itertools
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
-from dbt.clients.system import write_json
+import jsonschema  # type: ignore
+
+# This is protected, but we really do want to reuse this logic, and the cache!
+from hologram import _validate_schema
+from hologram import JsonSchemaMixin, ValidationError
+
+import dbt.flags
+from dbt.clients.system import write_chunks, write_json
+from dbt.utils import JSONEncoder
 
 
 def list_str() -> List[str]:
@@ -41,6 +51,137 @@ class Mergeable(Replaceable):
         return self.replace(**replacements)
 
 
+# jsonschema validators keep track of the current $ref scope while they
+# validate, so each thread gets its own validators.
+_VALIDATORS = threading.local()
+
+
+def _validator_for(cls: Any) -> jsonschema.Draft7Validator:
+    try:
+        validators = _VALIDATORS.cache
+    except AttributeError:
+        validators = _VALIDATORS.cache = {}
+    if cls not in validators:
+        validators[cls] = jsonschema.Draft7Validator(_validate_schema(cls))
+    return validators[cls]
+
+
+def validate_with_cached_validator(
+    cls: Any,
+    data: Any,
+    key: Optional[Callable[[jsonschema.ValidationError], Any]] = None,
+) -> None:
+    """Validate the data against the json schema of the given class, like
+    JsonSchemaMixin.validate does, but reuse one validator per class instead
+    of building a new one for each call. Valid data is the common case, so
+    only search for the most relevant error once there is one.
+    """
+    errors = _validator_for(cls).iter_errors(data)
+    first = next(errors, None)
+    if first is None:
+        return
+    kwargs = {} if key is None else {'key': key}
+    error = jsonschema.exceptions.best_match(
+        itertools.chain([first], errors), **kwargs
+    )
+    raise ValidationError.create_from(error) from error
+
+
+class CachedValidator:
+    """Validate with a json schema validator that is built the first time the
+    class validates something, and reused after that. This must come before
+    JsonSchemaMixin in the bases.
+    """
+    @classmethod
+    def validate(cls, data: Any):
+        validate_with_cached_validator(cls, data)
+
+
+def should_validate(revalidating: bool = False) -> bool:
+    """Return whether data should be validated as it is converted to a
+    contract, according to the --validation mode.
+
+    In 'strict' mode everything is validated. In 'fast' mode, contracts that
+    were already validated are not validated again when they are copied or
+    converted into other contracts (for example when nodes are compiled). In
+    'off' mode, the nodes built during parsing are not validated either.
+    """
+    if dbt.flags.VALIDATION == 'off':
+        return False
+    elif dbt.flags.VALIDATION == 'fast':
+        return not revalidating
+    else:
+        return True
+
+
+def _is_streamable(value: Any) -> bool:
+    """Return whether the value is a non-empty collection of contract objects,
+    which can be serialized one item at a time.
+    """
+    items: Iterable[Any]
+    if isinstance(value, dict):
+        items = value.values()
+    elif isinstance(value, list):
+        items = value
+    else:
+        return False
+    return bool(value) and all(
+        isinstance(item, JsonSchemaMixin) for item in items
+    )
+
+
 class Writable:
     def write(self, path: str, omit_none: bool = False):
-        write_json(path, self.to_dict(omit_none=omit_none))  # type: ignore
+        if type(self).to_dict is not JsonSchemaMixin.to_dict:  # type: ignore
+            # a custom to_dict might do anything, so respect it
+            write_json(path, self.to_dict(omit_none=omit_none))  # type: ignore
+        else:
+            write_chunks(path, self._json_chunks(omit_none))
+
+    def _json_chunks(self, omit_none: bool) -> Iterator[str]:
+        """Yield the same json that serializing to_dict() would, in pieces.
+
+        The large collections (nodes, macros, results, ...) are converted one
+        item at a time as they are written, so the full dictionary form of the
+        object never has to exist in memory at once.
+        """
+        cls: Any = type(self)
+        streamed: Dict[str, Any] = {}
+        replacements: Dict[str, Any] = {}
+        for field in dataclasses.fields(cls):
+            value = getattr(self, field.name)
+            if field.name.startswith('_') or not _is_streamable(value):
+                continue
+            name = cls.field_mapping().get(field.name, field.name)
+            streamed[name] = value
+            replacements[field.name] = {} if isinstance(value, dict) else []
+
+        encode = JSONEncoder().encode
+        shell: Any = dataclasses.replace(self, **replacements)  # type: ignore
+        yield '{'
+        for index, (key, value) in enumerate(
+            shell.to_dict(omit_none=omit_none).items()
+        ):
+            if index:
+                yield ', '
+            yield encode(key) + ': '
+            if key not in streamed:
+                yield encode(value)
+            elif isinstance(streamed[key], dict):
+                yield '{'
+                for item_index, (item_key, item) in enumerate(
+                    streamed[key].items()
+                ):
+                    if item_index:
+                        yield ', '
+                    yield encode(item_key) + ': '
+                    yield encode(item.to_dict(omit_none=omit_none))
+                yield '}'
+            else:
+                yield '['
+                for item_index, item in enumerate(streamed[key]):
+                    if item_index:
+                        yield ', '
+                    yield encode(item.to_dict(omit_none=omit_none))
+                yield ']'
+        yield '}'
@@ -10,6 +10,11 @@ WARN_ERROR = None
 TEST_NEW_PARSER = None
 WRITE_JSON = None
 PARTIAL_PARSE = None
+PARSE_WORKERS = None
+CONNECTION_POOL_SIZE = None
+CONNECTION_IDLE_TIMEOUT = None
+VALIDATION = None
+RELATION_CACHE_TTL = None
 
 
 def env_set_truthy(key: str) -> Optional[str]:
@@ -42,7 +47,9 @@ MP_CONTEXT = _get_context()
 
 def reset():
     global STRICT_MODE, FULL_REFRESH, USE_CACHE, WARN_ERROR, TEST_NEW_PARSER, \
-        WRITE_JSON, PARTIAL_PARSE, MP_CONTEXT
+        WRITE_JSON, PARTIAL_PARSE, PARSE_WORKERS, MP_CONTEXT, \
+        CONNECTION_POOL_SIZE, CONNECTION_IDLE_TIMEOUT, VALIDATION, \
+        RELATION_CACHE_TTL
 
     STRICT_MODE = False
     FULL_REFRESH = False
@@ -51,12 +58,19 @@ def reset():
     TEST_NEW_PARSER = False
     WRITE_JSON = True
     PARTIAL_PARSE = False
+    PARSE_WORKERS = None
+    CONNECTION_POOL_SIZE = 0
+    CONNECTION_IDLE_TIMEOUT = 300
+    VALIDATION = 'strict'
+    RELATION_CACHE_TTL = None
     MP_CONTEXT = _get_context()
 
 
 def set_from_args(args):
     global STRICT_MODE, FULL_REFRESH, USE_CACHE, WARN_ERROR, TEST_NEW_PARSER, \
-        WRITE_JSON, PARTIAL_PARSE, MP_CONTEXT
+        WRITE_JSON, PARTIAL_PARSE, PARSE_WORKERS, MP_CONTEXT, \
+        CONNECTION_POOL_SIZE, CONNECTION_IDLE_TIMEOUT, VALIDATION, \
+        RELATION_CACHE_TTL
 
     USE_CACHE = getattr(args, 'use_cache', USE_CACHE)
 
@@ -70,6 +84,17 @@ def set_from_args(args):
     TEST_NEW_PARSER = getattr(args, 'test_new_parser', TEST_NEW_PARSER)
     WRITE_JSON = getattr(args, 'write_json', WRITE_JSON)
     PARTIAL_PARSE = getattr(args, 'partial_parse', None)
+    PARSE_WORKERS = getattr(args, 'parse_workers', None)
+    CONNECTION_POOL_SIZE = getattr(
+        args, 'connection_pool_size', CONNECTION_POOL_SIZE
+    )
+    CONNECTION_IDLE_TIMEOUT = getattr(
+        args, 'connection_idle_timeout', CONNECTION_IDLE_TIMEOUT
+    )
+    VALIDATION = getattr(args, 'validation', VALIDATION)
+    RELATION_CACHE_TTL = getattr(
+        args, 'relation_cache_ttl', RELATION_CACHE_TTL
+    )
     MP_CONTEXT = _get_context()
 
 
@@ -236,6 +236,28 @@
 {% endmacro %}
 
 
+{% macro list_relations_in_schemas_without_caching(information_schema, schemas) %}
+  {{ return(adapter_macro('list_relations_in_schemas_without_caching', information_schema, schemas)) }}
+{% endmacro %}
+
+
+{% macro default__list_relations_in_schemas_without_caching(information_schema, schemas) %}
+  {{ exceptions.raise_not_implemented(
+    'list_relations_in_schemas_without_caching macro not implemented for adapter '+adapter.type()) }}
+{% endmacro %}
+
+
+{% macro relations_cache_fingerprint(information_schema, schemas) %}
+  {{ return(adapter_macro('relations_cache_fingerprint', information_schema, schemas)) }}
+{% endmacro %}
+
+
+{% macro default__relations_cache_fingerprint(information_schema, schemas) %}
+  {#-- no cheap way to tell if the schemas changed: rely on the snapshot ttl --#}
+  {{ return(none) }}
+{% endmacro %}
+
+
 {% macro current_timestamp() -%}
   {{ adapter_macro('current_timestamp') }}
 {%- endmacro %}
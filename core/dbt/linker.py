@@ -1,5 +1,5 @@
 from queue import PriorityQueue
-from typing import Iterable, Set, Optional
+from typing import Dict, Iterable, Set, Optional
 import networkx as nx  # type: ignore
 import threading
 
@@ -46,8 +46,10 @@ class GraphQueue:
         self.lock = threading.Lock()
         # store the 'score' of each node as a number. Lower is higher priority.
         self._scores = self._calculate_scores()
+        # the number of parents each node is still waiting on
+        self._remaining_parents: Dict[str, int] = dict(self.graph.in_degree())
         # populate the initial queue
-        self._find_new_additions()
+        self._find_new_additions(self.graph.nodes())
         # awaits after task end
         self.some_task_done = threading.Condition(self.lock)
 
@@ -67,8 +69,11 @@ class GraphQueue:
         The score is stored as a negative number because the internal
         PriorityQueue picks lowest values first.
 
-        We could do this in one pass over the graph instead of len(self.graph)
-        passes but this is easy. For large graphs this may hurt performance.
+        This is done in a single pass over the graph in reverse topological
+        order. Each blocking node is assigned a bit, and each node's blocking
+        descendants are tracked as a bitset (an int) that is the union of its
+        children's bitsets and bits. A node's bitset is dropped once all of
+        its parents have consumed it.
 
         This operates on the graph, so it would require a lock if called from
         outside __init__.
@@ -76,13 +81,23 @@ class GraphQueue:
         :return Dict[str, int]: The score dict, mapping unique IDs to integer
             scores. Lower scores are higher priority.
         """
-        scores = {}
+        bits: Dict[str, int] = {}
         for node in self.graph.nodes():
-            score = -1 * len([
-                d for d in nx.descendants(self.graph, node)
-                if self._include_in_cost(d)
-            ])
-            scores[node] = score
+            if self._include_in_cost(node):
+                bits[node] = 1 << len(bits)
+
+        waiting: Dict[str, int] = dict(self.graph.in_degree())
+        descendants: Dict[str, int] = {}
+        scores: Dict[str, int] = {}
+        for node in reversed(list(nx.topological_sort(self.graph))):
+            node_descendants = 0
+            for child in self.graph.successors(node):
+                node_descendants |= descendants[child] | bits.get(child, 0)
+                waiting[child] -= 1
+                if waiting[child] == 0:
+                    del descendants[child]
+            descendants[node] = node_descendants
+            scores[node] = -1 * bin(node_descendants).count('1')
         return scores
 
     def get(self, block=True, timeout=None):
@@ -132,28 +147,38 @@ class GraphQueue:
         """
         return node in self.in_progress or node in self.queued
 
-    def _find_new_additions(self):
-        """Find any nodes in the graph that need to be added to the internal
-        queue and add them.
+    def _find_new_additions(self, candidates: Iterable[str]):
+        """Find any nodes among the candidates that are no longer waiting on
+        any parents and add them to the internal queue.
 
         Callers must hold the lock.
         """
-        for node, in_degree in self.graph.in_degree():
-            if not self._already_known(node) and in_degree == 0:
+        for node in candidates:
+            if (
+                not self._already_known(node) and
+                self._remaining_parents[node] == 0
+            ):
                 self.inner.put((self._scores[node], node))
                 self.queued.add(node)
 
     def mark_done(self, node_id):
         """Given a node's unique ID, mark it as done.
 
+        Only the node's children can become ready as a result, so this is
+        proportional to the node's out-degree rather than the graph size.
+
         This method takes the lock.
 
         :param str node_id: The node ID to mark as complete.
         """
         with self.lock:
             self.in_progress.remove(node_id)
+            children = list(self.graph.successors(node_id))
+            for child in children:
+                self._remaining_parents[child] -= 1
             self.graph.remove_node(node_id)
-            self._find_new_additions()
+            del self._remaining_parents[node_id]
+            self._find_new_additions(children)
             self.inner.task_done()
             self.some_task_done.notify_all()
 
@@ -210,21 +235,40 @@ class Linker:
         """Create and return a new graph that is a shallow copy of the graph,
         but with only the nodes in include_nodes. Transitive edges across
         removed nodes are preserved as explicit new edges.
-        """
-        new_graph = nx.algorithms.transitive_closure(self.graph)
 
+        Rather than computing the transitive closure of the whole graph, this
+        searches forward from each included node through removed nodes only,
+        stopping at included nodes. That preserves reachability between the
+        included nodes while keeping memory proportional to the selection.
+        """
         include_nodes = set(include_nodes)
 
-        for node in self.graph.nodes():
-            if node not in include_nodes:
-                new_graph.remove_node(node)
-
         for node in include_nodes:
-            if node not in new_graph:
+            if node not in self.graph:
                 raise RuntimeError(
                     "Couldn't find model '{}' -- does it exist or is "
                     "it disabled?".format(node)
                 )
+
+        new_graph = nx.DiGraph()
+        # preserve the original node order, so iteration over the new graph
+        # is deterministic
+        for node, data in self.graph.nodes(data=True):
+            if node in include_nodes:
+                new_graph.add_node(node, **data)
+
+        for node in new_graph.nodes():
+            to_check = list(self.graph.successors(node))
+            visited = set(to_check)
+            while to_check:
+                succ = to_check.pop()
+                if succ in include_nodes:
+                    new_graph.add_edge(node, succ)
+                    continue
+                for next_succ in self.graph.successors(succ):
+                    if next_succ not in visited:
+                        visited.add(next_succ)
+                        to_check.append(next_succ)
         return new_graph
 
     def as_graph_queue(
@@ -269,10 +313,26 @@ class Linker:
                 ephemerals.add(pred)
                 to_check.add(pred)
 
+        if not ephemerals:
+            return []
+
         ephemeral_graph = self.build_subset_graph(ephemerals)
         # we can just topo sort this because we know there are no cycles.
         return nx.topological_sort(ephemeral_graph)
 
+    def find_cycle_through(self, node):
+        """Like find_cycles, but only look for a cycle that goes through the
+        given node, which is much cheaper on a large graph.
+        """
+        dependents = nx.descendants(self.graph, node)
+        for parent in self.graph.predecessors(node):
+            if parent == node or parent in dependents:
+                cycle_nodes = nx.shortest_path(self.graph, node, parent)
+                cycle_nodes.append(node)
+                return " --> ".join(cycle_nodes)
+
+        return None
+
     def get_dependent_nodes(self, node):
         return nx.descendants(self.graph, node)
 
@@ -285,6 +345,15 @@ class Linker:
     def add_node(self, node):
         self.graph.add_node(node)
 
+    def remove_dependencies(self, node):
+        "indicate that node no longer depends on anything"
+        self.graph.remove_edges_from(list(self.graph.in_edges(node)))
+
+    def copy(self) -> 'Linker':
+        linker = Linker()
+        linker.graph = self.graph.copy()
+        return linker
+
     def remove_node(self, node):
         children = nx.descendants(self.graph, node)
         self.graph.remove_node(node)
@@ -647,6 +647,51 @@ def _build_rpc_subparser(subparsers, base_subparser):
         Specify the port number for the rpc server.
         ''',
     )
+    sub.add_argument(
+        '--watch',
+        action='store_true',
+        help='''
+        Watch the project files, and update the manifest when they change.
+        Changed files that only define nodes are parsed again on their own.
+        ''',
+    )
+    sub.add_argument(
+        '--worker-pool-size',
+        default=0,
+        type=int,
+        help='''
+        Run requests in a pool of this many processes that are started ahead
+        of time, instead of starting a new process for each request. Requests
+        that arrive while every pool process is busy get their own process.
+        ''',
+    )
+    sub.add_argument(
+        '--worker-max-tasks',
+        default=100,
+        type=int,
+        help='''
+        Replace each pool process after it has run this many requests.
+        ''',
+    )
+    sub.add_argument(
+        '--connection-pool-size',
+        default=0,
+        type=int,
+        help='''
+        Keep up to this many open database connections in each process once
+        a request is done, and reuse them for later requests instead of
+        opening new ones.
+        ''',
+    )
+    sub.add_argument(
+        '--connection-idle-timeout',
+        default=300,
+        type=float,
+        help='''
+        Close pooled database connections that were not used for this many
+        seconds.
+        ''',
+    )
     sub.set_defaults(cls=RPCServerTask, which='rpc', rpc_method=None)
     # the rpc task does a 'compile', so we need these attributes to exist, but
     # we don't want users to be allowed to set them.
@@ -824,10 +869,10 @@ def parse_args(args, cls=DBTArgumentParser):
         dest='partial_parse',
         default=None,
         help='''
-        Allow for partial parsing by looking for and writing to a pickle file
-        in the target directory. This overrides the user configuration file.
-
-        WARNING: This can result in unexpected behavior if you use env_var()!
+        Allow for partial parsing by looking for and writing to a parse cache
+        in the target directory. Only files that changed, or that read vars
+        or environment variables that changed, are parsed again. This
+        overrides the user configuration file.
         '''
     )
 
@@ -842,6 +887,43 @@ def parse_args(args, cls=DBTArgumentParser):
         '''
     )
 
+    p.add_argument(
+        '--parse-workers',
+        type=int,
+        default=None,
+        help='''
+        Parse project files in this many worker processes. By default,
+        files are parsed one at a time in the main process.
+        '''
+    )
+
+    p.add_argument(
+        '--validation',
+        choices=['strict', 'fast', 'off'],
+        default='strict',
+        help='''
+        How much dbt validates its nodes against their schemas. 'strict'
+        (the default) validates nodes whenever they are built. 'fast' does
+        not validate nodes again when they are compiled or copied after
+        parsing validated them. 'off' also skips validating the nodes built
+        during parsing, and should only be used with projects known to be
+        valid.
+        '''
+    )
+
+    p.add_argument(
+        '--relation-cache-ttl',
+        type=int,
+        default=None,
+        help='''
+        Save the cache of relations in the database to the target directory
+        at the end of each run, and use it instead of listing the relations
+        again if it is at most this many seconds old. Where the adapter
+        supports it, the saved cache is also checked against the database
+        with one cheap query first.
+        '''
+    )
+
     # if set, run dbt in single-threaded mode: thread count is ignored, and
     # calls go through `map` instead of the thread pool. This is useful for
     # getting performance information about aspects of dbt that normally run in
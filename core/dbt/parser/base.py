@@ -16,13 +16,15 @@ from dbt.adapters.factory import get_adapter
 from dbt.clients.jinja import get_rendered
 from dbt.config import Project, RuntimeConfig
 from dbt.context.context_config import (
-    LegacyContextConfig, ContextConfig, ContextConfigType
+    LegacyContextConfig, ContextConfig, ContextConfigType,
+    ContextConfigGenerator,
 )
 from dbt.contracts.graph.manifest import (
     Manifest, SourceFile, FilePath, FileHash
 )
 from dbt.contracts.graph.parsed import HasUniqueID
 from dbt.contracts.graph.unparsed import UnparsedNode
+from dbt.contracts.util import should_validate
 from dbt.exceptions import (
     CompilationException, validator_error_message, InternalException
 )
@@ -141,6 +143,9 @@ class ConfiguredParser(
         self._update_node_alias = RelationUpdate(
             manifest=macro_manifest, config=root_project, component='alias'
         )
+        # shared by the nodes this parser parses, so the project configs
+        # for an fqn prefix are only merged once
+        self.config_generator = ContextConfigGenerator(root_project)
 
     @abc.abstractclassmethod
     def get_compiled_path(cls, block: ConfiguredBlockType) -> str:
@@ -235,7 +240,7 @@ class ConfiguredParser(
         }
         dct.update(kwargs)
         try:
-            return self.parse_from_dict(dct)
+            return self.parse_from_dict(dct, validate=should_validate())
         except ValidationError as exc:
             msg = validator_error_message(exc)
             # this is a bit silly, but build an UnparsedNode just for error
@@ -280,7 +285,9 @@ class ConfiguredParser(
         final_config_dict.update(config_dict)
         # re-mangle hooks, in case we got new ones
         self._mangle_hooks(final_config_dict)
-        parsed_node.config = parsed_node.config.from_dict(final_config_dict)
+        parsed_node.config = parsed_node.config.from_dict(
+            final_config_dict, validate=should_validate()
+        )
 
     def update_parsed_node_name(
         self, parsed_node: IntermediateNode, config_dict: Dict[str, Any]
@@ -339,6 +346,7 @@ class ConfiguredParser(
                 fqn,
                 self.resource_type,
                 self.project.project_name,
+                cfg_source=self.config_generator,
             )
         else:
             raise InternalException(
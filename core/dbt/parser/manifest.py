@@ -1,24 +1,31 @@
+import json
 import os
-import pickle
 from datetime import datetime
 from typing import (
-    Dict, Optional, Mapping, Callable, Any, List, Type, Union, MutableMapping
+    Dict, Optional, Mapping, Callable, Any, List, Type, Union, MutableMapping,
+    Tuple, Iterable,
 )
 
 import dbt.exceptions
 import dbt.flags
 
 from dbt import deprecations
+from dbt.adapters.factory import register_adapter, load_plugin
 from dbt.helper_types import PathSet
 from dbt.include.global_project import PACKAGES
 from dbt.logger import GLOBAL_LOGGER as logger, DbtProcessState
 from dbt.node_types import NodeType
-from dbt.clients.jinja import get_rendered
+from dbt.clients.jinja import (
+    get_rendered, render_counter, template_code_cache, MacroBytecodeCache
+)
 from dbt.clients.system import make_directory
 from dbt.config import Project, RuntimeConfig
-from dbt.context.docs import generate_runtime_docs
+from dbt.context.base import parse_dependencies
+from dbt.context.docs import DocsContexts, generate_runtime_docs
 from dbt.contracts.graph.compiled import NonSourceNode
-from dbt.contracts.graph.manifest import Manifest, FilePath, FileHash, Disabled
+from dbt.contracts.graph.manifest import (
+    Manifest, FilePath, FileHash, Disabled, RemoteFile, SourceFile,
+)
 from dbt.contracts.graph.parsed import (
     ParsedSourceDefinition, ParsedNode, ParsedMacro, ColumnInfo,
 )
@@ -28,19 +35,22 @@ from dbt.parser.data_test import DataTestParser
 from dbt.parser.docs import DocumentationParser
 from dbt.parser.hooks import HookParser
 from dbt.parser.macros import MacroParser
-from dbt.parser.models import ModelParser
+from dbt.parser.models import ModelParser, model_parse_counter
+from dbt.parser.partial import ParseCache, DependencyValues
 from dbt.parser.results import ParseResult
 from dbt.parser.schemas import SchemaParser
-from dbt.parser.search import FileBlock
+from dbt.parser.search import FileBlock, FilesystemSearcher
 from dbt.parser.seeds import SeedParser
 from dbt.parser.snapshots import SnapshotParser
 from dbt.parser.sources import patch_sources
 from dbt.version import __version__
 
 
-PARTIAL_PARSE_FILE_NAME = 'partial_parse.pickle'
+PARTIAL_PARSE_FILE_NAME = 'partial_parse.cache'
+BYTECODE_CACHE_DIR_NAME = 'jinja_bytecode'
 PARSING_STATE = DbtProcessState('parsing')
 DEFAULT_PARTIAL_PARSE = False
+DEFAULT_PARSE_WORKERS = 1
 
 
 _parser_types: List[Type[Parser]] = [
@@ -54,35 +64,49 @@ _parser_types: List[Type[Parser]] = [
     SchemaParser,
 ]
 
+# the parsers of files that define nodes and nothing else, so each of those
+# files can be parsed again on its own
+_node_parser_types: List[Type[Parser]] = [
+    ModelParser,
+    SnapshotParser,
+    AnalysisParser,
+    DataTestParser,
+    SeedParser,
+]
+
+
+def _hash_config(config: Mapping[str, Any]) -> FileHash:
+    return FileHash.from_contents(
+        json.dumps(config, sort_keys=True, default=str)
+    )
+
 
-# TODO: this should be calculated per-file based on the vars() calls made in
-# parsing, so changing one var doesn't invalidate everything. also there should
-# be something like that for env_var - currently changing env_vars in way that
-# impact graph selection or configs will result in weird test failures.
-# finally, we should hash the actual profile used, not just root project +
-# profiles.yml + relevant args. While sufficient, it is definitely overkill.
 def make_parse_result(
     config: RuntimeConfig, all_projects: Mapping[str, Project]
 ) -> ParseResult:
     """Make a ParseResult from the project configuration and the profile."""
-    # if any of these change, we need to reject the parser
+    # if any of these change, we need to reject the parser. Vars are not
+    # included: each file records the vars and env vars it reads, and is only
+    # parsed again when one of those changes.
     vars_hash = FileHash.from_contents(
         '\x00'.join([
-            getattr(config.args, 'vars', '{}') or '{}',
             getattr(config.args, 'profile', '') or '',
             getattr(config.args, 'target', '') or '',
             __version__
         ])
     )
-    profile_path = os.path.join(config.args.profiles_dir, 'profiles.yml')
-    with open(profile_path) as fp:
-        profile_hash = FileHash.from_contents(fp.read())
+    # hash the rendered profile and projects rather than the files, so vars
+    # and env vars used inside of them are accounted for
+    profile_info = config.to_profile_info(serialize_credentials=True)
+    # --threads doesn't change how anything parses
+    profile_info.pop('threads', None)
+    profile_hash = _hash_config(profile_info)
 
     project_hashes = {}
     for name, project in all_projects.items():
-        path = os.path.join(project.project_root, 'dbt_project.yml')
-        with open(path) as fp:
-            project_hashes[name] = FileHash.from_contents(fp.read())
+        project_config = project.to_project_config(with_packages=True)
+        project_config.pop('vars', None)
+        project_hashes[name] = _hash_config(project_config)
 
     return ParseResult(
         vars_hash=vars_hash,
@@ -91,6 +115,110 @@ def make_parse_result(
     )
 
 
+# a file for a parse worker to parse: the project name, the index of the
+# parser in _parser_types, and the file
+ParseUnit = Tuple[str, int, FileBlock]
+
+
+class ParseWorker:
+    """Parse files on behalf of a ManifestLoader in a worker process. Each
+    file is parsed into its own ParseResult, which the loader merges into its
+    results in the same order it would have parsed them itself.
+    """
+    def __init__(
+        self,
+        root_project: RuntimeConfig,
+        all_projects: Mapping[str, Project],
+        macro_manifest: Manifest,
+    ) -> None:
+        self.root_project = root_project
+        self.all_projects = all_projects
+        self.macro_manifest = macro_manifest
+        self.parsers: Dict[Tuple[str, int], Parser] = {}
+
+    def get_parser(self, project_name: str, index: int) -> Parser:
+        key = (project_name, index)
+        if key not in self.parsers:
+            cls = _parser_types[index]
+            self.parsers[key] = cls(
+                ParseResult.rpc(),
+                self.all_projects[project_name],
+                self.root_project,
+                self.macro_manifest,
+            )
+        return self.parsers[key]
+
+    def parse(self, unit: ParseUnit) -> Optional[ParseResult]:
+        project_name, index, block = unit
+        parser = self.get_parser(project_name, index)
+        parser.results = ParseResult.rpc()
+        try:
+            with parse_dependencies.recording(block.file):
+                parser.parse_file(block)
+        except Exception:
+            # the loader parses the file again itself to raise the error
+            return None
+        return parser.results
+
+
+_parse_worker: Optional[ParseWorker] = None
+
+
+def _partial_parse_enabled(root_project: RuntimeConfig) -> bool:
+    # if the CLI is set, follow that
+    if dbt.flags.PARTIAL_PARSE is not None:
+        return dbt.flags.PARTIAL_PARSE
+    # if the config is set, follow that
+    elif root_project.config.partial_parse is not None:
+        return root_project.config.partial_parse
+    else:
+        return DEFAULT_PARTIAL_PARSE
+
+
+def set_bytecode_cache(root_project: RuntimeConfig) -> None:
+    """When partial parsing is enabled, also persist compiled macro code in
+    the target directory, so later invocations can skip compiling unchanged
+    macros.
+    """
+    if not _partial_parse_enabled(root_project):
+        template_code_cache.bytecode_cache = None
+        return
+    path = os.path.join(root_project.target_path, BYTECODE_CACHE_DIR_NAME)
+    make_directory(path)
+    template_code_cache.bytecode_cache = MacroBytecodeCache(
+        path, __version__
+    )
+
+
+def _init_parse_worker(
+    root_project: RuntimeConfig,
+    all_projects: Mapping[str, Project],
+    macro_manifest: Manifest,
+) -> None:
+    global _parse_worker
+    # an exception here would make the pool start new workers forever, so
+    # on failure leave every file for the loader to parse itself instead
+    try:
+        # spawned workers start out with nothing set up
+        dbt.flags.set_from_args(root_project.args)
+        load_plugin(root_project.credentials.type)
+        register_adapter(root_project)
+        set_bytecode_cache(root_project)
+        _parse_worker = ParseWorker(
+            root_project, all_projects, macro_manifest
+        )
+    except Exception as exc:
+        logger.debug(
+            'Failed to start a parse worker: {}'.format(exc), exc_info=True
+        )
+
+
+def _parse_in_worker(unit: ParseUnit) -> Optional[ParseResult]:
+    if _parse_worker is None:
+        return None
+    return _parse_worker.parse(unit)
+
+
 class ManifestLoader:
     def __init__(
         self,
@@ -109,11 +237,12 @@ class ManifestLoader:
         self.results: ParseResult = make_parse_result(
             root_project, all_projects,
         )
+        self.dependencies = DependencyValues(root_project, all_projects)
         self._loaded_file_cache: Dict[str, FileBlock] = {}
 
     def _load_macros(
         self,
-        old_results: Optional[ParseResult],
+        old_results: Optional[ParseCache],
         internal_manifest: Optional[Manifest] = None,
     ) -> None:
         projects = self.all_projects
@@ -134,28 +263,35 @@ class ManifestLoader:
         self,
         path: FilePath,
         parser: BaseParser,
-        old_results: Optional[ParseResult],
+        old_results: Optional[ParseCache],
     ) -> None:
         block = self._get_file(path, parser)
         if not self._get_cached(block, old_results, parser):
-            parser.parse_file(block)
+            with parse_dependencies.recording(block.file):
+                parser.parse_file(block)
 
     def _get_cached(
         self,
         block: FileBlock,
-        old_results: Optional[ParseResult],
+        old_results: Optional[ParseCache],
         parser: BaseParser,
     ) -> bool:
         # TODO: handle multiple parsers w/ same files, by
         # tracking parser type vs node type? Or tracking actual
         # parser type during parsing?
-        if old_results is None:
+        old_result = self._get_cached_result(block, old_results)
+        if old_result is None:
             return False
-        if old_results.has_file(block.file):
-            return self.results.sanitized_update(
-                block.file, old_results, parser.resource_type
-            )
-        return False
+        return self.results.sanitized_update(
+            block.file, old_result, parser.resource_type
+        )
+
+    def _get_cached_result(
+        self, block: FileBlock, old_results: Optional[ParseCache]
+    ) -> Optional[ParseResult]:
+        if old_results is None:
+            return None
+        return old_results.get_file_result(block.file, self.dependencies)
 
     def _get_file(self, path: FilePath, parser: BaseParser) -> FileBlock:
         if path.search_key in self._loaded_file_cache:
@@ -169,7 +305,8 @@ class ManifestLoader:
         self,
         project: Project,
         macro_manifest: Manifest,
-        old_results: Optional[ParseResult],
+        old_results: Optional[ParseCache],
+        pool: Optional[Any] = None,
     ) -> None:
         parsers: List[Parser] = []
         for cls in _parser_types:
@@ -180,13 +317,61 @@ class ManifestLoader:
         # per-project cache.
         self._loaded_file_cache.clear()
 
+        if pool is not None:
+            self._parse_project_in_pool(project, parsers, old_results, pool)
+            return
+
         for parser in parsers:
             for path in parser.search():
                 self.parse_with_cache(path, parser, old_results)
 
+    def _parse_project_in_pool(
+        self,
+        project: Project,
+        parsers: List[Parser],
+        old_results: Optional[ParseCache],
+        pool: Any,
+    ) -> None:
+        """Parse every file that isn't cached in the pool's worker processes,
+        then merge the results in the order parse_project would have parsed
+        the files in. That way, duplicates and errors are reported exactly as
+        if the files were parsed one after another.
+        """
+        blocks: List[Tuple[Parser, FileBlock, Optional[ParseResult]]] = []
+        units: List[ParseUnit] = []
+        for index, parser in enumerate(parsers):
+            for path in parser.search():
+                block = self._get_file(path, parser)
+                cached = self._get_cached_result(block, old_results)
+                blocks.append((parser, block, cached))
+                # files without a search key can't be matched up with their
+                # parsed copy, so those are parsed here
+                if cached is None and block.file.search_key is not None:
+                    units.append((project.project_name, index, block))
+
+        chunksize = max(1, len(units) // (self._parse_workers() * 4))
+        parsed = pool.imap(_parse_in_worker, units, chunksize=chunksize)
+        for parser, block, file_result in blocks:
+            if file_result is None and block.file.search_key is not None:
+                file_result = next(parsed)
+            if file_result is None:
+                with parse_dependencies.recording(block.file):
+                    parser.parse_file(block)
+                continue
+            if block.file.search_key in file_result.files:
+                # mark the file as seen, as the parser did
+                self.results.get_file(block.file)
+            self.results.sanitized_update(
+                block.file, file_result, parser.resource_type
+            )
+
     def load_only_macros(self) -> Manifest:
         old_results = self.read_parse_results()
-        self._load_macros(old_results, internal_manifest=None)
+        try:
+            self._load_macros(old_results, internal_manifest=None)
+        finally:
+            if old_results is not None:
+                old_results.close()
         # make a manifest with just the macros to get the context
         macro_manifest = Manifest.from_macros(
             macros=self.results.macros,
@@ -195,9 +380,22 @@ class ManifestLoader:
         return macro_manifest
 
     def load(self, internal_manifest: Optional[Manifest] = None):
+        set_bytecode_cache(self.root_project)
         old_results = self.read_parse_results()
         if old_results is not None:
             logger.debug('Got an acceptable cached parse result')
+        try:
+            self._load_with_cache(old_results, internal_manifest)
+        finally:
+            # the cache reads each file's results from disk as it goes
+            if old_results is not None:
+                old_results.close()
+
+    def _load_with_cache(
+        self,
+        old_results: Optional[ParseCache],
+        internal_manifest: Optional[Manifest],
+    ) -> None:
         self._load_macros(old_results, internal_manifest=internal_manifest)
         # make a manifest with just the macros to get the context
         macro_manifest = Manifest.from_macros(
@@ -206,16 +404,29 @@ class ManifestLoader:
         )
         self.macro_hook(macro_manifest)
 
-        for project in self.all_projects.values():
-            # parse a single project
-            self.parse_project(project, macro_manifest, old_results)
+        workers = self._parse_workers()
+        if workers == 1:
+            for project in self.all_projects.values():
+                # parse a single project
+                self.parse_project(project, macro_manifest, old_results)
+            return
+
+        logger.debug('Parsing with {} worker processes'.format(workers))
+        with dbt.flags.MP_CONTEXT.Pool(
+            processes=workers,
+            initializer=_init_parse_worker,
+            initargs=(self.root_project, self.all_projects, macro_manifest),
+        ) as pool:
+            for project in self.all_projects.values():
+                self.parse_project(
+                    project, macro_manifest, old_results, pool=pool
+                )
 
     def write_parse_results(self):
         path = os.path.join(self.root_project.target_path,
                             PARTIAL_PARSE_FILE_NAME)
         make_directory(self.root_project.target_path)
-        with open(path, 'wb') as fp:
-            pickle.dump(self.results, fp)
+        ParseCache.write(path, self.results, self.dependencies)
 
     def matching_parse_results(self, result: ParseResult) -> bool:
         """Compare the global hashes of the read-in parse results' values to
@@ -265,16 +476,14 @@ class ManifestLoader:
         return valid
 
     def _partial_parse_enabled(self):
-        # if the CLI is set, follow that
-        if dbt.flags.PARTIAL_PARSE is not None:
-            return dbt.flags.PARTIAL_PARSE
-        # if the config is set, follow that
-        elif self.root_project.config.partial_parse is not None:
-            return self.root_project.config.partial_parse
-        else:
-            return DEFAULT_PARTIAL_PARSE
+        return _partial_parse_enabled(self.root_project)
+
+    def _parse_workers(self) -> int:
+        if dbt.flags.PARSE_WORKERS is not None:
+            return max(1, dbt.flags.PARSE_WORKERS)
+        return DEFAULT_PARSE_WORKERS
 
-    def read_parse_results(self) -> Optional[ParseResult]:
+    def read_parse_results(self) -> Optional[ParseCache]:
         if not self._partial_parse_enabled():
             logger.debug('Partial parsing not enabled')
             return None
@@ -282,28 +491,28 @@ class ManifestLoader:
                             PARTIAL_PARSE_FILE_NAME)
 
         if os.path.exists(path):
+            cache: Optional[ParseCache] = None
             try:
-                with open(path, 'rb') as fp:
-                    result: ParseResult = pickle.load(fp)
+                cache = ParseCache.read(path)
                 # keep this check inside the try/except in case something about
                 # the file has changed in weird ways, perhaps due to being a
                 # different version of dbt
-                if self.matching_parse_results(result):
-                    return result
+                if cache is not None and \
+                        self.matching_parse_results(cache.header):
+                    return cache
             except Exception as exc:
                 logger.debug(
                     'Failed to load parsed file from disk at {}: {}'
                     .format(path, exc),
                     exc_info=True
                 )
+            if cache is not None:
+                cache.close()
 
         return None
 
     def process_manifest(self, manifest: Manifest):
-        project_name = self.root_project.project_name
-        process_sources(manifest, project_name)
-        process_refs(manifest, project_name)
-        process_docs(manifest, self.root_project)
+        process_manifest(manifest, self.root_project)
 
     def create_manifest(self) -> Manifest:
         # before we do anything else, patch the sources. This mutates
@@ -330,6 +539,7 @@ class ManifestLoader:
         )
         manifest.patch_nodes(self.results.patches)
         manifest.patch_macros(self.results.macro_patches)
+        manifest.build_name_indexes()
         self.process_manifest(manifest)
         return manifest
 
@@ -357,6 +567,14 @@ class ManifestLoader:
             manifest = loader.create_manifest()
             _check_manifest(manifest, root_config)
             manifest.build_flat_graph()
+            logger.debug(
+                'Rendered {} strings so far, {} of them without jinja'
+                .format(render_counter.total, render_counter.static)
+            )
+            logger.debug(
+                'Parsed {} models so far, {} of them without rendering'
+                .format(model_parse_counter.total, model_parse_counter.static)
+            )
             return manifest
 
     @classmethod
@@ -481,30 +699,19 @@ def _process_docs_for_macro(
 
 
 def process_docs(manifest: Manifest, config: RuntimeConfig):
+    docs_contexts = DocsContexts(config, manifest, config.project_name)
     for node in manifest.nodes.values():
-        ctx = generate_runtime_docs(
-            config,
-            node,
-            manifest,
-            config.project_name,
-        )
-        _process_docs_for_node(ctx, node)
+        _process_docs_for_node(docs_contexts.get(node), node)
+    _process_docs_for_sources_and_macros(manifest, docs_contexts)
+
+
+def _process_docs_for_sources_and_macros(
+    manifest: Manifest, docs_contexts: DocsContexts
+) -> None:
     for source in manifest.sources.values():
-        ctx = generate_runtime_docs(
-            config,
-            source,
-            manifest,
-            config.project_name,
-        )
-        _process_docs_for_source(ctx, source)
+        _process_docs_for_source(docs_contexts.get(source), source)
     for macro in manifest.macros.values():
-        ctx = generate_runtime_docs(
-            config,
-            macro,
-            manifest,
-            config.project_name,
-        )
-        _process_docs_for_macro(ctx, macro)
+        _process_docs_for_macro(docs_contexts.get(macro), macro)
 
 
 def _process_refs_for_node(
@@ -546,10 +753,6 @@ def _process_refs_for_node(
         target_model_id = target_model.unique_id
 
         node.depends_on.nodes.append(target_model_id)
-        # TODO: I think this is extraneous, node should already be the same
-        # as manifest.nodes[node.unique_id] (we're mutating node here, not
-        # making a new one)
-        manifest.update_node(node)
 
 
 def process_refs(manifest: Manifest, current_project: str):
@@ -582,7 +785,6 @@ def _process_sources_for_node(
             continue
         target_source_id = target_source.unique_id
         node.depends_on.nodes.append(target_source_id)
-        manifest.update_node(node)
 
 
 def process_sources(manifest: Manifest, current_project: str):
@@ -594,6 +796,21 @@ def process_sources(manifest: Manifest, current_project: str):
     return manifest
 
 
+def process_manifest(manifest: Manifest, config: RuntimeConfig) -> None:
+    """Resolve the sources, refs and docs of everything in the manifest, in a
+    single pass over the nodes.
+    """
+    current_project = config.project_name
+    docs_contexts = DocsContexts(config, manifest, current_project)
+    for node in manifest.nodes.values():
+        if node.resource_type != NodeType.Source:
+            assert not isinstance(node, ParsedSourceDefinition)
+            _process_sources_for_node(manifest, current_project, node)
+        _process_refs_for_node(manifest, current_project, node)
+        _process_docs_for_node(docs_contexts.get(node), node)
+    _process_docs_for_sources_and_macros(manifest, docs_contexts)
+
+
 def process_macro(
     config: RuntimeConfig, manifest: Manifest, macro: ParsedMacro
 ) -> None:
@@ -618,6 +835,114 @@ def process_node(
     _process_docs_for_node(ctx, node)
 
 
+def _get_node_parser(
+    config: RuntimeConfig,
+    project: Project,
+    manifest: Manifest,
+    results: ParseResult,
+    source_file: SourceFile,
+) -> Optional[Parser]:
+    if isinstance(source_file.path, RemoteFile) or not source_file.nodes:
+        return None
+    resource_type = source_file.nodes[0].split('.')[0]
+    for cls in _node_parser_types:
+        parser = cls(results, project, config, manifest)
+        if parser.resource_type != resource_type:
+            continue
+        searcher = parser.get_paths()
+        if not isinstance(searcher, FilesystemSearcher):
+            continue
+        path = source_file.path
+        if (
+            path.searched_path in searcher.relative_dirs and
+            path.relative_path.endswith(searcher.extension)
+        ):
+            return parser
+    return None
+
+
+def _only_defines_nodes(source_file: SourceFile, manifest: Manifest) -> bool:
+    if source_file.docs or source_file.macros or source_file.sources:
+        return False
+    if source_file.patches or source_file.macro_patches:
+        return False
+    if source_file.source_patches:
+        return False
+    # disabled nodes can be enabled by a change, and the other way around
+    return all(node_id in manifest.nodes for node_id in source_file.nodes)
+
+
+def reparse_node_files(
+    config: RuntimeConfig, manifest: Manifest, paths: Iterable[str]
+) -> Optional[Manifest]:
+    """Parse the files at the given absolute paths again, and return a copy
+    of the manifest with their nodes replaced. The manifest itself is not
+    changed.
+
+    This only works for files that define nodes and nothing else, and still
+    define the same nodes: that way nothing else in the manifest can be
+    affected. If any of the files doesn't qualify, return None, and load the
+    whole manifest again instead.
+    """
+    projects = config.load_dependencies()
+    results = ParseResult.rpc()
+    files = dict(manifest.files)
+    nodes = dict(manifest.nodes)
+    with PARSING_STATE:
+        for path in paths:
+            old_file = manifest.files.get(path)
+            if old_file is None or not _only_defines_nodes(old_file, manifest):
+                return None
+            package_name = manifest.nodes[old_file.nodes[0]].package_name
+            project = projects.get(package_name)
+            if project is None:
+                return None
+            parser = _get_node_parser(
+                config, project, manifest, results, old_file
+            )
+            if parser is None:
+                return None
+            assert not isinstance(old_file.path, RemoteFile)
+            block = FileBlock(file=parser.load_file(old_file.path))
+            with parse_dependencies.recording(block.file):
+                parser.parse_file(block)
+            new_file = results.get_file(block.file)
+            if results.disabled or set(new_file.nodes) != set(old_file.nodes):
+                return None
+            files[path] = new_file
+            for node_id in new_file.nodes:
+                node = results.nodes[node_id]
+                old_node = manifest.nodes[node_id]
+                if old_node.patch_path is not None:
+                    # the patch and the docs it uses have not changed, so
+                    # neither has what they did to the node
+                    node.patch_path = old_node.patch_path
+                    node.description = old_node.description
+                    node.columns = old_node.columns
+                    node.meta = old_node.meta
+                    node.docs = old_node.docs
+                nodes[node_id] = node
+
+    new_manifest = Manifest(
+        nodes=nodes,
+        sources=manifest.sources,
+        macros=manifest.macros,
+        docs=manifest.docs,
+        generated_at=datetime.utcnow(),
+        metadata=manifest.metadata,
+        disabled=manifest.disabled,
+        files=files,
+    )
+    new_manifest.build_name_indexes()
+    for node_id in results.nodes:
+        node = nodes[node_id]
+        _process_sources_for_node(new_manifest, config.project_name, node)
+        _process_refs_for_node(new_manifest, config.project_name, node)
+    _check_resource_uniqueness(new_manifest)
+    new_manifest.build_flat_graph()
+    return new_manifest
+
+
 def load_internal_projects(config):
     return dict(_load_projects(config, internal_project_names()))
 
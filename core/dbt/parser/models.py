@@ -1,10 +1,124 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+import jinja2
+import jinja2.nodes
+
+from dbt.clients.jinja import get_environment, RenderCounter
+from dbt.config import Project, RuntimeConfig
+from dbt.context.context_config import ContextConfigType
+from dbt.context.providers import ParseConfigObject
+from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.parsed import ParsedModelNode
 from dbt.node_types import NodeType
 from dbt.parser.base import SimpleSQLParser
+from dbt.parser.results import ParseResult
 from dbt.parser.search import FilesystemSearcher, FileBlock
 
 
+# the context members that can be applied to a model without rendering it
+STATIC_CALLS = frozenset(('ref', 'source', 'config'))
+
+# counts how many models were parsed statically vs. by rendering them
+model_parse_counter = RenderCounter()
+
+StaticCall = Tuple[str, List[Any], Dict[str, Any]]
+
+
+# the jinja2 stubs don't describe the fields of each node type, so the nodes
+# are handled as Any once their type is known
+def _is_literal(node: jinja2.nodes.Node) -> bool:
+    fields: Any = node
+    if isinstance(node, jinja2.nodes.Const):
+        return True
+    if isinstance(node, (jinja2.nodes.List, jinja2.nodes.Tuple)):
+        return all(_is_literal(item) for item in fields.items)
+    if isinstance(node, jinja2.nodes.Dict):
+        return all(
+            _is_literal(pair.key) and _is_literal(pair.value)
+            for pair in fields.items
+        )
+    return False
+
+
+def _static_call(call: jinja2.nodes.Node) -> Optional[StaticCall]:
+    if not isinstance(call, jinja2.nodes.Call):
+        return None
+    node: Any = call
+    target: Any = node.node
+    if not isinstance(target, jinja2.nodes.Name):
+        return None
+    name: str = node.node.name
+    if name not in STATIC_CALLS:
+        return None
+    if node.dyn_args is not None or node.dyn_kwargs is not None:
+        return None
+    if not all(_is_literal(arg) for arg in node.args):
+        return None
+    if not all(_is_literal(kwarg.value) for kwarg in node.kwargs):
+        return None
+
+    args = [arg.as_const() for arg in node.args]
+    kwargs = {kwarg.key: kwarg.value.as_const() for kwarg in node.kwargs}
+    # anything unusual is left for rendering, so it reports the same errors
+    if name == 'config':
+        if kwargs and not args:
+            return name, args, kwargs
+        if len(args) == 1 and not kwargs and isinstance(args[0], dict):
+            return name, args, kwargs
+        return None
+    if kwargs or not all(isinstance(arg, str) for arg in args):
+        return None
+    if name == 'ref' and len(args) not in (1, 2):
+        return None
+    if name == 'source' and len(args) != 2:
+        return None
+    return name, args, kwargs
+
+
+def extract_static_calls(source: str) -> Optional[List[StaticCall]]:
+    """If the only jinja in the given sql is calls to ref(), source() and
+    config() with literal arguments, return those calls in the order they
+    would be rendered. Otherwise, return None.
+    """
+    # any statement means control flow, assignments, blocks, etc.
+    if '{%' in source:
+        return None
+    try:
+        template = get_environment(capture_macros=True).parse(source)
+    except jinja2.TemplateSyntaxError:
+        return None
+
+    calls: List[StaticCall] = []
+    for output in template.body:
+        if not isinstance(output, jinja2.nodes.Output):
+            return None
+        nodes: Any = output
+        for node in nodes.nodes:
+            if isinstance(node, jinja2.nodes.TemplateData):
+                continue
+            call = _static_call(node)
+            if call is None:
+                return None
+            calls.append(call)
+    return calls
+
+
 class ModelParser(SimpleSQLParser[ParsedModelNode]):
+    def __init__(
+        self,
+        results: ParseResult,
+        project: Project,
+        root_project: RuntimeConfig,
+        macro_manifest: Manifest,
+    ) -> None:
+        super().__init__(results, project, root_project, macro_manifest)
+        # a macro with the same name as one of the static calls replaces it
+        # in the context, and then only rendering can tell what it does
+        self._static_parse = not any(
+            macro.name in STATIC_CALLS
+            for macro in macro_manifest.macros.values()
+        )
+
     def get_paths(self):
         return FilesystemSearcher(
             self.project, self.project.source_paths, '.sql'
@@ -20,3 +134,38 @@ class ModelParser(SimpleSQLParser[ParsedModelNode]):
     @classmethod
     def get_compiled_path(cls, block: FileBlock):
         return block.path.relative_path
+
+    def _apply_static_calls(
+        self,
+        parsed_node: ParsedModelNode,
+        config: ContextConfigType,
+        calls: List[StaticCall],
+    ) -> None:
+        """Do what the parse-time ref(), source() and config() would have
+        done.
+        """
+        for name, args, kwargs in calls:
+            if name == 'ref':
+                parsed_node.refs.append(args)
+            elif name == 'source':
+                parsed_node.sources.append(args)
+            else:
+                ParseConfigObject(parsed_node, config)(*args, **kwargs)
+
+    def render_with_context(
+        self, parsed_node: ParsedModelNode, config: ContextConfigType
+    ) -> None:
+        """Most models only call ref(), source() and config() with literal
+        arguments. Those can be read from the template itself, which avoids
+        acquiring a connection, building a context and rendering the sql.
+        """
+        calls: Optional[List[StaticCall]] = None
+        if self._static_parse:
+            calls = extract_static_calls(parsed_node.raw_sql)
+
+        if calls is None:
+            model_parse_counter.add(static=False)
+            super().render_with_context(parsed_node, config)
+        else:
+            model_parse_counter.add(static=True)
+            self._apply_static_calls(parsed_node, config, calls)
@@ -0,0 +1,256 @@
+import json
+import os
+import pickle
+import tempfile
+from typing import Dict, Any, Optional, Mapping, List, BinaryIO
+
+from dbt.config import Project, RuntimeConfig
+from dbt.contracts.graph.manifest import SourceFile, FileHash
+from dbt.logger import GLOBAL_LOGGER as logger
+from dbt.parser.results import ParseResult
+
+
+# bump this whenever the layout of the cache file changes
+PARSE_CACHE_FORMAT = 1
+
+
+class DependencyValues:
+    """The current values of the vars and environment variables a file can
+    read while it is parsed.
+
+    Vars are compared by a digest of every definition of the var: the
+    --vars value and each v2 project's global and package-scoped value. Vars
+    in v1 projects are part of the model configs, so changing them changes
+    the project hash instead.
+    """
+    def __init__(
+        self, config: RuntimeConfig, all_projects: Mapping[str, Project]
+    ) -> None:
+        self.config = config
+        self.all_projects = all_projects
+        self._var_digests: Dict[str, str] = {}
+
+    def _var_definitions(self, name: str) -> Dict[str, Any]:
+        definitions: Dict[str, Any] = {}
+        if name in self.config.cli_vars:
+            definitions['--vars'] = self.config.cli_vars[name]
+        for project_name, project in self.all_projects.items():
+            if project.config_version != 2:
+                continue
+            for scope, value in project.vars.to_dict().items():
+                if scope == name:
+                    definitions[project_name] = value
+                elif isinstance(value, dict) and name in value:
+                    definitions[f'{project_name}.{scope}'] = value[name]
+        return definitions
+
+    def var_digest(self, name: str) -> str:
+        if name not in self._var_digests:
+            contents = json.dumps(
+                self._var_definitions(name), sort_keys=True, default=str
+            )
+            digest = FileHash.from_contents(contents).checksum
+            self._var_digests[name] = digest
+        return self._var_digests[name]
+
+    def env_var_value(self, name: str) -> Optional[str]:
+        return os.environ.get(name)
+
+    def for_file(self, source_file: SourceFile) -> Dict[str, Any]:
+        return {
+            'vars': {
+                name: self.var_digest(name)
+                for name in sorted(source_file.vars)
+            },
+            'env_vars': {
+                name: self.env_var_value(name)
+                for name in sorted(source_file.env_vars)
+            },
+        }
+
+    def changed(self, recorded: Dict[str, Any]) -> Optional[str]:
+        """Return a description of the first recorded var or environment
+        variable whose value has changed, or None if they are all the same.
+        """
+        for name, digest in recorded['vars'].items():
+            if self.var_digest(name) != digest:
+                return f'var "{name}"'
+        for name, value in recorded['env_vars'].items():
+            if self.env_var_value(name) != value:
+                return f'env var "{name}"'
+        return None
+
+
+def _result_for_file(
+    result: ParseResult, source_file: SourceFile
+) -> ParseResult:
+    """Build a ParseResult holding only what was parsed out of the given
+    file.
+    """
+    file_result = ParseResult(
+        vars_hash=result.vars_hash,
+        profile_hash=result.profile_hash,
+        project_hashes={},
+    )
+    path = source_file.path.original_file_path
+    key = source_file.search_key
+    # files without a search key are never cached
+    assert key is not None
+    file_result.files[key] = source_file
+    for node_id in source_file.nodes:
+        node = result.nodes.get(node_id)
+        if node is not None and node.original_file_path == path:
+            file_result.nodes[node_id] = node
+        for disabled in result.disabled.get(node_id, []):
+            if disabled.original_file_path == path:
+                file_result.add_disabled_nofile(disabled)
+    for source_id in source_file.sources:
+        file_result.sources[source_id] = result.sources[source_id]
+    for doc_id in source_file.docs:
+        file_result.docs[doc_id] = result.docs[doc_id]
+    for macro_id in source_file.macros:
+        file_result.macros[macro_id] = result.macros[macro_id]
+    for name in source_file.patches:
+        file_result.patches[name] = result.patches[name]
+    for macro_key in source_file.macro_patches:
+        file_result.macro_patches[macro_key] = result.macro_patches[macro_key]
+    for source_key in source_file.source_patches:
+        file_result.source_patches[source_key] = \
+            result.source_patches[source_key]
+    return file_result
+
+
+class ParseCache:
+    """A parse result stored one file at a time.
+
+    The file starts with a single line of json, holding the global hashes and
+    an index of the cached files: each file's checksum, the vars and
+    environment variables it read, and where its parsed values are stored.
+    The rest of the file is a pickled ParseResult per file, which is only
+    read and unpickled when that file is unchanged. The file stays open for
+    that until the cache is closed.
+    """
+    def __init__(
+        self,
+        header: ParseResult,
+        entries: Dict[str, Dict[str, Any]],
+        fp: BinaryIO,
+    ) -> None:
+        self.header = header
+        self.entries = entries
+        self._fp = fp
+        # where the pickled results start
+        self._data_offset = fp.tell()
+        self._results: Dict[str, ParseResult] = {}
+
+    @classmethod
+    def read(cls, path: str) -> Optional['ParseCache']:
+        fp = open(path, 'rb')
+        try:
+            header = json.loads(fp.readline())
+            if header.get('format') != PARSE_CACHE_FORMAT:
+                logger.debug(
+                    'Parse cache format mismatch: {} != {}, cache invalidated'
+                    .format(header.get('format'), PARSE_CACHE_FORMAT)
+                )
+                fp.close()
+                return None
+            project_hashes = {
+                name: FileHash.from_dict(value)
+                for name, value in header['project_hashes'].items()
+            }
+            result = ParseResult(
+                vars_hash=FileHash.from_dict(header['vars_hash']),
+                profile_hash=FileHash.from_dict(header['profile_hash']),
+                project_hashes=project_hashes,
+                dbt_version=header['dbt_version'],
+            )
+            return cls(
+                header=result,
+                entries=header['files'],
+                fp=fp,
+            )
+        except BaseException:
+            fp.close()
+            raise
+
+    def close(self) -> None:
+        self._fp.close()
+
+    @staticmethod
+    def write(
+        path: str, result: ParseResult, dependencies: DependencyValues
+    ) -> None:
+        entries: Dict[str, Dict[str, Any]] = {}
+        blobs: List[bytes] = []
+        offset = 0
+        for key, source_file in result.files.items():
+            if source_file.search_key is None:
+                continue
+            blob = pickle.dumps(
+                _result_for_file(result, source_file),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+            entries[key] = {
+                'checksum': source_file.checksum.to_dict(),
+                'dependencies': dependencies.for_file(source_file),
+                'offset': offset,
+                'length': len(blob),
+            }
+            blobs.append(blob)
+            offset += len(blob)
+
+        header = {
+            'format': PARSE_CACHE_FORMAT,
+            'dbt_version': result.dbt_version,
+            'vars_hash': result.vars_hash.to_dict(),
+            'profile_hash': result.profile_hash.to_dict(),
+            'project_hashes': {
+                name: value.to_dict()
+                for name, value in result.project_hashes.items()
+            },
+            'files': entries,
+        }
+        # write to a temporary file and move it into place, so an interrupted
+        # write never leaves a truncated cache behind
+        directory = os.path.dirname(path)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                fp.write(json.dumps(header).encode('utf-8'))
+                fp.write(b'\n')
+                for blob in blobs:
+                    fp.write(blob)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def get_file_result(
+        self, source_file: SourceFile, dependencies: DependencyValues
+    ) -> Optional[ParseResult]:
+        """Return the cached result for the given file if neither its contents
+        nor the vars and environment variables it read have changed.
+        """
+        key = source_file.search_key
+        if key is None or key not in self.entries:
+            return None
+        if key in self._results:
+            return self._results[key]
+
+        entry = self.entries[key]
+        if FileHash.from_dict(entry['checksum']) != source_file.checksum:
+            return None
+        changed = dependencies.changed(entry['dependencies'])
+        if changed is not None:
+            logger.debug(
+                'Parsing {} again: {} changed'
+                .format(source_file.path.original_file_path, changed)
+            )
+            return None
+
+        self._fp.seek(self._data_offset + entry['offset'])
+        blob = self._fp.read(entry['length'])
+        result: ParseResult = pickle.loads(blob)
+        self._results[key] = result
+        return result
@@ -236,6 +236,9 @@ class ParseResult(JsonSchemaMixin, Writable, Replaceable):
             return False
 
         old_file = old_result.get_file(source_file)
+        # the file was not parsed again, so keep what it read last time
+        source_file.vars = list(old_file.vars)
+        source_file.env_vars = list(old_file.env_vars)
         for doc_id in old_file.docs:
             doc = _expect_value(doc_id, old_result.docs, old_file, "docs")
             self.add_doc(source_file, doc)
@@ -284,6 +287,16 @@ class ParseResult(JsonSchemaMixin, Writable, Replaceable):
         if macro_patched:
             self.get_file(source_file).macro_patches.sort()
 
+        source_patched = False
+        for key in old_file.source_patches:
+            source_patch = _expect_value(
+                key, old_result.source_patches, old_file, "source_patches"
+            )
+            self.add_source_patch(source_file, source_patch)
+            source_patched = True
+        if source_patched:
+            self.get_file(source_file).source_patches.sort()
+
         return True
 
     def has_file(self, source_file: SourceFile) -> bool:
@@ -12,10 +12,7 @@ from dbt.adapters.factory import get_adapter
 from dbt.clients.jinja import get_rendered, add_rendered_test_kwargs
 from dbt.clients.yaml_helper import load_yaml_text
 from dbt.config.renderer import SchemaYamlRenderer
-from dbt.context.context_config import (
-    ContextConfigType,
-    ContextConfigGenerator,
-)
+from dbt.context.context_config import ContextConfigType
 from dbt.context.configured import generate_schema_yml
 from dbt.context.target import generate_target_context
 from dbt.contracts.graph.manifest import SourceFile
@@ -33,6 +30,7 @@ from dbt.contracts.graph.unparsed import (
     UnparsedMacroUpdate, UnparsedAnalysisUpdate, SourcePatch,
     HasDocs, HasColumnDocs, HasColumnTests, FreshnessThreshold,
 )
+from dbt.contracts.util import should_validate
 from dbt.exceptions import (
     validator_error_message, JSONValidationException,
     raise_invalid_schema_yml_version, ValidationException,
@@ -151,7 +149,6 @@ class SchemaParser(SimpleParser[SchemaTestBlock, ParsedSchemaTestNode]):
             )
 
         self.raw_renderer = SchemaYamlRenderer(ctx)
-        self.config_generator = ContextConfigGenerator(self.root_project)
 
     @classmethod
     def get_compiled_path(cls, block: FileBlock) -> str:
@@ -322,7 +319,7 @@ class SchemaParser(SimpleParser[SchemaTestBlock, ParsedSchemaTestNode]):
             'column_name': column_name,
         }
         try:
-            return self.parse_from_dict(dct)
+            return self.parse_from_dict(dct, validate=should_validate())
         except ValidationError as exc:
             msg = validator_error_message(exc)
             # this is a bit silly, but build an UnparsedNode just for error
@@ -27,6 +27,11 @@ The general idea from a thread/process management perspective (ignoring the
     - When the thread sees that the process has disappeared without placing
       anything on the queue, it checks the queue one last time, and then acts
       as if the queue received an 'Unexpected termination' error
+- With `--worker-pool-size`, the process is instead a long-lived pool worker
+  (see `worker_pool`) that already holds the manifest. It is sent the task,
+  runs it like a new process would, and then waits for the next one.
+  With `--connection-pool-size` as well, the worker keeps its database
+  connections open between tasks.
 - `kill` commands pointed at an asynchronous task kill the process and allow
   the thread to handle cleanup and management
 - When the RPC server receives a shutdown instruction, it:
@@ -6,6 +6,7 @@ from hologram import JsonSchemaMixin, ValidationError
 
 from dbt.contracts.rpc import RPCParameters, RemoteResult, RemoteMethodFlags
 from dbt.exceptions import NotImplementedException, InternalException
+from dbt.linker import Linker
 
 Parameters = TypeVar('Parameters', bound=RPCParameters)
 Result = TypeVar('Result', bound=RemoteResult)
@@ -92,6 +93,8 @@ class RemoteManifestMethod(RemoteMethod[Parameters, Result]):
     def __init__(self, args, config, manifest):
         super().__init__(args, config)
         self.manifest = manifest
+        # the graph the task manager linked when it loaded the manifest
+        self.manifest_linker: Optional[Linker] = None
 
 
 class RemoteBuiltinMethod(RemoteMethod[Parameters, Result]):
@@ -29,7 +29,9 @@ from dbt.rpc.error import (
     RPCException,
     timeout_error,
 )
-from dbt.rpc.task_handler_protocol import TaskHandlerProtocol
+from dbt.rpc.task_handler_protocol import (
+    PooledProcessProtocol, TaskHandlerProtocol, TaskProcessProtocol,
+)
 from dbt.rpc.logger import (
     QueueSubscriber,
     QueueLogHandler,
@@ -49,6 +51,75 @@ def sigterm_handler(signum, frame):
     raise dbt.exceptions.RPCKilledException(signum)
 
 
+def spawn_setup(args, config) -> None:
+    """
+    Because we're using spawn, we have to do a some things that dbt does
+    dynamically at process load.
+
+    These things are inherited automatically in fork mode, where fork()
+    keeps everything in memory.
+    """
+    # reset flags
+    dbt.flags.set_from_args(args)
+    # reload the active plugin
+    load_plugin(config.credentials.type)
+    # register it
+    register_adapter(config)
+
+    # reset tracking, etc
+    config.config.set_values(args.profiles_dir)
+
+
+def task_exec(
+    task: RemoteMethod,
+    queue,  # typing: Queue[Tuple[QueueMessageType, Any]]
+) -> bool:
+    """Run the task in this process, sending its logs and then its result or
+    error over the queue. Returns True if the task was killed.
+    """
+    signal.signal(signal.SIGTERM, sigterm_handler)
+    # the first thing we do in a new process: push logging back over our
+    # queue
+    handler = QueueLogHandler(queue)
+    with handler.applicationbound():
+        spawn_setup(task.args, task.config)
+        # copy threads over into our credentials, if it exists and is set.
+        # some commands, like 'debug', won't have a threads value at all.
+        if getattr(task.args, 'threads', None) is not None:
+            task.config.threads = task.args.threads
+        rpc_exception = None
+        result = None
+        killed = False
+        try:
+            result = task.handle_request()
+        except RPCException as exc:
+            rpc_exception = exc
+        except dbt.exceptions.RPCKilledException as exc:
+            # do NOT log anything here, you risk triggering a deadlock on
+            # the queue handler we inserted above
+            rpc_exception = dbt_error(exc)
+            killed = True
+        except dbt.exceptions.Exception as exc:
+            logger.debug('dbt runtime exception', exc_info=True)
+            rpc_exception = dbt_error(exc)
+        except Exception as exc:
+            with OutputHandler(sys.stderr).applicationbound():
+                logger.error('uncaught python exception', exc_info=True)
+            rpc_exception = server_error(exc)
+
+        # put whatever result we got onto the queue as well.
+        if rpc_exception is not None:
+            handler.emit_error(rpc_exception.error)
+        elif result is not None:
+            handler.emit_result(result)
+        else:
+            error = dbt_error(InternalException(
+                'after request handling, neither result nor error is None!'
+            ))
+            handler.emit_error(error.error)
+    return killed
+
+
 class BootstrapProcess(dbt.flags.MP_CONTEXT.Process):
     def __init__(
         self,
@@ -59,64 +130,9 @@ class BootstrapProcess(dbt.flags.MP_CONTEXT.Process):
         self.queue = queue
         super().__init__()
 
-    def _spawn_setup(self):
-        """
-        Because we're using spawn, we have to do a some things that dbt does
-        dynamically at process load.
-
-        These things are inherited automatically in fork mode, where fork()
-        keeps everything in memory.
-        """
-        # reset flags
-        dbt.flags.set_from_args(self.task.args)
-        # reload the active plugin
-        load_plugin(self.task.config.credentials.type)
-        # register it
-        register_adapter(self.task.config)
-
-        # reset tracking, etc
-        self.task.config.config.set_values(self.task.args.profiles_dir)
-
     def task_exec(self) -> None:
         """task_exec runs first inside the child process"""
-        signal.signal(signal.SIGTERM, sigterm_handler)
-        # the first thing we do in a new process: push logging back over our
-        # queue
-        handler = QueueLogHandler(self.queue)
-        with handler.applicationbound():
-            self._spawn_setup()
-            # copy threads over into our credentials, if it exists and is set.
-            # some commands, like 'debug', won't have a threads value at all.
-            if getattr(self.task.args, 'threads', None) is not None:
-                self.task.config.threads = self.task.args.threads
-            rpc_exception = None
-            result = None
-            try:
-                result = self.task.handle_request()
-            except RPCException as exc:
-                rpc_exception = exc
-            except dbt.exceptions.RPCKilledException as exc:
-                # do NOT log anything here, you risk triggering a deadlock on
-                # the queue handler we inserted above
-                rpc_exception = dbt_error(exc)
-            except dbt.exceptions.Exception as exc:
-                logger.debug('dbt runtime exception', exc_info=True)
-                rpc_exception = dbt_error(exc)
-            except Exception as exc:
-                with OutputHandler(sys.stderr).applicationbound():
-                    logger.error('uncaught python exception', exc_info=True)
-                rpc_exception = server_error(exc)
-
-            # put whatever result we got onto the queue as well.
-            if rpc_exception is not None:
-                handler.emit_error(rpc_exception.error)
-            elif result is not None:
-                handler.emit_result(result)
-            else:
-                error = dbt_error(InternalException(
-                    'after request handling, neither result nor error is None!'
-                ))
-                handler.emit_error(error.error)
+        task_exec(self.task, self.queue)
 
     def run(self):
         self.task_exec()
@@ -145,6 +161,11 @@ class TaskManagerProtocol(Protocol):
     def reload_config(self):
         pass
 
+    def get_pooled_process(
+        self, task: RemoteMethod
+    ) -> Optional[PooledProcessProtocol]:
+        pass
+
 
 @contextmanager
 def set_parse_state_with(
@@ -270,7 +291,7 @@ class RequestTaskHandler(threading.Thread, TaskHandlerProtocol):
         self.http_request = http_request
         self.json_rpc_request = json_rpc_request
         self.subscriber: Optional[QueueSubscriber] = None
-        self.process: Optional[BootstrapProcess] = None
+        self.process: Optional[TaskProcessProtocol] = None
         self.thread: Optional[threading.Thread] = None
         self.started: Optional[datetime] = None
         self.ended: Optional[datetime] = None
@@ -411,11 +432,11 @@ class RequestTaskHandler(threading.Thread, TaskHandlerProtocol):
         # `run`, not `start`, and return an actual result.
         # note this shouldn't call self.run() as that has different semantics
         # (we want errors to raise)
-        if self.process is None:  # mypy appeasement
+        if self.subscriber is None:  # mypy appeasement
             raise InternalException(
-                'Cannot run a None process'
+                'Cannot run a task without a queue'
             )
-        self.process.task_exec()
+        task_exec(self.task, self.subscriber.queue)
         with StateHandler(self):
             self.result = self.get_result()
         return self.result
@@ -453,6 +474,10 @@ class RequestTaskHandler(threading.Thread, TaskHandlerProtocol):
             # error from our json-rpc library
             raise TypeError(exc) from exc
 
+    def _set_bootstrap_process(self) -> None:
+        self.subscriber = QueueSubscriber(dbt.flags.MP_CONTEXT.Queue())
+        self.process = BootstrapProcess(self.task, self.subscriber.queue)
+
     def handle(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
         self.started = datetime.utcnow()
         self.state = TaskHandlerState.Initializing
@@ -479,9 +504,6 @@ class RequestTaskHandler(threading.Thread, TaskHandlerProtocol):
                 # bypass the queue, logging, etc: Straight to the method
                 return self.task.handle_request()
 
-        self.subscriber = QueueSubscriber(dbt.flags.MP_CONTEXT.Queue())
-        self.process = BootstrapProcess(self.task, self.subscriber.queue)
-
         if RemoteMethodFlags.BlocksManifestTasks in flags:
             # got a request to do some compiling, but we already are!
             if not self.manager.set_parsing():
@@ -490,8 +512,15 @@ class RequestTaskHandler(threading.Thread, TaskHandlerProtocol):
         if self._single_threaded:
             # all requests are synchronous in single-threaded mode. No need to
             # create a process...
+            self._set_bootstrap_process()
             return self.handle_singlethreaded(kwargs, flags)
 
+        pooled = self.manager.get_pooled_process(self.task)
+        if pooled is None:
+            self._set_bootstrap_process()
+        else:
+            self.subscriber = QueueSubscriber(pooled.queue)
+            self.process = pooled
         self.start()
         return {'request_token': str(self.task_id)}
 
@@ -1,6 +1,5 @@
-import multiprocessing
 from datetime import datetime
-from typing import Optional, Union, MutableMapping
+from typing import Any, Optional, Union, MutableMapping
 from typing_extensions import Protocol
 
 import dbt.exceptions
@@ -14,12 +13,40 @@ from dbt.contracts.rpc import (
 )
 
 
+class TaskProcessProtocol(Protocol):
+    """The process a task handler runs its task in: either a process started
+    for the task, or a pool worker for as long as it runs the task.
+    """
+    @property
+    def pid(self) -> Optional[int]:
+        pass
+
+    def start(self) -> None:
+        pass
+
+    def is_alive(self) -> bool:
+        pass
+
+    def terminate(self) -> None:
+        pass
+
+    def join(self) -> None:
+        pass
+
+
+class PooledProcessProtocol(TaskProcessProtocol, Protocol):
+    """A pool worker running a task, along with the queue its logs and
+    results come back on.
+    """
+    queue: Any
+
+
 class TaskHandlerProtocol(Protocol):
     started: Optional[datetime]
     ended: Optional[datetime]
     state: TaskHandlerState
     task_id: TaskID
-    process: Optional[multiprocessing.Process]
+    process: Optional[TaskProcessProtocol]
 
     @property
     def request_id(self) -> Union[str, int]:
@@ -8,6 +8,7 @@ from typing import (
 
 import dbt.exceptions
 import dbt.flags
+from dbt.compilation import link_manifest, relink_nodes
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.rpc import (
     LastParse,
@@ -17,12 +18,15 @@ from dbt.contracts.rpc import (
     TaskRow,
     TaskID,
 )
-from dbt.logger import LogMessage, list_handler
+from dbt.linker import Linker
+from dbt.logger import GLOBAL_LOGGER as logger, LogMessage, list_handler
+from dbt.parser.manifest import reparse_node_files
 from dbt.perf_utils import get_full_manifest
 from dbt.rpc.error import dbt_error
 from dbt.rpc.gc import GarbageCollector
 from dbt.rpc.task_handler_protocol import TaskHandlerProtocol, TaskHandlerMap
 from dbt.rpc.task_handler import set_parse_state_with
+from dbt.rpc.worker_pool import WorkerPool, PooledProcess
 from dbt.rpc.method import (
     RemoteMethod, RemoteManifestMethod, RemoteBuiltinMethod, TaskTypes,
 )
@@ -82,12 +86,19 @@ class TaskManager:
         self.args = args
         self.config = config
         self.manifest: Optional[Manifest] = None
+        self.linker: Optional[Linker] = None
         self._task_types: TaskTypes = task_types
         self.active_tasks: TaskHandlerMap = {}
         self.gc = GarbageCollector(active_tasks=self.active_tasks)
         self.last_parse: LastParse = LastParse(state=ManifestStatus.Init)
         self._lock: dbt.flags.MP_CONTEXT.Lock = dbt.flags.MP_CONTEXT.Lock()
         self._reloader: Optional[ManifestReloader] = None
+        self.worker_pool: Optional[WorkerPool] = None
+        if not self.single_threaded() and self.args.worker_pool_size > 0:
+            self.worker_pool = WorkerPool(
+                size=self.args.worker_pool_size,
+                max_tasks=self.args.worker_max_tasks,
+            )
         self.reload_manifest()
 
     def single_threaded(self):
@@ -129,6 +140,13 @@ class TaskManager:
         self.config = config
         return config
 
+    def get_pooled_process(
+        self, task: RemoteMethod
+    ) -> Optional[PooledProcess]:
+        if self.worker_pool is None:
+            return None
+        return self.worker_pool.acquire(task)
+
     def add_request(self, request_handler: TaskHandlerProtocol):
         self.active_tasks[request_handler.task_id] = request_handler
 
@@ -153,7 +171,9 @@ class TaskManager:
                     f'Manifest should not be None if the last parse state is '
                     f'{state}'
                 )
-            return task(self.args, self.config, self.manifest)
+            manifest_task = task(self.args, self.config, self.manifest)
+            manifest_task.manifest_linker = self.linker
+            return manifest_task
 
     def rpc_task(
         self, method_name: str
@@ -185,7 +205,62 @@ class TaskManager:
         return True
 
     def parse_manifest(self) -> None:
+        self.linker = None
+        if self.worker_pool is not None:
+            self.worker_pool.stop()
         self.manifest = get_full_manifest(self.config)
+        try:
+            self.linker = link_manifest(self.config, self.manifest)
+        except Exception as exc:
+            # requests will link the manifest themselves, and report the error
+            logger.debug(f'Could not link the manifest: {exc}')
+        if self.worker_pool is not None:
+            self.worker_pool.start(self.config, self.manifest, self.linker)
+
+    def _reparse_files(
+        self, manifest: Manifest, linker: Linker, paths: Set[str]
+    ) -> bool:
+        try:
+            new_manifest = reparse_node_files(self.config, manifest, paths)
+            if new_manifest is None:
+                return False
+            changed_ids = [
+                node_id for path in paths
+                for node_id in new_manifest.files[path].nodes
+            ]
+            new_linker = relink_nodes(
+                self.config, linker, new_manifest, changed_ids
+            )
+        except Exception as exc:
+            # a full reload reports the error properly
+            logger.debug(f'Could not parse the changed files again: {exc}')
+            return False
+
+        with self._lock:
+            if self.manifest is not manifest:
+                # a reload finished in the meantime
+                return False
+            self.manifest = new_manifest
+            self.linker = new_linker
+        if self.worker_pool is not None:
+            self.worker_pool.start(self.config, new_manifest, new_linker)
+        return True
+
+    def update_files(self, paths: Set[str]) -> bool:
+        """Bring the manifest up to date with the files at the given paths.
+        If they only define nodes, only those files are parsed again.
+        Otherwise, reload the manifest. Returns False if a reload is already
+        running.
+        """
+        with self._lock:
+            ready = self.last_parse.state == ManifestStatus.Ready
+            manifest = self.manifest
+            linker = self.linker
+        if ready and manifest is not None and linker is not None:
+            if self._reparse_files(manifest, linker, paths):
+                logger.debug(f'Parsed {len(paths)} changed files again')
+                return True
+        return self.reload_manifest()
 
     def set_compile_exception(self, exc, logs=List[LogMessage]) -> None:
         assert self.last_parse.state == ManifestStatus.Compiling, \
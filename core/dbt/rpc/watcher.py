@@ -0,0 +1,131 @@
+"""Watch the files of the projects the rpc server serves, and bring its
+manifest up to date when they change.
+
+There is no portable way to get notified of file changes without another
+dependency, so the watcher polls: it compares the modification time and size
+of every file dbt would read to the ones it saw last time.
+"""
+import os
+import threading
+import time
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from dbt.config import Project
+from dbt.logger import GLOBAL_LOGGER as logger
+from dbt.rpc.task_manager import TaskManager
+
+
+WATCH_INTERVAL = 0.5
+
+PROJECT_FILE_NAMES = ('dbt_project.yml', 'packages.yml')
+
+# the kinds of files the parsers read
+WATCHED_EXTENSIONS = ('.sql', '.yml', '.yaml', '.csv', '.md')
+
+FileStat = Tuple[int, int]
+
+
+def _stat(path: str) -> Optional[FileStat]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _is_watched(name: str) -> bool:
+    # the parsers skip the same files, which are mostly editor leftovers
+    if name.startswith(('.', '#', '~')):
+        return False
+    return name.endswith(WATCHED_EXTENSIONS)
+
+
+class ProjectFiles:
+    """The files dbt reads from a set of projects."""
+    def __init__(self, projects: Iterable[Project]) -> None:
+        directories: Set[str] = set()
+        project_files: Set[str] = set()
+        for project in projects:
+            root = os.path.abspath(project.project_root)
+            paths = chain(
+                project.all_source_paths,
+                project.test_paths,
+                project.docs_paths,
+            )
+            for path in paths:
+                directories.add(os.path.join(root, path))
+            for name in PROJECT_FILE_NAMES:
+                project_files.add(os.path.join(root, name))
+        self.directories: List[str] = sorted(directories)
+        self.project_files: Set[str] = project_files
+
+    def snapshot(self) -> Dict[str, FileStat]:
+        """Return the modification time and size of each file, by absolute
+        path.
+        """
+        stats: Dict[str, FileStat] = {}
+        for path in self.project_files:
+            stat = _stat(path)
+            if stat is not None:
+                stats[path] = stat
+        for directory in self.directories:
+            for dirpath, _, filenames in os.walk(directory):
+                for name in filenames:
+                    if not _is_watched(name):
+                        continue
+                    path = os.path.normpath(os.path.join(dirpath, name))
+                    stat = _stat(path)
+                    if stat is not None:
+                        stats[path] = stat
+        return stats
+
+
+def _changed_paths(
+    old: Dict[str, FileStat], new: Dict[str, FileStat]
+) -> Set[str]:
+    return {
+        path for path in chain(old, new) if old.get(path) != new.get(path)
+    }
+
+
+class ProjectWatcher(threading.Thread):
+    def __init__(
+        self, task_manager: TaskManager, interval: float = WATCH_INTERVAL
+    ) -> None:
+        super().__init__(name='project-watcher', daemon=True)
+        self.task_manager = task_manager
+        self.interval = interval
+
+    def _project_files(self) -> ProjectFiles:
+        projects = self.task_manager.config.load_dependencies()
+        return ProjectFiles(projects.values())
+
+    def _apply(self, files: ProjectFiles, changed: Set[str]) -> bool:
+        if changed & files.project_files:
+            logger.debug('A project file changed, reloading the project')
+            self.task_manager.reload_config()
+            return self.task_manager.reload_manifest()
+        return self.task_manager.update_files(changed)
+
+    def run(self) -> None:
+        files = self._project_files()
+        seen = files.snapshot()
+        while True:
+            time.sleep(self.interval)
+            current = files.snapshot()
+            changed = _changed_paths(seen, current)
+            if not changed:
+                continue
+            try:
+                if not self._apply(files, changed):
+                    # a reload is running: try again once it's done
+                    continue
+                if changed & files.project_files:
+                    # the paths to watch may have changed as well
+                    files = self._project_files()
+                    current = files.snapshot()
+            except Exception as exc:
+                # keep watching: the next change might fix things
+                logger.debug(f'Error while watching the project: {exc}')
+            seen = current
@@ -0,0 +1,304 @@
+"""A pool of pre-started processes to run rpc requests in.
+
+Starting a process per request means importing dbt, loading the adapter and
+unpickling the task with its manifest every time under spawn. Pool workers do
+all of that once, hold on to the manifest and linker the server loaded, and
+then run one task after another. Tasks are pickled without the manifest and
+linker they share with the worker, so sending one is cheap.
+
+Workers are replaced after a configurable number of tasks, after a task was
+killed or timed out, and whenever the server reloads its manifest.
+"""
+import io
+import pickle
+import signal
+import threading
+from typing import Any, Dict, List, Optional
+
+import dbt.flags
+from dbt.adapters.factory import cleanup_connections
+from dbt.contracts.graph.manifest import Manifest
+from dbt.exceptions import RPCKilledException
+from dbt.linker import Linker
+from dbt.logger import GLOBAL_LOGGER as logger
+from dbt.rpc.method import RemoteMethod
+from dbt.rpc.task_handler import spawn_setup, task_exec
+
+
+MANIFEST_ID = 'manifest'
+LINKER_ID = 'linker'
+
+
+class TaskPickler(pickle.Pickler):
+    """Pickle a task, leaving out the objects the worker already has."""
+    def __init__(self, file, shared: Dict[int, str]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.shared = shared
+
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        return self.shared.get(id(obj))
+
+
+class TaskUnpickler(pickle.Unpickler):
+    """Unpickle a task, giving it the worker's manifest and linker.
+
+    Tasks are free to change both, so each task gets its own overlay of the
+    manifest and its own copy of the linker's graph.
+    """
+    def __init__(
+        self, file, manifest: Manifest, linker: Optional[Linker]
+    ) -> None:
+        super().__init__(file)
+        self.manifest = manifest
+        self.linker = linker
+        self._loaded: Dict[str, Any] = {}
+
+    def _load_shared(self, pid: str) -> Any:
+        if pid == MANIFEST_ID:
+            return self.manifest.overlay()
+        elif pid == LINKER_ID and self.linker is not None:
+            return self.linker.copy()
+        else:
+            raise pickle.UnpicklingError(f'Unknown persistent id {pid}')
+
+    def persistent_load(self, pid: str) -> Any:
+        if pid not in self._loaded:
+            self._loaded[pid] = self._load_shared(pid)
+        return self._loaded[pid]
+
+
+class PoolWorkerProcess(dbt.flags.MP_CONTEXT.Process):
+    def __init__(
+        self,
+        config,
+        manifest: Manifest,
+        linker: Optional[Linker],
+        jobs,  # typing: multiprocessing.connection.Connection
+    ) -> None:
+        self.config = config
+        self.manifest = manifest
+        self.linker = linker
+        self.jobs = jobs
+        self.queue = dbt.flags.MP_CONTEXT.Queue()
+        # set while the worker waits for a task. The parent clears it when it
+        # sends one, so a freshly started worker counts as idle too.
+        self.idle = dbt.flags.MP_CONTEXT.Event()
+        self.idle.set()
+        # set once the worker has loaded everything it needs
+        self.ready = dbt.flags.MP_CONTEXT.Event()
+        # the server should not wait on idle workers when it exits.
+        super().__init__(daemon=True)
+
+    def load_task(self, payload: bytes) -> RemoteMethod:
+        unpickler = TaskUnpickler(
+            io.BytesIO(payload), self.manifest, self.linker
+        )
+        return unpickler.load()
+
+    def run(self):
+        try:
+            spawn_setup(self.config.args, self.config)
+            self.ready.set()
+            while True:
+                task = self.load_task(self.jobs.recv_bytes())
+                killed = task_exec(task, self.queue)
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                cleanup_connections()
+                if killed:
+                    # a killed task may have left anything behind
+                    return
+                self.idle.set()
+        except (EOFError, KeyboardInterrupt, RPCKilledException):
+            # the pool or a kill request stopped us
+            pass
+
+
+class PoolWorker:
+    def __init__(
+        self,
+        config,
+        manifest: Manifest,
+        linker: Optional[Linker],
+        generation: int,
+    ) -> None:
+        jobs, self.sender = dbt.flags.MP_CONTEXT.Pipe(duplex=False)
+        self.process = PoolWorkerProcess(config, manifest, linker, jobs)
+        self.generation = generation
+        self.tasks_run = 0
+
+    def start(self) -> None:
+        self.process.start()
+
+    def is_idle(self) -> bool:
+        return self.process.is_alive() and self.process.idle.is_set()
+
+    def send(self, payload: bytes) -> None:
+        self.tasks_run += 1
+        self.process.idle.clear()
+        self.sender.send_bytes(payload)
+
+    def stop(self) -> None:
+        self.process.terminate()
+        self.process.join()
+        self.sender.close()
+
+
+class PooledProcess:
+    """A pool worker for as long as it runs a single task. Request handlers
+    use it like the process they would otherwise start for the task.
+    """
+    def __init__(
+        self, pool: 'WorkerPool', worker: PoolWorker, payload: bytes
+    ) -> None:
+        self.pool = pool
+        self.worker = worker
+        self.payload = payload
+        self.queue = worker.process.queue
+        self._started = False
+        self._done = False
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.worker.process.pid
+
+    def start(self) -> None:
+        self.worker.send(self.payload)
+        self._started = True
+
+    def is_alive(self) -> bool:
+        return (
+            self._started and
+            not self._done and
+            not self.worker.process.idle.is_set() and
+            self.worker.process.is_alive()
+        )
+
+    def terminate(self) -> None:
+        self.worker.process.terminate()
+
+    def join(self) -> None:
+        # the worker sends the result before it goes idle, so this does not
+        # usually wait at all.
+        process = self.worker.process
+        while not process.idle.wait(timeout=0.1):
+            if not process.is_alive():
+                break
+        if not self._done:
+            self._done = True
+            self.pool.release(self.worker)
+
+
+class WorkerPool:
+    def __init__(self, size: int, max_tasks: int) -> None:
+        self.size = size
+        self.max_tasks = max_tasks
+        self._lock = threading.Lock()
+        self._idle: List[PoolWorker] = []
+        self._generation = 0
+        self._config = None
+        self._manifest: Optional[Manifest] = None
+        self._linker: Optional[Linker] = None
+
+    def _start_worker(self, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation or self._manifest is None:
+                return
+            worker = PoolWorker(
+                self._config, self._manifest, self._linker, generation
+            )
+        # under spawn, starting a worker pickles the manifest: don't hold the
+        # lock for that.
+        worker.start()
+        with self._lock:
+            if generation == self._generation:
+                self._idle.append(worker)
+                return
+        worker.stop()
+
+    def _replace_worker(self, worker: PoolWorker) -> None:
+        worker.stop()
+        self._start_worker(worker.generation)
+
+    def _replace(self, worker: PoolWorker) -> None:
+        # starting a worker can take a while under spawn, and the request
+        # that was waiting for this one should not have to wait for that.
+        thread = threading.Thread(
+            target=self._replace_worker, args=(worker,), daemon=True
+        )
+        thread.start()
+
+    def start(
+        self, config, manifest: Manifest, linker: Optional[Linker]
+    ) -> None:
+        """Start workers that hold the given manifest and linker."""
+        self.stop()
+        with self._lock:
+            self._config = config
+            self._manifest = manifest
+            self._linker = linker
+            generation = self._generation
+        for _ in range(self.size):
+            self._start_worker(generation)
+
+    def stop(self) -> None:
+        """Stop the idle workers. Busy workers are stopped once they finish
+        their task.
+        """
+        with self._lock:
+            self._generation += 1
+            self._manifest = None
+            self._linker = None
+            stopped, self._idle = self._idle, []
+        for worker in stopped:
+            worker.stop()
+
+    def release(self, worker: PoolWorker) -> None:
+        """Take back a worker once its task is over, or replace it."""
+        with self._lock:
+            reuse = (
+                worker.generation == self._generation and
+                worker.tasks_run < self.max_tasks and
+                worker.is_idle()
+            )
+            if reuse:
+                self._idle.append(worker)
+        if not reuse:
+            self._replace(worker)
+
+    def acquire(self, task: RemoteMethod) -> Optional[PooledProcess]:
+        """Return a process to run the task in, or None if all workers are
+        busy or the task can't be sent to one.
+        """
+        with self._lock:
+            # workers that are still starting up only get a task if all the
+            # others are busy
+            self._idle.sort(key=lambda w: not w.process.ready.is_set())
+            worker = None
+            dead: List[PoolWorker] = []
+            while self._idle and worker is None:
+                candidate = self._idle.pop(0)
+                if candidate.is_idle():
+                    worker = candidate
+                else:
+                    dead.append(candidate)
+            manifest = self._manifest
+            linker = self._linker
+        for candidate in dead:
+            # a kill request reached it after its task was over
+            self._replace(candidate)
+        if worker is None:
+            return None
+
+        shared = {id(manifest): MANIFEST_ID}
+        if linker is not None:
+            shared[id(linker)] = LINKER_ID
+        buf = io.BytesIO()
+        try:
+            TaskPickler(buf, shared).dump(task)
+        except Exception as exc:
+            logger.debug(
+                f'Could not send the task to a pool worker: {exc}'
+            )
+            self.release(worker)
+            return None
+        return PooledProcess(self, worker, buf.getvalue())
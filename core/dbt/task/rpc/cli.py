@@ -47,6 +47,7 @@ class RemoteRPCCli(RPCTask[RPCCliParameters]):
             self.real_task = task_type(
                 self.args, self.config, self.manifest
             )
+            self.real_task.manifest_linker = self.manifest_linker
         else:
             self.real_task = self.task_type(
                 self.args, self.config
@@ -105,6 +106,7 @@ class RemoteRPCCli(RPCTask[RPCCliParameters]):
             self.real_task.args.vars = dumped
             if isinstance(self.real_task, RemoteManifestMethod):
                 self.real_task.manifest = get_full_manifest(self.config)
+                self.real_task.manifest_linker = None
 
         # we parsed args from the cli, so we're set on that front
         return self.real_task.handle_request()
@@ -22,6 +22,7 @@ from dbt.rpc.logger import ServerContext, HTTPRequest, RPCResponse
 from dbt.rpc.method import TaskTypes, RemoteMethod
 from dbt.rpc.response_manager import ResponseManager
 from dbt.rpc.task_manager import TaskManager
+from dbt.rpc.watcher import ProjectWatcher
 from dbt.task.base import ConfiguredTask
 from dbt.utils import ForgivingJSONEncoder
 
@@ -125,6 +126,9 @@ class RPCServerTask(ConfiguredTask):
             'Send requests to http://{}:{}/jsonrpc'.format(display_host, port)
         )
 
+        if self.args.watch:
+            ProjectWatcher(self.task_manager).start()
+
         app = DispatcherMiddleware(self.handle_request, {
             '/jsonrpc': self.handle_jsonrpc_request,
         })
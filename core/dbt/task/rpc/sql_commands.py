@@ -1,19 +1,20 @@
 import base64
 import signal
 import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List
 
-from dbt import flags
 from dbt.adapters.factory import get_adapter
 from dbt.clients.jinja import extract_toplevel_blocks
-from dbt.compilation import compile_manifest, compile_node
+from dbt.compilation import compile_manifest, compile_node, Compiler
 from dbt.config.runtime import RuntimeConfig
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.parsed import ParsedRPCNode
 from dbt.contracts.rpc import RPCExecParameters
 from dbt.contracts.rpc import RemoteExecutionResult
 from dbt.exceptions import RPCKilledException, InternalException
+from dbt.linker import Linker
 from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.parser.results import ParseResult
 from dbt.parser.manifest import process_node, process_macro
@@ -26,6 +27,11 @@ from dbt.task.run import RunTask
 from .base import RPCTask
 
 
+# held while a request's node is linked into the graph it shares with other
+# requests
+_MANIFEST_LINKER_LOCK = threading.Lock()
+
+
 def add_new_refs(
     manifest: Manifest,
     config: RuntimeConfig,
@@ -35,10 +41,8 @@ def add_new_refs(
     """Given a new node that is not in the manifest, insert the new node
     into it as if it were part of regular ref processing.
     """
-    if config.args.single_threaded or flags.SINGLE_THREADED_HANDLER:
-        manifest = manifest.deepcopy()
     # it's ok for macros to silently override a local project macro name
-    manifest.macros.update(macros)
+    manifest.update_macros(macros)
 
     for macro in macros.values():
         process_macro(config, manifest, macro)
@@ -97,27 +101,21 @@ class RemoteRunSQLTask(RPCTask[RPCExecParameters]):
         sql = ''.join(data_chunks)
         return sql, macros
 
-    def _compile_ancestors(self, unique_id: str):
-        # this just gets a transitive closure of the nodes. We could build a
-        # special GraphQueue around this, but we do them all in the main thread
-        # so we only care about preserving dependency order anyway
-        if self.linker is None or self.manifest is None:
+    def _compile_ancestors(self, sorted_ancestors: List[str]):
+        if self.manifest is None:
             raise InternalException(
-                'linker and manifest not set in _compile_ancestors'
+                'manifest not set in _compile_ancestors'
             )
-        sorted_ancestors = self.linker.sorted_ephemeral_ancestors(
-            self.manifest,
-            unique_id,
-        )
         # We're just compiling, so we don't need to use a graph queue
         adapter = get_adapter(self.config)  # type: ignore
 
         for unique_id in sorted_ancestors:
-            # for each node, compile it + overwrite it
+            # for each node, compile it + overwrite it. update_node keeps the
+            # name index in sync, so refs find the compiled node
             parsed = self.manifest.expect(unique_id)
-            self.manifest.nodes[unique_id] = compile_node(
+            self.manifest.update_node(compile_node(
                 adapter, self.config, parsed, self.manifest, {}, write=False
-            )
+            ))
 
     def _get_exec_node(self):
         if self.manifest is None:
@@ -125,6 +123,10 @@ class RemoteRunSQLTask(RPCTask[RPCExecParameters]):
                 'manifest not set in _get_exec_node'
             )
 
+        # everything this request adds goes into an overlay, so the manifest
+        # shared with other requests is left alone
+        self.manifest = self.manifest.overlay()
+
         results = ParseResult.rpc()
         macro_overrides = {}
         macros = self.args.macros
@@ -135,7 +137,7 @@ class RemoteRunSQLTask(RPCTask[RPCExecParameters]):
             for node in macro_parser.parse_remote(macros):
                 macro_overrides[node.unique_id] = node
 
-        self.manifest.macros.update(macro_overrides)
+        self.manifest.update_macros(macro_overrides)
         rpc_parser = RPCCallParser(
             results=results,
             project=self.config,
@@ -150,11 +152,45 @@ class RemoteRunSQLTask(RPCTask[RPCExecParameters]):
             macros=macro_overrides
         )
 
-        # don't write our new, weird manifest!
-        self.linker = compile_manifest(self.config, self.manifest, write=False)
-        self._compile_ancestors(rpc_node.unique_id)
+        # this just gets a transitive closure of the nodes. We could build a
+        # special GraphQueue around this, but we do them all in the main thread
+        # so we only care about preserving dependency order anyway
+        with self._linked_rpc_node(rpc_node) as linker:
+            sorted_ancestors = list(linker.sorted_ephemeral_ancestors(
+                self.manifest, rpc_node.unique_id
+            ))
+        self._compile_ancestors(sorted_ancestors)
         return rpc_node
 
+    @contextmanager
+    def _linked_rpc_node(self, rpc_node: ParsedRPCNode) -> Iterator[Linker]:
+        """Add the rpc node to the graph that was linked when the manifest
+        was loaded, instead of linking the whole manifest again, and remove it
+        on exit. Nothing depends on the rpc node, so it can't introduce a
+        cycle.
+
+        In single-threaded mode, requests share that graph, so it stays
+        locked while the rpc node is in it.
+        """
+        if self.manifest is None:
+            raise InternalException(
+                'manifest not set in _linked_rpc_node'
+            )
+        if self.manifest_linker is None:
+            # don't write our new, weird manifest!
+            yield compile_manifest(self.config, self.manifest, write=False)
+            return
+
+        linker = self.manifest_linker
+        with _MANIFEST_LINKER_LOCK:
+            try:
+                Compiler(self.config).link_node(
+                    linker, rpc_node, self.manifest
+                )
+                yield linker
+            finally:
+                linker.remove_node(rpc_node.unique_id)
+
     def _raise_set_error(self):
         if self._raise_next_tick is not None:
             raise self._raise_next_tick
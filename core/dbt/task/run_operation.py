@@ -31,7 +31,8 @@ class RunOperationTask(ManifestTask):
         # skip building a linker, but do make sure to build the flat graph
         if self.manifest is None:
             raise InternalException('manifest was None in compile_manifest')
-        self.manifest.build_flat_graph()
+        if not self.manifest.flat_graph:
+            self.manifest.build_flat_graph()
 
     def _run_unsafe(self) -> agate.Table:
         adapter = get_adapter(self.config)
@@ -73,7 +73,9 @@ class ManifestTask(ConfiguredTask):
                 'compile_manifest called before manifest was loaded'
             )
         self.linker = compile_manifest(self.config, self.manifest)
-        self.manifest.build_flat_graph()
+        # loading the manifest already built it
+        if not self.manifest.flat_graph:
+            self.manifest.build_flat_graph()
 
     def _runtime_initialize(self):
         self.load_manifest()
@@ -355,6 +357,15 @@ class GraphRunnableTask(ManifestTask):
     def populate_adapter_cache(self, adapter):
         adapter.set_relations_cache(self.manifest)
 
+    def save_adapter_cache(self, adapter, results):
+        if not dbt.flags.RELATION_CACHE_TTL or not dbt.flags.USE_CACHE:
+            return
+        # if a node failed, dbt might not know what it left in the database
+        if any(r.error is not None for r in results):
+            return
+        with adapter.connection_named('master'):
+            adapter.write_relations_cache_snapshot(self.manifest)
+
     def before_hooks(self, adapter):
         pass
 
@@ -376,6 +387,9 @@ class GraphRunnableTask(ManifestTask):
             started = time.time()
             self.before_run(adapter, selected_uids)
             res = self.execute_nodes()
+            # save the cache before the on-run-end hooks run: the cache won't
+            # know what they changed, but the fingerprint will
+            self.save_adapter_cache(adapter, res)
             self.after_run(adapter, res)
             elapsed = time.time() - started
             self.after_hooks(adapter, res, elapsed)
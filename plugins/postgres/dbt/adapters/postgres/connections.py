@@ -120,6 +120,12 @@ class PostgresConnectionManager(SQLConnectionManager):
 
         return connection
 
+    @classmethod
+    def is_healthy(cls, connection):
+        # psycopg2 notices a connection the server closed the next time it
+        # is used
+        return connection.state == 'open' and connection.handle.closed == 0
+
     def cancel(self, connection):
         connection_name = connection.name
         pid = connection.handle.get_backend_pid()
@@ -89,6 +89,18 @@ class PostgresAdapter(SQLAdapter):
 
         self._link_cached_database_relations(schemas)
 
+    def _list_relations_for_cache(self, schema_map):
+        # postgres only has the one database, so this is a single query
+        return self._list_relations_by_database(schema_map)
+
     def _relations_cache_for_schemas(self, manifest):
         super()._relations_cache_for_schemas(manifest)
         self._link_cached_relations(manifest)
+
+    def _load_relations_cache_snapshot(self, manifest):
+        # snapshots don't store links: views can be redefined over other
+        # relations without changing the fingerprint
+        if not super()._load_relations_cache_snapshot(manifest):
+            return False
+        self._link_cached_relations(manifest)
+        return True
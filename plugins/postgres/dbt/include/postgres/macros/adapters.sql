@@ -75,6 +75,53 @@
   {{ return(load_result('list_relations_without_caching').table) }}
 {% endmacro %}
 
+{% macro postgres__list_relations_in_schemas_without_caching(information_schema, schemas) %}
+  {%- set schema_list -%}
+    {%- for schema in schemas -%}
+      '{{ schema | lower }}'{{ ', ' if not loop.last }}
+    {%- endfor -%}
+  {%- endset -%}
+  {% call statement('list_relations_in_schemas_without_caching', fetch_result=True) -%}
+    select
+      '{{ information_schema.database }}' as database,
+      tablename as name,
+      schemaname as schema,
+      'table' as type
+    from pg_tables
+    where lower(schemaname) in ({{ schema_list }})
+    union all
+    select
+      '{{ information_schema.database }}' as database,
+      viewname as name,
+      schemaname as schema,
+      'view' as type
+    from pg_views
+    where lower(schemaname) in ({{ schema_list }})
+  {% endcall %}
+  {{ return(load_result('list_relations_in_schemas_without_caching').table) }}
+{% endmacro %}
+
+{% macro postgres__relations_cache_fingerprint(information_schema, schemas) %}
+  {#-- postgres doesn't record when relations change, so summarize them --#}
+  {% call statement('relations_cache_fingerprint', fetch_result=True) -%}
+    select
+      n.nspname as schema,
+      count(c.oid) as relations,
+      md5(string_agg(c.relname || ':' || c.relkind, ',' order by c.relname)) as digest
+    from pg_namespace n
+    left join pg_class c
+      on c.relnamespace = n.oid
+      and c.relkind in ('r', 'v', 'm', 'p', 'f')
+    where lower(n.nspname) in (
+      {%- for schema in schemas -%}
+        '{{ schema | lower }}'{{ ', ' if not loop.last }}
+      {%- endfor -%}
+    )
+    group by n.nspname
+  {% endcall %}
+  {{ return(load_result('relations_cache_fingerprint').table) }}
+{% endmacro %}
+
 {% macro postgres__information_schema_name(database) -%}
   {% if database_name -%}
     {{ adapter.verify_database(database_name) }}
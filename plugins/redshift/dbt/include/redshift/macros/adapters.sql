@@ -157,6 +157,18 @@
 {% endmacro %}
 
 
+{% macro redshift__list_relations_in_schemas_without_caching(information_schema, schemas) %}
+  {{ return(postgres__list_relations_in_schemas_without_caching(information_schema, schemas)) }}
+{% endmacro %}
+
+
+{% macro redshift__relations_cache_fingerprint(information_schema, schemas) %}
+  {#-- string_agg is not available on redshift, and listagg can't read the
+       catalog tables, which only exist on the leader node --#}
+  {{ return(none) }}
+{% endmacro %}
+
+
 {% macro redshift__information_schema_name(database) -%}
   {{ return(postgres__information_schema_name(database)) }}
 {%- endmacro %}
@@ -219,6 +219,10 @@ class SnowflakeConnectionManager(SQLConnectionManager):
 
             raise FailedToConnectException(str(e))
 
+    @classmethod
+    def is_healthy(cls, connection):
+        return connection.state == 'open' and not connection.handle.is_closed()
+
     def cancel(self, connection):
         handle = connection.handle
         sid = handle.session_id
@@ -1,9 +1,13 @@
 from dataclasses import dataclass
-from typing import Mapping, Any, Optional, List, Union
+from typing import (
+    Mapping, Any, Dict, Iterator, Optional, List, Union
+)
 
 import agate
 
 from dbt.adapters.base.impl import AdapterConfig
+from dbt.adapters.base.relation import SchemaSearchMap
+from dbt.adapters.cache import SchemaKey
 from dbt.adapters.sql import SQLAdapter
 from dbt.adapters.sql.impl import (
     LIST_SCHEMAS_MACRO_NAME,
@@ -151,3 +155,32 @@ class SnowflakeAdapter(SQLAdapter):
             ))
 
         return relations
+
+    def list_relations_in_schemas_without_caching(
+        self, information_schema, schemas
+    ) -> List[SnowflakeRelation]:
+        try:
+            return super().list_relations_in_schemas_without_caching(
+                information_schema, schemas
+            )
+        except DatabaseException as exc:
+            # if the database doesn't exist, there is nothing in it
+            if 'Object does not exist' in str(exc):
+                return []
+            raise
+
+    def _list_relations_for_cache(
+        self, schema_map: SchemaSearchMap
+    ) -> Iterator[SnowflakeRelation]:
+        return self._list_relations_by_database(schema_map)
+
+    def _relations_cache_fingerprint(
+        self, schema_map: SchemaSearchMap
+    ) -> Optional[Dict[SchemaKey, Any]]:
+        try:
+            return super()._relations_cache_fingerprint(schema_map)
+        except DatabaseException as exc:
+            # a database doesn't exist (yet), so there's nothing to compare
+            if 'Object does not exist' in str(exc):
+                return None
+            raise
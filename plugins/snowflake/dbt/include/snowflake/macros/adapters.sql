@@ -112,6 +112,46 @@
 {% endmacro %}
 
 
+{% macro snowflake__list_relations_in_schemas_without_caching(information_schema, schemas) %}
+  {%- set sql -%}
+    select
+      table_catalog as "database",
+      table_name as "name",
+      table_schema as "schema",
+      case
+        when table_type = 'VIEW' then 'view'
+        when table_type = 'EXTERNAL TABLE' then 'external'
+        else 'table'
+      end as "type"
+    from {{ information_schema }}.tables
+    where (
+      {%- for schema in schemas -%}
+        upper(table_schema) = upper('{{ schema }}'){%- if not loop.last %} or {% endif -%}
+      {%- endfor -%}
+    )
+  {%- endset -%}
+  {{ return(run_query(sql)) }}
+{% endmacro %}
+
+
+{% macro snowflake__relations_cache_fingerprint(information_schema, schemas) %}
+  {%- set sql -%}
+    select
+      table_schema as "schema",
+      count(*) as "relations",
+      max(last_altered) as "last_altered"
+    from {{ information_schema }}.tables
+    where (
+      {%- for schema in schemas -%}
+        upper(table_schema) = upper('{{ schema }}'){%- if not loop.last %} or {% endif -%}
+      {%- endfor -%}
+    )
+    group by table_schema
+  {%- endset -%}
+  {{ return(run_query(sql)) }}
+{% endmacro %}
+
+
 {% macro snowflake__check_schema_exists(information_schema, schema) -%}
   {% call statement('check_schema_exists', fetch_result=True) -%}
         select count(*)
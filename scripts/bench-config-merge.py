@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""Time merging a node config the way parsing does: the defaults, then one
+dbt_project.yml config for each of 5 fqn levels, then 3 config() calls.
+"""
+import argparse
+import copy
+import timeit
+
+from dbt.adapters.factory import load_plugin
+from dbt.contracts.graph.model_config import NodeConfig
+
+
+LEVEL_CONFIGS = [
+    {'tags': ['all'], 'vars': {'a': 1}},
+    {'materialized': 'view', 'post-hook': 'select 1'},
+    {'tags': ['level'], 'schema': 'staging'},
+    {'enabled': True, 'persist_docs': {'relation': True}},
+    {'meta_level': 4, 'quoting': {'identifier': False}},
+]
+
+CONFIG_CALLS = [
+    {'materialized': 'table'},
+    {'tags': 'call', 'pre-hook': ['select 2']},
+    {'unique_key': 'id', 'vars': {'b': 2}},
+]
+
+
+def merge_node_config(adapter_type: str) -> NodeConfig:
+    result = NodeConfig.from_dict({}, validate=False)
+    for partial in LEVEL_CONFIGS + CONFIG_CALLS:
+        result = result.update_from(
+            copy.deepcopy(partial), adapter_type, validate=False
+        )
+    return result.finalize_and_validate()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--adapter', default='postgres')
+    parser.add_argument('--number', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    load_plugin(args.adapter)
+    # warm up any caches, and make sure this works at all
+    merge_node_config(args.adapter)
+    times = timeit.repeat(
+        lambda: merge_node_config(args.adapter),
+        number=args.number,
+        repeat=args.repeat,
+    )
+    per_node = min(times) / args.number * 1000
+    print(f'{per_node:.3f}ms per node config')
+
+
+if __name__ == '__main__':
+    main()
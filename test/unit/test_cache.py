@@ -263,6 +263,31 @@ class TestAdd(TestCache):
         self.assertIsNot(self.cache.relations[('dbt_2', 'foo', 'bar')].inner, None)
 
 
+class TestSnapshot(TestCache):
+    def setUp(self):
+        super().setUp()
+        self.cache.add(make_relation('dbt', 'foo', 'bar'))
+        self.cache.add(make_mock_relationship('dbt', 'foo', 'baz'))
+        self.cache.add(make_relation('dbt', 'other', 'bar'))
+        self.cache.add_link(make_relation('dbt', 'foo', 'bar'),
+                            make_mock_relationship('dbt', 'foo', 'baz'))
+
+    def test_snapshot_restore(self):
+        relations = self.cache.snapshot({('dbt', 'foo')})
+        self.assertEqual(len(relations), 2)
+
+        restored = RelationsCache()
+        restored.restore({('dbt', 'foo')}, relations)
+        self.assertEqual(restored.schemas, {('dbt', 'foo')})
+        # links are not stored, the adapter adds them again
+        self.assertEqual(
+            restored.dump_graph(),
+            {'dbt.foo.bar': [], 'dbt.foo.baz': []}
+        )
+        restored.drop(make_relation('dbt', 'foo', 'bar'))
+        self.assertEqual(len(restored.relations), 1)
+
+
 class TestLikeDbt(TestCase):
     def setUp(self):
         self.cache = RelationsCache()
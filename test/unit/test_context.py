@@ -1,14 +1,19 @@
+import gc
+import json
 import unittest
 import os
+import weakref
 from typing import Set, Dict, Any
 from unittest import mock
 
 import pytest
+import yaml
 
 # make sure 'postgres' is in PACKAGES
 from dbt.adapters import postgres  # noqa
 from dbt.adapters.base import AdapterConfig
-from dbt.clients.jinja import MacroStack
+from dbt.clients.jinja import MacroStack, MacroGenerator
+from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.parsed import (
     ParsedModelNode, NodeConfig, DependsOn, ParsedMacro
 )
@@ -279,6 +284,26 @@ def test_base_context():
     assert_has_keys(REQUIRED_BASE_KEYS, MAYBE_KEYS, ctx)
 
 
+def test_serialize_graph(config):
+    model = mock_model()
+    model.to_dict.return_value = {'name': 'model_one', 'tags': []}
+    manifest = mock_manifest(config)
+    manifest.add_nodes({model.unique_id: model})
+    manifest.build_flat_graph()
+    ctx = base.generate_base_context({})
+    expected = {
+        'nodes': {'model.root.model_one': {'name': 'model_one', 'tags': []}},
+        'sources': {},
+    }
+    graph = manifest.flat_graph
+    assert json.loads(ctx['tojson'](graph)) == expected
+    assert json.loads(ctx['tojson'](graph['nodes'])) == expected['nodes']
+    assert yaml.safe_load(ctx['toyaml'](graph)) == expected
+    # anything else still can't be serialized
+    with pytest.raises(TypeError):
+        ctx['tojson'](object())
+
+
 def test_target_context():
     profile = profile_from_dict(PROFILE_DATA, 'test')
     ctx = target.generate_target_context(profile, {})
@@ -302,7 +327,7 @@ def mock_manifest(config):
     for name in ['macro_a', 'macro_b']:
         macro = mock_macro(name, config.project_name)
         macros[macro.unique_id] = macro
-    return mock.MagicMock(macros=macros)
+    return Manifest.from_macros(macros=macros)
 
 
 def mock_model():
@@ -409,15 +434,110 @@ def test_docs_runtime_context(config):
 
 
 def test_macro_namespace(config, manifest):
-    mn = configured.MacroNamespace('root', 'search', MacroStack())
-    mn.add_macros(manifest.macros.values(), {})
+    mn = configured.MacroNamespaceLayout('root', 'search')
+    mn.add_macros(manifest.macros.values())
 
     # same pkg, same name
     with pytest.raises(dbt.exceptions.CompilationException):
-        mn.add_macros(manifest.macros.values(), {})
+        mn.add_macros(manifest.macros.values())
 
-    mn.add_macro(mock_macro('some_macro', 'dbt'), {})
+    mn.add_macro(mock_macro('some_macro', 'dbt'))
 
     # same namespace, same name (different pkg!)
     with pytest.raises(dbt.exceptions.CompilationException):
-        mn.add_macro(mock_macro('some_macro', 'dbt_postgres'), {})
+        mn.add_macro(mock_macro('some_macro', 'dbt_postgres'))
+
+
+def test_macro_namespace_layout_shared(config, manifest):
+    layout = configured.MacroNamespaceLayout.from_manifest(
+        manifest, 'root', 'root'
+    )
+    assert configured.MacroNamespaceLayout.from_manifest(
+        manifest, 'root', 'root'
+    ) is layout
+    assert configured.MacroNamespaceLayout.from_manifest(
+        manifest, 'root', 'other'
+    ) is not layout
+
+    # changing the macros discards the shared layouts
+    macro = mock_macro('macro_c', 'root')
+    manifest.update_macros({macro.unique_id: macro})
+    new_layout = configured.MacroNamespaceLayout.from_manifest(
+        manifest, 'root', 'root'
+    )
+    assert new_layout is not layout
+    assert 'macro_c' in new_layout.locals
+
+
+def test_macro_namespace_layout_overlay(config, manifest):
+    layout = configured.MacroNamespaceLayout.from_manifest(
+        manifest, 'root', 'root'
+    )
+    overlay = manifest.overlay()
+    # nothing changed yet, so the overlay uses the base layout
+    assert configured.MacroNamespaceLayout.from_manifest(
+        overlay, 'root', 'root'
+    ) is layout
+
+    replaced = mock_macro('macro_a', 'root')
+    added = mock_macro('macro_c', 'root')
+    overlay.update_macros({
+        replaced.unique_id: replaced, added.unique_id: added,
+    })
+    with mock.patch.object(
+        configured.MacroNamespaceLayout, 'add_macro',
+        autospec=True,
+        side_effect=configured.MacroNamespaceLayout.add_macro,
+    ) as add_macro:
+        overlay_layout = configured.MacroNamespaceLayout.from_manifest(
+            overlay, 'root', 'root'
+        )
+    # only the overlay's macros are visited
+    assert add_macro.call_count == 2
+    assert overlay_layout.locals['macro_a'] is replaced
+    assert overlay_layout.packages['root']['macro_c'] is added
+    assert (
+        overlay_layout.locals['macro_b'] is manifest.macros['macro.root.macro_b']
+    )
+
+    # the base layout is unchanged
+    assert layout.locals['macro_a'] is manifest.macros['macro.root.macro_a']
+    assert 'macro_c' not in layout.locals
+    assert 'macro_c' not in layout.packages['root']
+
+    # a new macro with an existing name is still a duplicate
+    with pytest.raises(dbt.exceptions.CompilationException):
+        configured.MacroNamespaceLayout.layered(
+            layout, [mock_macro('some_macro', 'dbt'),
+                     mock_macro('some_macro', 'dbt_postgres')]
+        )
+
+
+def test_macro_namespace_layouts_released(config, manifest):
+    configured.MacroNamespaceLayout.from_manifest(manifest, 'root', 'root')
+    index = weakref.ref(manifest.macro_index)
+    macro = mock_macro('macro_c', 'root')
+    manifest.update_macros({macro.unique_id: macro})
+    gc.collect()
+    # the cached layouts don't keep the old index alive
+    assert index() is None
+
+
+def test_macro_namespace_binds_lazily(config, manifest):
+    dep_macro = mock_macro('dep_macro', 'dep')
+    manifest.update_macros({dep_macro.unique_id: dep_macro})
+    layout = configured.MacroNamespaceLayout.from_manifest(
+        manifest, 'root', 'root'
+    )
+    ctx = {}
+    mn = configured.MacroNamespace(layout, ctx, MacroStack())
+    namespace = mn.get_macro_dict()
+
+    assert isinstance(namespace['macro_a'], MacroGenerator)
+    assert namespace['macro_a'] is namespace['root']['macro_a']
+    assert 'dep_macro' not in namespace
+    assert 'dep_macro' in namespace['dep']
+    assert dep_macro.unique_id not in mn._generators
+    generator = namespace['dep']['dep_macro']
+    assert generator.macro is dep_macro
+    assert generator.context is ctx
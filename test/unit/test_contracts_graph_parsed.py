@@ -1,5 +1,7 @@
 import pickle
 
+import dbt.flags
+from dbt.adapters.factory import load_plugin
 from dbt.node_types import NodeType
 from dbt.contracts.graph.model_config import (
     All,
@@ -29,8 +31,9 @@ from dbt.contracts.graph.parsed import (
     TestMetadata,
 )
 from dbt.contracts.graph.unparsed import Quoting
+from dbt.contracts.util import should_validate
 
-from hologram import ValidationError
+from hologram import JsonSchemaMixin, ValidationError
 from .utils import ContractTestCase
 
 
@@ -75,6 +78,38 @@ class TestNodeConfig(ContractTestCase):
         self.assert_symmetric(cfg, cfg_dict)
         pickle.loads(pickle.dumps(cfg))
 
+    def test_update_from(self):
+        load_plugin('postgres')
+        cfg = self.ContractType(tags=['a'], vars={'a': 1})
+        cfg._extra['unlogged'] = False
+        updated = cfg.update_from({
+            'tags': 'b',
+            'vars': {'b': 2},
+            'post-hook': 'select 1',
+            'materialized': 'table',
+            'unlogged': True,
+            'extra': 'more',
+        }, 'postgres')
+
+        self.assertEqual(updated.tags, ['a', 'b'])
+        self.assertEqual(updated.vars, {'a': 1, 'b': 2})
+        self.assertEqual(updated.post_hook, [Hook(sql='select 1')])
+        self.assertEqual(updated.materialized, 'table')
+        self.assertEqual(updated.extra, {'unlogged': True, 'extra': 'more'})
+        # the original is left alone
+        self.assertEqual(cfg.tags, ['a'])
+        self.assertEqual(cfg.vars, {'a': 1})
+        self.assertEqual(cfg.extra, {'unlogged': False})
+
+    def test_update_from_invalid(self):
+        load_plugin('postgres')
+        cfg = self.ContractType()
+        with self.assertRaises(ValidationError):
+            cfg.update_from({'materialized': 1}, 'postgres')
+        # without validation, the node using this config validates it
+        updated = cfg.update_from({'materialized': 1}, 'postgres', validate=False)
+        self.assertEqual(updated.materialized, 1)
+
 
 class TestParsedModelNode(ContractTestCase):
     ContractType = ParsedModelNode
@@ -248,6 +283,32 @@ class TestParsedModelNode(ContractTestCase):
         bad_materialized['config']['materialized'] = None
         self.assert_fails_validation(bad_materialized)
 
+    def test_cached_validator_errors(self):
+        # the cached validator picks the same error hologram would
+        bad_materialized = self._model_ok()
+        bad_materialized['config']['materialized'] = None
+        with self.assertRaises(ValidationError) as cached:
+            self.ContractType.validate(bad_materialized)
+        with self.assertRaises(ValidationError) as uncached:
+            JsonSchemaMixin.validate.__func__(
+                self.ContractType, bad_materialized
+            )
+        self.assertEqual(cached.exception.message, uncached.exception.message)
+
+    def test_validation_modes(self):
+        try:
+            dbt.flags.VALIDATION = 'strict'
+            self.assertTrue(should_validate())
+            self.assertTrue(should_validate(revalidating=True))
+            dbt.flags.VALIDATION = 'fast'
+            self.assertTrue(should_validate())
+            self.assertFalse(should_validate(revalidating=True))
+            dbt.flags.VALIDATION = 'off'
+            self.assertFalse(should_validate())
+            self.assertFalse(should_validate(revalidating=True))
+        finally:
+            dbt.flags.reset()
+
     def test_patch_ok(self):
         initial = self.ContractType(
             package_name='test',
@@ -1,4 +1,5 @@
 import os
+import pickle
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -321,3 +322,57 @@ class GraphTest(unittest.TestCase):
         self.assertFalse(loader.matching_parse_results(too_low))
         too_high = results.replace(dbt_version='99999.99.99')
         self.assertFalse(loader.matching_parse_results(too_high))
+
+    def test__parallel_parse(self):
+        def use_models():
+            self.mock_models = []
+            self.use_models({
+                'model_one': 'select * from events',
+                'model_two': "select * from {{ref('model_one')}}",
+                'model_three': (
+                    "{% if true %}{{ config(materialized='table') }}{% endif %}"
+                    "select * from {{ ref('model_two') }}"
+                ),
+            })
+            for source_file in self.mock_models:
+                source_file.checksum = FileHash.from_contents(source_file.contents)
+
+        config = self.get_config()
+        use_models()
+        serial = self.load_manifest(config)
+        use_models()
+
+        class CopyingPool:
+            # runs everything in this process, but copies the work and the
+            # results the way a process pool would
+            def __init__(self, processes, initializer, initargs):
+                initializer(*initargs)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                pass
+
+            def imap(self, func, iterable, chunksize=1):
+                for item in iterable:
+                    result = func(pickle.loads(pickle.dumps(item)))
+                    yield pickle.loads(pickle.dumps(result))
+
+        self.addCleanup(setattr, dbt.flags, 'PARSE_WORKERS', None)
+        self.addCleanup(setattr, dbt.parser.manifest, '_parse_worker', None)
+        dbt.flags.PARSE_WORKERS = 2
+        with patch('dbt.flags.MP_CONTEXT', MagicMock(Pool=CopyingPool)), \
+                patch('dbt.parser.manifest.register_adapter'), \
+                patch.object(dbt.parser.manifest.ParseWorker, 'parse',
+                             autospec=True,
+                             side_effect=dbt.parser.manifest.ParseWorker.parse) as parse:
+            parallel = self.load_manifest(config)
+
+        self.assertEqual(parse.call_count, 3)
+        self.assertEqual(list(parallel.nodes), list(serial.nodes))
+        self.assertEqual(parallel.nodes, serial.nodes)
+        self.assertEqual(
+            parallel.nodes['model.test_models_compile.model_three'].config.materialized,
+            'table'
+        )
@@ -1,8 +1,15 @@
+import os
+import tempfile
 import unittest
+from unittest import mock
 
-from dbt.clients.jinja import get_template
+from dbt.clients.jinja import (
+    get_template, get_rendered, get_environment, render_template,
+    render_counter, TemplateCodeCache, MacroBytecodeCache
+)
 from dbt.clients.jinja import extract_toplevel_blocks
 from dbt.exceptions import CompilationException
+from dbt.utils import get_dbt_macro_name
 
 
 class TestJinja(unittest.TestCase):
@@ -13,6 +20,78 @@ class TestJinja(unittest.TestCase):
         mod = template.make_module()
         self.assertEqual(mod.my_dict, {'a': 1})
 
+    def test_environments_are_shared(self):
+        self.assertIs(get_environment(), get_environment())
+        self.assertIs(get_environment(native=True), get_environment(native=True))
+        self.assertIsNot(get_environment(), get_environment(native=True))
+        self.assertIsNot(get_environment(), get_environment(capture_macros=True))
+
+    def test_capture_macros_undefined_is_per_node(self):
+        node_a, node_b = object(), object()
+        env_a = get_environment(node_a, capture_macros=True)
+        env_b = get_environment(node_b, capture_macros=True)
+        self.assertIsNot(env_a.undefined, env_b.undefined)
+        self.assertIs(env_a.undefined(name='x').node, node_a)
+        self.assertIs(env_b.undefined(name='x').node, node_b)
+
+    def test_static_strings_match_templates(self):
+        values = [
+            '', ' ', '\n', 'plain text', 'trailing newline\n',
+            'two trailing newlines\n\n', 'windows\r\nnewlines\r\n',
+            'unicode\u2028separator', '1', '1.5', '"quoted"', "'quoted'",
+            '[1, 2]', "{'a': 1}", 'True', 'none', '{ not jinja }',
+        ]
+        for value in values:
+            for native in (True, False):
+                template = get_template(value, {}, native=native)
+                expected = render_template(template, {})
+                self.assertEqual(
+                    get_rendered(value, {}, native=native), expected,
+                    msg=f'value={value!r}, native={native}'
+                )
+
+    def test_static_strings_are_counted(self):
+        render_counter.reset()
+        get_rendered('no jinja here', {})
+        get_rendered('some {{ "jinja" }} here', {})
+        get_rendered('{# a comment #}', {})
+        self.assertEqual(render_counter.static, 1)
+        self.assertEqual(render_counter.templated, 2)
+        self.assertEqual(render_counter.total, 3)
+
+    def test_bytecode_cache_persists_code(self):
+        source = '{% macro my_macro(a) %}{{ a }}{% endmacro %}'
+        macro_name = get_dbt_macro_name('my_macro')
+        env = get_environment()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = TemplateCodeCache()
+            cache.bytecode_cache = MacroBytecodeCache(tmpdir, '0.0.1')
+            template = cache.get_template(env, source, False, {}, cache_bytecode=True)
+            self.assertEqual(getattr(template.module, macro_name)('x'), 'x')
+            self.assertEqual(len(os.listdir(tmpdir)), 1)
+
+            # a new process would start with an empty in-memory cache
+            cache = TemplateCodeCache()
+            cache.bytecode_cache = MacroBytecodeCache(tmpdir, '0.0.1')
+            with mock.patch.object(env, 'compile') as patched:
+                template = cache.get_template(env, source, False, {}, cache_bytecode=True)
+                patched.assert_not_called()
+            self.assertEqual(getattr(template.module, macro_name)('y'), 'y')
+
+            # a different dbt version gets its own entry
+            cache = TemplateCodeCache()
+            cache.bytecode_cache = MacroBytecodeCache(tmpdir, '0.0.2')
+            cache.get_template(env, source, False, {}, cache_bytecode=True)
+            self.assertEqual(len(os.listdir(tmpdir)), 2)
+
+    def test_cached_templates_use_new_context(self):
+        s = '{{ a }}-{{ b | default("none") }}'
+        self.assertEqual(get_rendered(s, {'a': 1}), '1-none')
+        self.assertEqual(get_rendered(s, {'a': 2, 'b': 3}), '2-3')
+        self.assertEqual(get_rendered(s, {'a': 2, 'b': 3}, native=True), '2-3')
+        self.assertEqual(get_rendered('{{ a }}', {'a': 4}, native=True), 4)
+        self.assertEqual(get_rendered('{{ a }}', {'a': 4}), '4')
+
 
 class TestBlockLexer(unittest.TestCase):
     def test_basic(self):
@@ -164,6 +164,101 @@ class LinkerTest(unittest.TestCase):
         queue_2.mark_done('A')
         self.assert_would_join(queue_2)
 
+    def test_linker_scores_count_distinct_descendants(self):
+        # a diamond (A and B both depend on C and D, which depend on E) plus
+        # a chain hanging off of D
+        actual_deps = [
+            ('A', 'C'), ('A', 'D'), ('B', 'C'), ('B', 'D'), ('C', 'E'),
+            ('D', 'E'), ('F', 'D'), ('G', 'F'),
+        ]
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+
+        queue = self.linker.as_graph_queue(_mock_manifest('ABCDEFG'))
+        self.assertEqual(queue._scores, {
+            'A': 0, 'B': 0, 'C': -2, 'D': -4, 'E': -6, 'F': -1, 'G': 0,
+        })
+
+    def test_linker_scores_skip_non_blocking(self):
+        actual_deps = [('A', 'B'), ('B', 'C'), ('D', 'C')]
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+
+        self.is_blocking_dependency.side_effect = lambda n: n.unique_id != 'B'
+        queue = self.linker.as_graph_queue(_mock_manifest('ABCD'))
+        self.assertEqual(queue._scores, {'A': 0, 'B': -1, 'C': -2, 'D': 0})
+
+    def test_linker_build_subset_graph(self):
+        # A -> B -> C -> D, plus E -> C and F alone
+        actual_deps = [('B', 'A'), ('C', 'B'), ('D', 'C'), ('C', 'E')]
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+        self.linker.add_node('F')
+
+        graph = self.linker.build_subset_graph(['A', 'C', 'D', 'E', 'F'])
+        self.assertEqual(list(graph.nodes()), ['A', 'C', 'D', 'E', 'F'])
+        # B was removed, so A gets an explicit edge to C. A reaches D through
+        # the selected node C, so it does not need an edge of its own.
+        self.assertEqual(
+            set(graph.edges()),
+            {('A', 'C'), ('C', 'D'), ('E', 'C')},
+        )
+
+    def test_linker_copy(self):
+        self.linker.dependency('B', 'A')
+        copied = self.linker.copy()
+        copied.dependency('RPC', 'B')
+
+        self.assertEqual(list(self.linker.nodes()), ['B', 'A'])
+        self.assertEqual(set(copied.edges()), {('A', 'B'), ('B', 'RPC')})
+
+    def test_linker_sorted_ephemeral_ancestors(self):
+        # RPC -> C -> B -> A, where B and C are ephemeral
+        for (l, r) in [('B', 'A'), ('C', 'B'), ('RPC', 'C')]:
+            self.linker.dependency(l, r)
+
+        def expect(unique_id):
+            node = mock.MagicMock(unique_id=unique_id)
+            node.resource_type = linker.NodeType.Model
+            materialization = 'ephemeral' if unique_id in 'BC' else 'table'
+            node.get_materialization.return_value = materialization
+            return node
+
+        manifest = _mock_manifest('ABC')
+        manifest.expect.side_effect = expect
+        self.assertEqual(
+            list(self.linker.sorted_ephemeral_ancestors(manifest, 'RPC')),
+            ['B', 'C']
+        )
+        self.assertEqual(
+            list(self.linker.sorted_ephemeral_ancestors(manifest, 'B')),
+            []
+        )
+
+    def test_linker_queue_waits_for_all_parents(self):
+        # C depends on both A and B
+        actual_deps = [('C', 'A'), ('C', 'B')]
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+
+        queue = self.linker.as_graph_queue(_mock_manifest('ABC'))
+        first = queue.get(block=False)
+        second = queue.get(block=False)
+        self.assertEqual({first.unique_id, second.unique_id}, {'A', 'B'})
+        with self.assertRaises(Empty):
+            queue.get(block=False)
+
+        queue.mark_done(first.unique_id)
+        with self.assertRaises(Empty):
+            queue.get(block=False)
+
+        queue.mark_done(second.unique_id)
+        got = queue.get(block=False)
+        self.assertEqual(got.unique_id, 'C')
+        queue.mark_done('C')
+        self.assert_would_join(queue)
+        self.assertTrue(queue.empty())
+
     def test_linker_bad_limit_throws_runtime_error(self):
         actual_deps = [('A', 'B'), ('B', 'C'), ('C', 'D')]
 
@@ -188,3 +283,17 @@ class LinkerTest(unittest.TestCase):
             self.linker.dependency(l, r)
 
         self.assertIsNone(self.linker.find_cycles())
+
+    def test__find_cycle_through(self):
+        actual_deps = [('A', 'B'), ('B', 'C'), ('C', 'D')]
+
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+
+        self.assertIsNone(self.linker.find_cycle_through('B'))
+        # D now depends on B: relink it
+        self.linker.remove_dependencies('D')
+        self.linker.dependency('D', 'B')
+        self.assertEqual(
+            self.linker.find_cycle_through('D'), 'D --> C --> B --> D'
+        )
@@ -2,6 +2,10 @@ import unittest
 from unittest import mock
 
 import copy
+import json
+import os
+import shutil
+import tempfile
 from collections import namedtuple
 from itertools import product
 from datetime import datetime
@@ -10,7 +14,9 @@ import pytest
 
 import dbt.flags
 from dbt import tracking
-from dbt.contracts.graph.manifest import Manifest, ManifestMetadata
+from dbt.contracts.graph.manifest import (
+    Manifest, ManifestMetadata, MacroIndex
+)
 from dbt.contracts.graph.parsed import (
     ParsedModelNode,
     DependsOn,
@@ -224,6 +230,23 @@ class ManifestTest(unittest.TestCase):
             }
         )
 
+    @freezegun.freeze_time('2018-02-14T09:15:13Z')
+    def test__write(self):
+        nodes = copy.copy(self.nested_nodes)
+        sources = copy.copy(self.sources)
+        manifest = Manifest(nodes=nodes, sources=sources, macros={}, docs={},
+                            generated_at=datetime.utcnow(), disabled=[],
+                            files={})
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+        path = os.path.join(tempdir, 'manifest.json')
+        manifest.write(path)
+        with open(path) as fp:
+            written = fp.read()
+        expected = manifest.writable_manifest().to_dict(omit_none=False)
+        self.assertEqual(json.loads(written), expected)
+        self.assertEqual(written, json.dumps(expected))
+
     @freezegun.freeze_time('2018-02-14T09:15:13Z')
     def test__nested_nodes(self):
         nodes = copy.copy(self.nested_nodes)
@@ -306,6 +329,99 @@ class ManifestTest(unittest.TestCase):
         for node in flat_nodes.values():
             self.assertEqual(frozenset(node), REQUIRED_PARSED_NODE_KEYS)
 
+    def test__overlay(self):
+        nodes = copy.copy(self.nested_nodes)
+        manifest = Manifest(nodes=nodes, sources={}, macros={}, docs={},
+                            generated_at=datetime.utcnow(), disabled=[],
+                            files={})
+        events = nodes['model.root.events']
+        new_node = events.replace(
+            unique_id='rpc.root.query', name='query',
+            resource_type=NodeType.RPCCall,
+        )
+        replaced_events = events.replace(description='replaced')
+
+        overlay = manifest.overlay()
+        overlay.add_nodes({new_node.unique_id: new_node})
+        overlay.update_node(replaced_events)
+        overlay.update_macros({'macro.root.m': MockMacro('root', name='m')})
+
+        self.assertIs(overlay.nodes['rpc.root.query'], new_node)
+        self.assertIs(overlay.nodes['model.root.events'], replaced_events)
+        self.assertIs(
+            overlay.resolve_ref('events', None, 'root', 'root'),
+            replaced_events
+        )
+        self.assertEqual(list(overlay.nodes)[-1], 'rpc.root.query')
+        self.assertEqual(len(overlay.nodes), len(nodes) + 1)
+        self.assertIn('macro.root.m', overlay.macros)
+
+        self.assertEqual(set(manifest.nodes), set(self.nested_nodes))
+        self.assertIs(manifest.nodes['model.root.events'], events)
+        self.assertIs(
+            manifest.resolve_ref('events', None, 'root', 'root'), events
+        )
+        self.assertEqual(manifest.macros, {})
+
+    def test__overlay_macro_index(self):
+        macros = {
+            m.unique_id: m for m in [
+                MockMacro('root', name='m'),
+                MockMacro('dep', name='m'),
+                MockMacro('root', name='other'),
+            ]
+        }
+        manifest = Manifest.from_macros(macros=macros)
+        base_index = manifest.macro_index
+        other = base_index.candidates_for('other', 'root')
+        before = base_index.candidates_for('m', 'root')
+
+        overlay = manifest.overlay()
+        replaced = MockMacro('root', name='m')
+        added = MockMacro('rpc', name='m')
+        overlay.update_macros({replaced.unique_id: replaced})
+        overlay.update_macros({added.unique_id: added})
+
+        index = overlay.macro_index
+        self.assertIs(index.base, base_index)
+        # only the changed name is indexed again
+        self.assertEqual(list(index.storage), ['m'])
+        self.assertIs(index.candidates_for('other', 'root'), other)
+        self.assertEqual(
+            [c.macro for c in index.candidates_for('m', 'root')],
+            [macros['macro.dep.m'], added, replaced],
+        )
+        self.assertEqual(
+            list(index.macros()), list(MacroIndex.from_macros(
+                overlay.macros.values()
+            ).macros())
+        )
+        self.assertIs(overlay.find_macro_by_name('m', 'root', None), replaced)
+
+        self.assertIs(manifest.macro_index, base_index)
+        self.assertIs(base_index.candidates_for('m', 'root'), before)
+        self.assertIs(
+            manifest.find_macro_by_name('m', 'root', None),
+            macros['macro.root.m']
+        )
+
+    def test__build_flat_graph_lazily(self):
+        nodes = copy.copy(self.nested_nodes)
+        manifest = Manifest(nodes=nodes, sources={}, macros={}, docs={},
+                            generated_at=datetime.utcnow(), disabled=[],
+                            files={})
+        with mock.patch.object(ParsedModelNode, 'to_dict', autospec=True,
+                               side_effect=ParsedModelNode.to_dict) as to_dict:
+            manifest.build_flat_graph()
+            flat_nodes = manifest.flat_graph['nodes']
+            self.assertEqual(to_dict.call_count, 0)
+            self.assertEqual(set(flat_nodes), set(self.nested_nodes))
+
+            first = flat_nodes['model.root.events']
+            self.assertIs(flat_nodes['model.root.events'], first)
+            self.assertEqual(to_dict.call_count, 1)
+            self.assertEqual(first, nodes['model.root.events'].to_dict(omit_none=False))
+
     @mock.patch.object(tracking, 'active_user')
     def test_metadata(self, mock_user):
         mock_user.id = 'cfc9500f-dc7f-4c83-9ea7-2c581c1b38cf'
@@ -846,6 +962,17 @@ def test_find_macro_by_name(macros, expectations):
             assert result.package_name == expected
 
 
+def test_find_macro_by_name_after_update_macros():
+    manifest = make_manifest(macros=[MockMacro('dep'), MockMacro('dbt')])
+    result = manifest.find_macro_by_name(name='my_macro', root_project_name='root', package=None)
+    assert result.package_name == 'dep'
+
+    root_macro = MockMacro('root')
+    manifest.update_macros({root_macro.unique_id: root_macro})
+    result = manifest.find_macro_by_name(name='my_macro', root_project_name='root', package=None)
+    assert result is root_macro
+
+
 # these don't use a search package, so we don't need to do as much
 generate_name_parameter_sets = [
     # empty
@@ -1109,6 +1236,28 @@ def test_find_refable_by_name(nodes, sources, package, expected):
         assert result.package_name == expected_package
 
 
+def test_find_refable_by_name_after_add_nodes():
+    manifest = make_manifest(nodes=[MockNode('dep', 'my_model')])
+    assert manifest.find_refable_by_name('my_model', 'root') is None
+
+    node = MockNode('root', 'my_model')
+    manifest.add_nodes({node.unique_id: node})
+    assert manifest.find_refable_by_name('my_model', 'root') is node
+    # the first match still wins, as with a linear scan
+    assert manifest.find_refable_by_name('my_model', None).package_name == 'dep'
+
+
+def test_find_refable_by_name_after_update_node():
+    kwargs = {'original_file_path': 'models/my_model.sql'}
+    node = MockNode('root', 'my_model', kwargs=kwargs)
+    manifest = make_manifest(nodes=[node])
+    assert manifest.find_refable_by_name('my_model', None) is node
+
+    new_node = MockNode('root', 'my_model', kwargs=kwargs)
+    manifest.update_node(new_node)
+    assert manifest.find_refable_by_name('my_model', None) is new_node
+
+
 def _source_parameter_sets():
     sets = [
         # empties
@@ -1,10 +1,15 @@
+import os
+import shutil
+import tempfile
 import unittest
 from unittest import mock
 
 from .utils import config_from_parts_or_dicts, normalize
 
+from dbt.context.base import parse_dependencies
 from dbt.contracts.graph.manifest import FileHash, FilePath, SourceFile
 from dbt.parser import ParseResult
+from dbt.parser.partial import ParseCache, DependencyValues
 from dbt.parser.search import FileBlock
 from dbt.parser import manifest
 
@@ -63,6 +68,24 @@ class TestLoader(unittest.TestCase):
             self.root_project_config,
             {'root': self.root_project_config}
         )
+        self.tempdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.patched_result_builder.stop()
+        shutil.rmtree(self.tempdir)
+
+    def _cached(self, old_results):
+        path = os.path.join(self.tempdir, manifest.PARTIAL_PARSE_FILE_NAME)
+        ParseCache.write(path, old_results, self.loader.dependencies)
+        cache = ParseCache.read(path)
+        self.addCleanup(cache.close)
+        return cache
+
+    def _set_cli_vars(self, cli_vars):
+        self.root_project_config.cli_vars = cli_vars
+        self.loader.dependencies = DependencyValues(
+            self.root_project_config, {'root': self.root_project_config}
+        )
 
     def _new_results(self):
         return ParseResult(MatchingHash(), MatchingHash(), {})
@@ -96,6 +119,23 @@ class TestLoader(unittest.TestCase):
         # with a FileBlock that has the given source file in it
         self.parser.parse_file.assert_called_once_with(FileBlock(file=source_file))
 
+    def test_model_records_dependencies(self):
+        source_file = self._matching_file('models', 'model_1.sql')
+        self.parser.load_file.return_value = source_file
+
+        def parse_file(block):
+            parse_dependencies.add_var('some_var')
+            parse_dependencies.add_env_var('SOME_ENV_VAR')
+            parse_dependencies.add_var('some_var')
+
+        self.parser.parse_file.side_effect = parse_file
+        self.loader.parse_with_cache(source_file.path, self.parser, None)
+        self.assertEqual(source_file.vars, ['some_var'])
+        self.assertEqual(source_file.env_vars, ['SOME_ENV_VAR'])
+        # outside of parsing, nothing is recorded
+        parse_dependencies.add_var('other_var')
+        self.assertEqual(source_file.vars, ['some_var'])
+
     def test_model_cache_hit(self):
         source_file = self._matching_file('models', 'model_1.sql')
         self.parser.load_file.return_value = source_file
@@ -107,7 +147,7 @@ class TestLoader(unittest.TestCase):
         old_results.files[source_file_dupe.path.search_key] = source_file_dupe
         old_results.nodes = {'model.root.model_1': mock.MagicMock()}
 
-        self.loader.parse_with_cache(source_file.path, self.parser, old_results)
+        self.loader.parse_with_cache(source_file.path, self.parser, self._cached(old_results))
         # there was a cache hit, so parse_file should never have been called
         self.parser.parse_file.assert_not_called()
 
@@ -122,7 +162,7 @@ class TestLoader(unittest.TestCase):
         old_results.files[source_file_dupe.path.search_key] = source_file_dupe
         old_results.nodes = {'model.root.model_1': mock.MagicMock()}
 
-        self.loader.parse_with_cache(source_file.path, self.parser, old_results)
+        self.loader.parse_with_cache(source_file.path, self.parser, self._cached(old_results))
         # there was a cache checksum mismatch, so parse_file should get called
         # with a FileBlock that has the given source file in it
         self.parser.parse_file.assert_called_once_with(FileBlock(file=source_file))
@@ -138,7 +178,77 @@ class TestLoader(unittest.TestCase):
         old_results.files[source_file_different.path.search_key] = source_file_different
         old_results.nodes = {'model.root.model_2': mock.MagicMock()}
 
-        self.loader.parse_with_cache(source_file.path, self.parser, old_results)
+        self.loader.parse_with_cache(source_file.path, self.parser, self._cached(old_results))
         # the filename wasn't in the cache, so parse_file should get called
         # with a  FileBlock that has the given source file in it.
         self.parser.parse_file.assert_called_once_with(FileBlock(file=source_file))
+
+    def test_model_cache_reads_unchanged_files(self):
+        unchanged = self._matching_file('models', 'model_1.sql')
+        changed = self._mismatched_file('models', 'model_2.sql')
+        old_results = self._new_results()
+        for source_file in (unchanged, changed):
+            old_results.files[source_file.path.search_key] = source_file
+        cache = self._cached(old_results)
+
+        with mock.patch.object(cache, '_fp', wraps=cache._fp) as fp:
+            self.assertIsNone(
+                cache.get_file_result(changed, self.loader.dependencies)
+            )
+            fp.read.assert_not_called()
+
+            result = cache.get_file_result(
+                unchanged, self.loader.dependencies
+            )
+            self.assertIn(unchanged.path.search_key, result.files)
+            # only the unchanged file's results were read
+            entry = cache.entries[unchanged.path.search_key]
+            fp.read.assert_called_once_with(entry['length'])
+
+    def _cached_file_with_dependencies(self, vars=(), env_vars=()):
+        source_file = self._matching_file('models', 'model_1.sql')
+        self.parser.load_file.return_value = source_file
+
+        source_file_dupe = self._matching_file('models', 'model_1.sql')
+        source_file_dupe.nodes.append('model.root.model_1')
+        source_file_dupe.vars.extend(vars)
+        source_file_dupe.env_vars.extend(env_vars)
+
+        old_results = self._new_results()
+        old_results.files[source_file_dupe.path.search_key] = source_file_dupe
+        return source_file, self._cached(old_results)
+
+    def test_model_cache_other_var_changed(self):
+        self._set_cli_vars({'used': 1, 'unused': 1})
+        source_file, cache = self._cached_file_with_dependencies(vars=['used'])
+        self._set_cli_vars({'used': 1, 'unused': 2})
+
+        self.loader.results = self._new_results()
+        self.loader.parse_with_cache(source_file.path, self.parser, cache)
+        # the file never read the var that changed, so it is still cached,
+        # and it keeps its dependencies
+        self.parser.parse_file.assert_not_called()
+        self.assertEqual(source_file.vars, ['used'])
+
+    def test_model_cache_var_changed(self):
+        self._set_cli_vars({'used': 1})
+        source_file, cache = self._cached_file_with_dependencies(vars=['used'])
+        self._set_cli_vars({'used': 2})
+
+        self.loader.parse_with_cache(source_file.path, self.parser, cache)
+        self.parser.parse_file.assert_called_once_with(FileBlock(file=source_file))
+
+    def test_model_cache_env_var_changed(self):
+        with mock.patch.dict(os.environ, {'DBT_TEST_PARSE_ENV': 'a'}):
+            source_file, cache = self._cached_file_with_dependencies(
+                env_vars=['DBT_TEST_PARSE_ENV']
+            )
+            self.loader.parse_with_cache(source_file.path, self.parser, cache)
+            self.parser.parse_file.assert_not_called()
+
+        source_file, cache = self._cached_file_with_dependencies(
+            env_vars=['DBT_TEST_PARSE_ENV']
+        )
+        with mock.patch.dict(os.environ, {'DBT_TEST_PARSE_ENV': 'b'}):
+            self.loader.parse_with_cache(source_file.path, self.parser, cache)
+        self.parser.parse_file.assert_called_once_with(FileBlock(file=source_file))
@@ -2,7 +2,10 @@ import unittest
 from unittest import mock
 
 import os
+import shutil
+import tempfile
 import yaml
+from datetime import datetime
 
 import dbt.flags
 import dbt.parser
@@ -16,7 +19,11 @@ from dbt.parser.schemas import (
 )
 from dbt.parser.search import FileBlock
 from dbt.parser.schema_test_builders import YamlBlock
-from dbt.parser.manifest import process_docs, process_sources, process_refs
+from dbt.parser.manifest import (
+    process_docs, process_sources, process_refs, process_manifest,
+    reparse_node_files,
+)
+from dbt.parser.models import extract_static_calls, model_parse_counter
 
 from dbt.node_types import NodeType
 from dbt.contracts.graph.manifest import (
@@ -497,6 +504,94 @@ class ModelParserTest(BaseParserTest):
             self.parser.parse_file(block)
         self.assert_has_results_length(self.parser.results, files=0)
 
+    def test_extract_static_calls(self):
+        self.assertEqual(extract_static_calls('select 1 as id'), [])
+        self.assertEqual(
+            extract_static_calls(
+                '{{ config(materialized="table", tags=["a", "b"]) }}\n'
+                '{# a comment #}'
+                'select * from {{ ref("a") }} join {{ ref("pkg", "b") }}\n'
+                'join {{ source("src", "tbl") }} join {{ config({"x": 1}) }}'
+            ),
+            [
+                ('config', [], {'materialized': 'table', 'tags': ['a', 'b']}),
+                ('ref', ['a'], {}),
+                ('ref', ['pkg', 'b'], {}),
+                ('source', ['src', 'tbl'], {}),
+                ('config', [{'x': 1}], {}),
+            ]
+        )
+        for raw_sql in (
+            'select * from {{ ref(var("model")) }}',
+            'select * from {{ ref("a") | lower }}',
+            'select * from {{ ref("a").identifier }}',
+            'select * from {{ ref("a", version=1) }}',
+            'select * from {{ ref("a", "b", "c") }}',
+            'select * from {{ source("src") }}',
+            'select * from {{ this }}',
+            '{{ config(materialized=some_var) }}select 1 as id',
+            '{{ config("table") }}select 1 as id',
+            '{% if is_incremental() %}select 1 as id{% endif %}',
+            '{{ SYNTAX ERROR }}',
+        ):
+            self.assertIsNone(extract_static_calls(raw_sql), raw_sql)
+
+    def _parse_both_ways(self, raw_sql):
+        nodes = []
+        for static in (True, False):
+            parser = ModelParser(
+                results=ParseResult.rpc(),
+                project=self.snowplow_project_config,
+                root_project=self.root_project_config,
+                macro_manifest=self.macro_manifest,
+            )
+            parser._static_parse = static
+            block = self.file_block_for(raw_sql, 'nested/model_1.sql')
+            parser.parse_file(block)
+            nodes.append(list(parser.results.nodes.values())[0])
+        return nodes
+
+    def test_static_parse_matches_rendering(self):
+        for raw_sql in (
+            'select 1 as id',
+            '{{ config(materialized="table", tags=["a"], alias="other") }}'
+            'select * from {{ ref("a") }} join {{ ref("snowplow", "b") }}',
+            '{{ config({"pre_hook": "select 1", "enabled": true}) }}'
+            'select * from {{ source("src", "tbl") }}',
+            'select * from {{ ref("a") }} where x = {{ var("x", 1) }}',
+        ):
+            static, rendered = self._parse_both_ways(raw_sql)
+            self.assertEqual(static, rendered)
+
+    def test_static_parse_counts(self):
+        model_parse_counter.reset()
+        self._parse_both_ways('select * from {{ ref("a") }}')
+        self.assertEqual(model_parse_counter.static, 1)
+        self.assertEqual(model_parse_counter.templated, 1)
+        self._parse_both_ways('select * from {{ ref(var("a")) }}')
+        self.assertEqual(model_parse_counter.static, 1)
+        self.assertEqual(model_parse_counter.templated, 3)
+
+    def test_static_parse_disabled_by_macro_override(self):
+        macro = ParsedMacro(
+            name='ref',
+            resource_type=NodeType.Macro,
+            unique_id='macro.root.ref',
+            package_name='root',
+            original_file_path=normalize('macros/ref.sql'),
+            root_path=get_abs_os_path('./dbt_modules/root'),
+            path=normalize('macros/ref.sql'),
+            macro_sql='{% macro ref(name) %}{% endmacro %}',
+        )
+        self.macro_manifest.macros[macro.unique_id] = macro
+        parser = ModelParser(
+            results=ParseResult.rpc(),
+            project=self.snowplow_project_config,
+            root_project=self.root_project_config,
+            macro_manifest=self.macro_manifest,
+        )
+        self.assertFalse(parser._static_parse)
+
 
 class SnapshotParserTest(BaseParserTest):
     def setUp(self):
@@ -858,3 +953,94 @@ class ProcessingTest(BaseParserTest):
     def test_process_refs(self):
         process_refs(self.manifest, 'project')
         self.y_node.depends_on.nodes.append.assert_called_once_with('model.project.x')
+
+    def test_process_manifest(self):
+        process_manifest(self.manifest, self.root_project_config)
+        self.x_node.depends_on.nodes.append.assert_called_once_with('source.thirdproject.src.tbl')
+        self.y_node.depends_on.nodes.append.assert_called_once_with('model.project.x')
+        self.assertEqual(self.x_node.description, 'other_project: some docs')
+        self.assertEqual(self.y_node.description, 'some docs')
+
+
+class ReparseNodeFilesTest(BaseParserTest):
+    def setUp(self):
+        super().setUp()
+        self.project_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.project_root)
+        self.snowplow_project_config.project_root = self.project_root
+        os.makedirs(os.path.join(self.project_root, 'models'))
+        self.write('model_1.sql', 'select 1 as id')
+        self.write('model_2.sql', 'select * from {{ ref("model_1") }}')
+        self.write('model_3.sql', 'select 3 as id')
+
+        results = ParseResult.rpc()
+        parser = ModelParser(
+            results=results,
+            project=self.snowplow_project_config,
+            root_project=self.root_project_config,
+            macro_manifest=self.macro_manifest,
+        )
+        for name in ('model_1.sql', 'model_2.sql', 'model_3.sql'):
+            parser.parse_file(FileBlock(file=parser.load_file(
+                self.file_path(name)
+            )))
+        self.manifest = Manifest(
+            nodes=dict(results.nodes), sources={},
+            macros=self.macro_manifest.macros, docs={}, disabled=[],
+            files=dict(results.files), generated_at=datetime.utcnow(),
+        )
+        process_refs(self.manifest, 'root')
+
+    def file_path(self, name):
+        return FilePath(
+            searched_path='models',
+            relative_path=name,
+            project_root=self.project_root,
+        )
+
+    def write(self, name, contents):
+        with open(self.file_path(name).absolute_path, 'w') as fp:
+            fp.write(contents)
+
+    def reparse(self, *names):
+        return reparse_node_files(
+            self.root_project_config,
+            self.manifest,
+            [self.file_path(name).absolute_path for name in names],
+        )
+
+    def test_reparse(self):
+        old_nodes = dict(self.manifest.nodes)
+        old_files = dict(self.manifest.files)
+        self.write('model_2.sql', 'select * from {{ ref("model_3") }}')
+        new_manifest = self.reparse('model_2.sql')
+
+        path = self.file_path('model_2.sql').absolute_path
+        node = new_manifest.nodes['model.snowplow.model_2']
+        self.assertEqual(node.raw_sql, 'select * from {{ ref("model_3") }}')
+        self.assertEqual(node.depends_on.nodes, ['model.snowplow.model_3'])
+        self.assertIsNot(new_manifest.files[path], old_files[path])
+        # the other nodes are shared
+        self.assertIs(
+            new_manifest.nodes['model.snowplow.model_1'],
+            old_nodes['model.snowplow.model_1'],
+        )
+        # and the previous manifest is unchanged
+        self.assertEqual(self.manifest.nodes, old_nodes)
+        self.assertEqual(self.manifest.files, old_files)
+        old_node = self.manifest.nodes['model.snowplow.model_2']
+        self.assertEqual(old_node.depends_on.nodes, ['model.snowplow.model_1'])
+
+    def test_disabled_node(self):
+        # disabling a node changes what else is in the manifest
+        self.write('model_2.sql', '{{ config(enabled=false) }}select 2 as id')
+        self.assertIsNone(self.reparse('model_2.sql'))
+
+    def test_unknown_file(self):
+        self.write('model_4.sql', 'select 4 as id')
+        self.assertIsNone(self.reparse('model_4.sql'))
+
+    def test_parse_error(self):
+        self.write('model_1.sql', '{{ SYNTAX ERROR }}')
+        with self.assertRaises(CompilationException):
+            self.reparse('model_1.sql')
@@ -1,5 +1,7 @@
 import agate
 import decimal
+import shutil
+import tempfile
 import unittest
 from unittest import mock
 
@@ -7,6 +9,7 @@ import dbt.flags as flags
 from dbt.task.debug import DebugTask
 
 from dbt.adapters.base.query_headers import MacroQueryStringSetter
+from dbt.adapters.base.relation import SchemaSearchMap
 from dbt.adapters.postgres import PostgresAdapter
 from dbt.clients import agate_helper
 from dbt.exceptions import ValidationException, DbtConfigError
@@ -193,6 +196,60 @@ class TestPostgresAdapter(unittest.TestCase):
             connect_timeout=10,
             options="-c search_path=test\ test")
 
+    @mock.patch.object(flags, 'CONNECTION_POOL_SIZE', 1)
+    @mock.patch('dbt.adapters.postgres.connections.psycopg2')
+    def test_connection_pool(self, psycopg2):
+        psycopg2.connect.return_value.closed = 0
+        connection = self.adapter.acquire_connection('dummy')
+        handle = connection.handle
+        self.adapter.cleanup_connections()
+        handle.close.assert_not_called()
+
+        # another thread (or the next task) gets the open connection back
+        connection = self.adapter.acquire_connection('other')
+        self.assertIs(connection.handle, handle)
+        self.assertEqual(connection.name, 'other')
+        psycopg2.connect.assert_called_once()
+        self.assertEqual(self.adapter.connections.pool.stats.hits, 1)
+
+        # the server closed it while it was in the pool
+        self.adapter.cleanup_connections()
+        handle.closed = 1
+        connection = self.adapter.acquire_connection('dummy')
+        connection.handle
+        self.assertEqual(psycopg2.connect.call_count, 2)
+        self.assertEqual(self.adapter.connections.pool.stats.unhealthy, 1)
+
+    @mock.patch.object(flags, 'CONNECTION_POOL_SIZE', 1)
+    @mock.patch('dbt.adapters.postgres.connections.psycopg2')
+    def test_connection_pool_idle_timeout(self, psycopg2):
+        psycopg2.connect.return_value.closed = 0
+        connection = self.adapter.acquire_connection('dummy')
+        handle = connection.handle
+        self.adapter.cleanup_connections()
+        self.adapter.connections.pool.idle_timeout = -1
+
+        connection = self.adapter.acquire_connection('dummy')
+        handle.close.assert_called_once()
+        self.assertEqual(self.adapter.connections.pool.stats.expired, 1)
+        self.assertEqual(connection.state, 'init')
+
+    @mock.patch.object(flags, 'CONNECTION_POOL_SIZE', 1)
+    @mock.patch('dbt.adapters.postgres.connections.psycopg2')
+    def test_connection_pool_after_fork(self, psycopg2):
+        psycopg2.connect.return_value.closed = 0
+        connection = self.adapter.acquire_connection('dummy')
+        handle = connection.handle
+        self.adapter.cleanup_connections()
+
+        # a forked process must neither use nor close its parent's connection
+        with mock.patch('dbt.adapters.base.connections.os.getpid') as getpid:
+            getpid.return_value = -1
+            connection = self.adapter.acquire_connection('dummy')
+            self.assertEqual(connection.state, 'init')
+            self.adapter.connections.close_pool()
+        handle.close.assert_not_called()
+
     @mock.patch('dbt.adapters.postgres.connections.psycopg2')
     def test_set_zero_keepalive(self, psycopg2):
         self.config.credentials = self.config.credentials.replace(keepalives_idle=0)
@@ -235,6 +292,111 @@ class TestPostgresAdapter(unittest.TestCase):
         )
         self.assertEqual(exceptions, [])
 
+    def _mock_relations_cache_queries(self, mock_get_schemas, mock_execute, fingerprint):
+        schema_map = SchemaSearchMap()
+        for schema in ('foo', 'bar', 'baz'):
+            schema_map.add(self.adapter.Relation.create(
+                database='postgres', schema=schema, identifier='x'
+            ))
+        mock_get_schemas.return_value = schema_map
+
+        relations = agate.Table(
+            rows=[
+                ('postgres', 'table_a', 'foo', 'table'),
+                ('postgres', 'view_b', 'bar', 'view'),
+            ],
+            column_names=['database', 'name', 'schema', 'type'],
+        )
+        links = agate.Table(
+            rows=[('bar', 'view_b', 'foo', 'table_a')],
+            column_names=[
+                'dependent_schema', 'dependent_name',
+                'referenced_schema', 'referenced_name',
+            ],
+        )
+
+        def execute_macro(name, kwargs=None):
+            if name == 'list_relations_in_schemas_without_caching':
+                return relations
+            elif name == 'postgres_get_relations':
+                return links
+            elif name == 'relations_cache_fingerprint':
+                return agate.Table(
+                    rows=fingerprint,
+                    column_names=['schema', 'relations', 'digest'],
+                )
+            raise AssertionError(f'unexpected macro {name}')
+        mock_execute.side_effect = execute_macro
+
+    def assert_relations_cached(self, adapter):
+        self.assertEqual(
+            adapter.cache.schemas,
+            {('postgres', 'foo'), ('postgres', 'bar'), ('postgres', 'baz')}
+        )
+        self.assertEqual(
+            adapter.cache.dump_graph(),
+            {
+                'postgres.foo.table_a': ['postgres.bar.view_b'],
+                'postgres.bar.view_b': [],
+            }
+        )
+
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    @mock.patch.object(PostgresAdapter, '_get_cache_schemas')
+    def test_relations_cache_one_query(self, mock_get_schemas, mock_execute):
+        self._mock_relations_cache_queries(mock_get_schemas, mock_execute, [])
+
+        self.adapter.set_relations_cache(mock.MagicMock())
+        self.assertEqual(mock_execute.call_count, 2)
+        list_kwargs = mock_execute.call_args_list[0][1]['kwargs']
+        self.assertEqual(list_kwargs['schemas'], ['bar', 'baz', 'foo'])
+        self.assert_relations_cached(self.adapter)
+
+    @mock.patch.object(flags, 'RELATION_CACHE_TTL', 60)
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    @mock.patch.object(PostgresAdapter, '_get_cache_schemas')
+    def test_relations_cache_snapshot(self, mock_get_schemas, mock_execute):
+        self.config.target_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.config.target_path)
+        fingerprint = [('foo', 1, 'abc'), ('bar', 1, 'def')]
+        self._mock_relations_cache_queries(mock_get_schemas, mock_execute, fingerprint)
+        manifest = mock.MagicMock()
+
+        def macros_called():
+            called = [c[0][0] for c in mock_execute.call_args_list]
+            mock_execute.reset_mock()
+            return called
+
+        # there is no snapshot yet
+        self.adapter.set_relations_cache(manifest)
+        self.assertIn('list_relations_in_schemas_without_caching', macros_called())
+        self.adapter.write_relations_cache_snapshot(manifest)
+        self.assertEqual(macros_called(), ['relations_cache_fingerprint'])
+
+        # the next invocation only checks the fingerprint, and links the
+        # restored relations again
+        adapter = PostgresAdapter(self.config)
+        adapter.set_relations_cache(manifest)
+        self.assertEqual(
+            macros_called(),
+            ['relations_cache_fingerprint', 'postgres_get_relations']
+        )
+        self.assert_relations_cached(adapter)
+        adapter.write_relations_cache_snapshot(manifest)
+        macros_called()
+
+        # once the schemas change, the snapshot is not used
+        fingerprint[0] = ('foo', 2, 'xyz')
+        adapter = PostgresAdapter(self.config)
+        adapter.set_relations_cache(manifest)
+        self.assertIn('list_relations_in_schemas_without_caching', macros_called())
+        self.assert_relations_cached(adapter)
+
+        # and a snapshot is only used once
+        adapter = PostgresAdapter(self.config)
+        adapter.set_relations_cache(manifest)
+        self.assertIn('list_relations_in_schemas_without_caching', macros_called())
+
 
 class TestConnectingPostgresAdapter(unittest.TestCase):
     def setUp(self):
@@ -0,0 +1,102 @@
+import unittest
+from unittest import mock
+
+from dbt.compilation import link_manifest
+from dbt.exceptions import CompilationException
+from dbt.node_types import NodeType
+from dbt.task.rpc import sql_commands
+from dbt.task.rpc.sql_commands import RemoteCompileTask
+
+
+def _mock_node(unique_id, depends_on=()):
+    node = mock.MagicMock(
+        unique_id=unique_id,
+        depends_on_nodes=list(depends_on),
+        resource_type=NodeType.Model,
+    )
+    node.get_materialization.return_value = 'table'
+    return node
+
+
+class TestLinkedRPCNode(unittest.TestCase):
+    def setUp(self):
+        nodes = [
+            _mock_node('model.root.a'),
+            _mock_node('model.root.b', ['model.root.a']),
+        ]
+        self.manifest = mock.MagicMock(
+            nodes={n.unique_id: n for n in nodes}, sources={}
+        )
+        self.manifest.expect.side_effect = lambda n: self.manifest.nodes[n]
+        # requests work in an overlay of the shared manifest
+        self.manifest.overlay.return_value = self.manifest
+        self.config = mock.MagicMock()
+        self.linker = link_manifest(self.config, self.manifest)
+        self.edges = set(self.linker.graph.edges())
+
+        with mock.patch('dbt.task.base.register_adapter'):
+            self.task = RemoteCompileTask(
+                mock.MagicMock(), self.config, self.manifest
+            )
+        self.task.manifest_linker = self.linker
+        self.rpc_node = _mock_node('rpc.root.query', ['model.root.b'])
+
+    def assert_graph_unchanged(self):
+        self.assertEqual(
+            set(self.linker.graph.nodes()), {'model.root.a', 'model.root.b'}
+        )
+        self.assertEqual(set(self.linker.graph.edges()), self.edges)
+
+    def test_linked(self):
+        with self.task._linked_rpc_node(self.rpc_node) as linker:
+            self.assertIs(linker, self.linker)
+            self.assertIn(
+                ('model.root.b', 'rpc.root.query'), linker.graph.edges()
+            )
+        self.assert_graph_unchanged()
+
+    def test_error(self):
+        with self.assertRaises(ValueError):
+            with self.task._linked_rpc_node(self.rpc_node):
+                raise ValueError('bad')
+        self.assert_graph_unchanged()
+
+    def test_missing_dependency(self):
+        rpc_node = _mock_node('rpc.root.query', ['model.root.missing'])
+        with self.assertRaises(CompilationException):
+            with self.task._linked_rpc_node(rpc_node):
+                pass
+        self.assert_graph_unchanged()
+
+    @mock.patch.object(sql_commands, 'get_adapter')
+    @mock.patch.object(sql_commands, 'add_new_refs')
+    @mock.patch.object(sql_commands, 'RPCCallParser')
+    def test_request(self, mock_parser, mock_add_new_refs, mock_adapter):
+        mock_parser.return_value.parse_remote.return_value = self.rpc_node
+        self.task.args.macros = None
+        self.task.args.sql = 'c2VsZWN0IDE='  # select 1
+
+        self.assertIs(self.task._get_exec_node(), self.rpc_node)
+        self.assert_graph_unchanged()
+
+    @mock.patch.object(sql_commands, 'compile_node')
+    @mock.patch.object(sql_commands, 'get_adapter')
+    def test_compile_ancestors(self, mock_adapter, mock_compile_node):
+        ephemeral = _mock_node('model.root.eph', ['model.root.a'])
+        ephemeral.get_materialization.return_value = 'ephemeral'
+        self.manifest.nodes[ephemeral.unique_id] = ephemeral
+        self.linker.dependency('model.root.eph', 'model.root.a')
+        rpc_node = _mock_node('rpc.root.query', ['model.root.eph'])
+
+        with self.task._linked_rpc_node(rpc_node) as linker:
+            ancestors = list(linker.sorted_ephemeral_ancestors(
+                self.manifest, rpc_node.unique_id
+            ))
+        self.assertEqual(ancestors, ['model.root.eph'])
+        self.task._compile_ancestors(ancestors)
+        # the compiled node goes through update_node, so the name index
+        # finds it too
+        self.manifest.update_node.assert_called_once_with(
+            mock_compile_node.return_value
+        )
+        self.assertIs(self.manifest.nodes['model.root.eph'], ephemeral)
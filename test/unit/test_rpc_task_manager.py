@@ -0,0 +1,109 @@
+import unittest
+from unittest import mock
+
+from dbt.compilation import link_manifest
+from dbt.contracts.rpc import LastParse, ManifestStatus
+from dbt.exceptions import CompilationException
+from dbt.rpc import task_manager
+from dbt.rpc.task_manager import TaskManager
+
+
+def _mock_node(unique_id, depends_on=()):
+    return mock.MagicMock(
+        unique_id=unique_id, depends_on_nodes=list(depends_on)
+    )
+
+
+def _mock_manifest(nodes, files):
+    return mock.MagicMock(
+        nodes={n.unique_id: n for n in nodes}, sources={}, files=files
+    )
+
+
+class TestUpdateFiles(unittest.TestCase):
+    def setUp(self):
+        args = mock.MagicMock(single_threaded=True, worker_pool_size=0)
+        with mock.patch.object(TaskManager, 'reload_manifest'):
+            self.manager = TaskManager(args, mock.MagicMock(), {})
+        self.manager.last_parse = LastParse(state=ManifestStatus.Ready)
+
+        # a.sql defines model a, and model b depends on a
+        self.path = '/project/models/a.sql'
+        self.manifest = self._manifest([])
+        self.linker = link_manifest(self.manager.config, self.manifest)
+        self.manager.manifest = self.manifest
+        self.manager.linker = self.linker
+
+        patcher = mock.patch.object(self.manager, 'reload_manifest')
+        self.reload_manifest = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assert_reloaded(self):
+        self.reload_manifest.assert_called_once_with()
+        self.assertIs(self.manager.manifest, self.manifest)
+        self.assertIs(self.manager.linker, self.linker)
+
+    def _manifest(self, a_depends_on):
+        return _mock_manifest(
+            [_mock_node('model.root.a', a_depends_on),
+             _mock_node('model.root.b', ['model.root.a']),
+             _mock_node('model.root.c')],
+            {self.path: mock.MagicMock(nodes=['model.root.a'])},
+        )
+
+    def test_reparse_node_file(self):
+        new_manifest = self._manifest(['model.root.c'])
+        with mock.patch.object(
+            task_manager, 'reparse_node_files', return_value=new_manifest
+        ):
+            self.assertTrue(self.manager.update_files({self.path}))
+
+        self.reload_manifest.assert_not_called()
+        self.assertIs(self.manager.manifest, new_manifest)
+        self.assertEqual(
+            set(self.manager.linker.graph.edges()),
+            {('model.root.a', 'model.root.b'),
+             ('model.root.c', 'model.root.a')},
+        )
+        # the previous linker is left alone
+        self.assertEqual(
+            set(self.linker.graph.edges()),
+            {('model.root.a', 'model.root.b')},
+        )
+
+    def test_macro_file(self):
+        macro_path = '/project/macros/m.sql'
+        self.manifest.files[macro_path] = mock.MagicMock(
+            nodes=[], macros=['macro.root.m']
+        )
+        self.assertTrue(self.manager.update_files({macro_path}))
+        self.assert_reloaded()
+
+    def test_unknown_file(self):
+        self.assertTrue(self.manager.update_files({'/project/models/c.sql'}))
+        self.assert_reloaded()
+
+    def test_parse_error(self):
+        with mock.patch.object(
+            task_manager, 'reparse_node_files',
+            side_effect=CompilationException('bad')
+        ):
+            self.assertTrue(self.manager.update_files({self.path}))
+        self.assert_reloaded()
+
+    def test_cycle(self):
+        new_manifest = self._manifest(['model.root.b'])
+        with mock.patch.object(
+            task_manager, 'reparse_node_files', return_value=new_manifest
+        ):
+            self.assertTrue(self.manager.update_files({self.path}))
+        self.assert_reloaded()
+
+    def test_not_ready(self):
+        self.manager.last_parse = LastParse(state=ManifestStatus.Compiling)
+        with mock.patch.object(
+            task_manager, 'reparse_node_files'
+        ) as reparse:
+            self.manager.update_files({self.path})
+        reparse.assert_not_called()
+        self.reload_manifest.assert_called_once_with()
@@ -0,0 +1,77 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from dbt.rpc.watcher import ProjectFiles, _changed_paths
+
+
+class TestProjectFiles(unittest.TestCase):
+    def setUp(self):
+        self.project_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.project_root)
+        project = mock.MagicMock(
+            project_root=self.project_root,
+            all_source_paths=['models', 'macros'],
+            test_paths=['tests'],
+            docs_paths=['models'],
+        )
+        self.files = ProjectFiles([project])
+        os.makedirs(os.path.join(self.project_root, 'models', 'nested'))
+        self.write('dbt_project.yml', 'name: root')
+        self.write('models/a.sql', 'select 1 as id')
+        self.write('models/nested/b.sql', 'select 2 as id')
+
+    def path(self, relative_path):
+        return os.path.join(self.project_root, relative_path)
+
+    def write(self, relative_path, contents):
+        with open(self.path(relative_path), 'w') as fp:
+            fp.write(contents)
+
+    def test_directories(self):
+        self.assertEqual(self.files.directories, [
+            self.path('macros'), self.path('models'), self.path('tests'),
+        ])
+        self.assertEqual(self.files.project_files, {
+            self.path('dbt_project.yml'), self.path('packages.yml'),
+        })
+
+    def test_snapshot(self):
+        self.write('models/.a.sql.swp', '')
+        self.write('models/notes.txt', '')
+        self.write('other.sql', '')
+        self.assertEqual(set(self.files.snapshot()), {
+            self.path('dbt_project.yml'),
+            self.path('models/a.sql'),
+            self.path('models/nested/b.sql'),
+        })
+
+    def test_added(self):
+        old = self.files.snapshot()
+        self.write('models/c.sql', 'select 3 as id')
+        self.assertEqual(
+            _changed_paths(old, self.files.snapshot()),
+            {self.path('models/c.sql')}
+        )
+
+    def test_modified(self):
+        old = self.files.snapshot()
+        self.write('models/a.sql', 'select 10 as id')
+        self.assertEqual(
+            _changed_paths(old, self.files.snapshot()),
+            {self.path('models/a.sql')}
+        )
+
+    def test_deleted(self):
+        old = self.files.snapshot()
+        os.remove(self.path('models/nested/b.sql'))
+        self.assertEqual(
+            _changed_paths(old, self.files.snapshot()),
+            {self.path('models/nested/b.sql')}
+        )
+
+    def test_unchanged(self):
+        old = self.files.snapshot()
+        self.assertEqual(_changed_paths(old, self.files.snapshot()), set())
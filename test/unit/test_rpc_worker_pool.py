@@ -0,0 +1,180 @@
+import io
+import pickle
+import threading
+import unittest
+from unittest import mock
+
+from dbt.rpc import worker_pool
+from dbt.rpc.worker_pool import (
+    PooledProcess, TaskPickler, TaskUnpickler, WorkerPool,
+)
+
+
+class FakeTask:
+    def __init__(self, manifest, linker, name):
+        self.manifest = manifest
+        self.linker = linker
+        self.name = name
+        # a second reference to the manifest, like a compiler would hold
+        self.other_manifest = manifest
+
+
+def _pickle_task(task, shared):
+    buf = io.BytesIO()
+    TaskPickler(buf, shared).dump(task)
+    return buf.getvalue()
+
+
+def _mock_worker(generation=0, tasks_run=1, idle=True):
+    worker = mock.MagicMock(generation=generation, tasks_run=tasks_run)
+    worker.is_idle.return_value = idle
+    return worker
+
+
+class TestTaskPickling(unittest.TestCase):
+    def setUp(self):
+        self.manifest = mock.MagicMock()
+        self.linker = mock.MagicMock()
+        self.shared = {
+            id(self.manifest): worker_pool.MANIFEST_ID,
+            id(self.linker): worker_pool.LINKER_ID,
+        }
+
+    def test_shared_objects_not_pickled(self):
+        payload = _pickle_task(
+            FakeTask(self.manifest, self.linker, 'a'), self.shared
+        )
+        # only persistent ids were written for the manifest and linker
+        with self.assertRaises(pickle.UnpicklingError):
+            pickle.loads(payload)
+
+    def test_unpickled_task_gets_overlay_and_copy(self):
+        payload = _pickle_task(
+            FakeTask(self.manifest, self.linker, 'a'), self.shared
+        )
+        worker_manifest = mock.MagicMock()
+        worker_linker = mock.MagicMock()
+        task = TaskUnpickler(
+            io.BytesIO(payload), worker_manifest, worker_linker
+        ).load()
+
+        self.assertEqual(task.name, 'a')
+        self.assertIs(task.manifest, worker_manifest.overlay.return_value)
+        self.assertIs(task.other_manifest, task.manifest)
+        self.assertIs(task.linker, worker_linker.copy.return_value)
+        worker_manifest.overlay.assert_called_once_with()
+        worker_linker.copy.assert_called_once_with()
+
+    def test_unknown_persistent_id(self):
+        payload = _pickle_task(
+            FakeTask(self.manifest, self.linker, 'a'), self.shared
+        )
+        unpickler = TaskUnpickler(io.BytesIO(payload), mock.MagicMock(), None)
+        with self.assertRaises(pickle.UnpicklingError):
+            unpickler.load()
+
+
+class TestWorkerPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = WorkerPool(size=2, max_tasks=3)
+        self.pool._manifest = mock.MagicMock()
+        patcher = mock.patch.object(self.pool, '_replace')
+        self.replace = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_release_reuses_worker(self):
+        worker = _mock_worker()
+        self.pool.release(worker)
+        self.assertEqual(self.pool._idle, [worker])
+        self.replace.assert_not_called()
+
+    def test_release_old_generation(self):
+        worker = _mock_worker(generation=-1)
+        self.pool.release(worker)
+        self.assertEqual(self.pool._idle, [])
+        self.replace.assert_called_once_with(worker)
+
+    def test_release_max_tasks(self):
+        worker = _mock_worker(tasks_run=3)
+        self.pool.release(worker)
+        self.assertEqual(self.pool._idle, [])
+        self.replace.assert_called_once_with(worker)
+
+    def test_release_dead_worker(self):
+        worker = _mock_worker(idle=False)
+        self.pool.release(worker)
+        self.assertEqual(self.pool._idle, [])
+        self.replace.assert_called_once_with(worker)
+
+    def test_acquire_no_idle_workers(self):
+        self.assertIsNone(self.pool.acquire(FakeTask(None, None, 'a')))
+
+    def test_acquire_replaces_dead_workers(self):
+        dead = _mock_worker(idle=False)
+        self.pool._idle = [dead]
+        self.assertIsNone(self.pool.acquire(FakeTask(None, None, 'a')))
+        self.replace.assert_called_once_with(dead)
+
+    def test_acquire(self):
+        worker = _mock_worker()
+        self.pool._idle = [worker]
+        task = FakeTask(self.pool._manifest, None, 'a')
+        process = self.pool.acquire(task)
+
+        self.assertIsInstance(process, PooledProcess)
+        self.assertIs(process.worker, worker)
+        self.assertEqual(self.pool._idle, [])
+        unpickled = TaskUnpickler(
+            io.BytesIO(process.payload), mock.MagicMock(), None
+        ).load()
+        self.assertEqual(unpickled.name, 'a')
+
+    def test_acquire_unpicklable_task(self):
+        worker = _mock_worker()
+        self.pool._idle = [worker]
+        task = FakeTask(self.pool._manifest, None, threading.Lock())
+
+        self.assertIsNone(self.pool.acquire(task))
+        # the worker goes back to the pool
+        self.assertEqual(self.pool._idle, [worker])
+        self.replace.assert_not_called()
+
+
+class TestPooledProcess(unittest.TestCase):
+    def setUp(self):
+        self.pool = mock.MagicMock()
+        self.worker = _mock_worker()
+        self.process = self.worker.process
+        self.pooled = PooledProcess(self.pool, self.worker, b'payload')
+
+    def test_start(self):
+        self.assertFalse(self.pooled.is_alive())
+        self.pooled.start()
+        self.worker.send.assert_called_once_with(b'payload')
+
+    def test_running(self):
+        self.pooled.start()
+        self.process.idle.is_set.return_value = False
+        self.process.is_alive.return_value = True
+        self.assertTrue(self.pooled.is_alive())
+
+    def test_dead_worker(self):
+        self.pooled.start()
+        self.process.idle.is_set.return_value = False
+        self.process.idle.wait.return_value = False
+        self.process.is_alive.return_value = False
+
+        self.assertFalse(self.pooled.is_alive())
+        self.pooled.join()
+        self.pool.release.assert_called_once_with(self.worker)
+        # the worker is only released once
+        self.pooled.join()
+        self.pool.release.assert_called_once_with(self.worker)
+        self.assertFalse(self.pooled.is_alive())
+
+    def test_join_finished_task(self):
+        self.pooled.start()
+        self.process.idle.wait.return_value = True
+        self.pooled.join()
+        self.pool.release.assert_called_once_with(self.worker)
+        self.process.is_alive.assert_not_called()
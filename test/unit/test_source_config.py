@@ -3,7 +3,10 @@ from unittest import TestCase, mock
 
 from dbt.adapters import postgres  # we want this available!
 import dbt.flags
-from dbt.context.context_config import LegacyContextConfig
+from dbt.context.context_config import (
+    LegacyContextConfig, ConfigTrie, ContextConfigGenerator
+)
+from dbt.contracts.graph.model_config import NodeConfig
 from dbt.legacy_config_updater import ConfigUpdater
 from dbt.node_types import NodeType
 
@@ -175,3 +178,58 @@ class LegacyContextConfigTest(TestCase):
             cfg.updater.get_project_config(model, self.root_project_config)
 
         self.assertIn('must be a dict', str(exc.exception))
+
+
+class ConfigTrieTest(TestCase):
+    def setUp(self):
+        self.trie = ConfigTrie({
+            '+tags': ['a'],
+            'enabled': True,
+            'root': {
+                'materialized': 'table',
+                'staging': {
+                    '+tags': ['b'],
+                    '+vars': {'x': 1},
+                },
+            },
+        })
+
+    def test_search(self):
+        configs = list(self.trie.level_configs(['root', 'staging', 'm']))
+        self.assertEqual(configs, [
+            {'tags': ['a'], 'enabled': True},
+            {'materialized': 'table'},
+            {'tags': ['b'], 'vars': {'x': 1}},
+        ])
+        configs = list(self.trie.level_configs(['root', 'marts', 'm']))
+        self.assertEqual(len(configs), 2)
+
+    def test_level_configs_are_copies(self):
+        config = next(self.trie.level_configs(['root']))
+        config['tags'].append('c')
+        self.assertEqual(self.trie.config['tags'], ['a'])
+
+    def test_merged_project_config(self):
+        project = mock.MagicMock(project_name='root', models={
+            '+tags': ['a'],
+            'root': {'staging': {'+tags': ['b'], '+materialized': 'table'}},
+        })
+        active_project = mock.MagicMock(project_name='root')
+        active_project.credentials.type = 'postgres'
+        generator = ContextConfigGenerator(active_project)
+
+        result = generator.merged_project_config(
+            project, ['root', 'staging', 'm'], NodeType.Model, NodeConfig
+        )
+        self.assertEqual(result.tags, ['a', 'b'])
+        self.assertEqual(result.materialized, 'table')
+        # the merged config is cached at each level of the fqn
+        other = generator.merged_project_config(
+            project, ['root', 'staging', 'other'], NodeType.Model, NodeConfig
+        )
+        self.assertIs(other, result)
+        top = generator.merged_project_config(
+            project, ['root', 'm'], NodeType.Model, NodeConfig
+        )
+        self.assertEqual(top.tags, ['a'])
+        self.assertEqual(top.materialized, 'view')